@@ -9,6 +9,7 @@ import warnings
 from typing import Union, List, Dict, Tuple, Optional, Any
 from datetime import datetime, timedelta
 import json
+from functools import lru_cache
 
 import numpy as np
 import pandas as pd
@@ -22,23 +23,102 @@ import cartopy.feature as cfeature
 from scipy import stats, signal
 import netCDF4 as nc4
 
+try:
+    import dask
+    _HAS_DASK = True
+except ImportError:
+    _HAS_DASK = False
+
+try:
+    import bottleneck as bn
+    _HAS_BOTTLENECK = True
+except ImportError:
+    _HAS_BOTTLENECK = False
+
+try:
+    import numexpr as ne
+    _HAS_NUMEXPR = True
+except ImportError:
+    _HAS_NUMEXPR = False
+
+try:
+    import zarr  # noqa: F401
+    _HAS_ZARR = True
+except ImportError:
+    _HAS_ZARR = False
+
+# DataFrame.to_parquet 엔진 (pyarrow 또는 fastparquet)
+try:
+    import pyarrow  # noqa: F401
+    _HAS_PARQUET = True
+except ImportError:
+    try:
+        import fastparquet  # noqa: F401
+        _HAS_PARQUET = True
+    except ImportError:
+        _HAS_PARQUET = False
+
+
+class ExportFormatWarning(UserWarning):
+    """export_to_csv가 요청과 다른 형식/경로로 저장할 때 발생하는 경고"""
+
+
 warnings.filterwarnings('ignore')
+# 저장 형식 변경은 전역 무시 설정과 관계없이 항상 알림
+warnings.filterwarnings('default', category=ExportFormatWarning)
+
+# 진행 메시지 출력 여부 (배치 처리 시 COPERNICUS_VERBOSE=0으로 끔)
+_VERBOSE = os.environ.get('COPERNICUS_VERBOSE', '1') == '1'
+
+
+def _log(*args: Any) -> None:
+    """
+    _VERBOSE일 때만 진행 메시지 출력
+
+    크기/목록 등 계산이 필요한 메시지는 호출하는 쪽에서 if _VERBOSE:로 감싸
+    출력하지 않을 때 문자열을 만들지 않도록 한다.
+    """
+    if _VERBOSE:
+        print(*args)
+
+
+def _disk_chunks(ds: xr.Dataset, default: Optional[Dict] = None) -> Dict:
+    """
+    파일에 저장된 청크 크기(encoding['chunksizes'])를 차원별 Dask 청킹 설정으로 변환
+
+    청크 정보가 없는 파일은 default (기본값 {'time': 200})를 사용
+    """
+    chunks = {}
+    for var in ds.variables.values():
+        chunksizes = var.encoding.get('chunksizes')
+        if not chunksizes:
+            continue
+        for dim, size in zip(var.dims, chunksizes):
+            chunks.setdefault(dim, size)
+
+    if not chunks:
+        default = {'time': 200} if default is None else default
+        chunks = {dim: size for dim, size in default.items() if dim in ds.dims}
+
+    return chunks
 
 
 def load_dataset(
-    filepath: str,
+    filepath: Union[str, List[str]],
     engine: str = 'netcdf4',
     decode_times: bool = True,
-    chunks: Optional[Dict] = None
+    chunks: Optional[Dict] = None,
+    dtype: Optional[str] = None
 ) -> xr.Dataset:
     """
     NetCDF 데이터셋 로딩
     
     Parameters:
-        filepath: NetCDF 파일 경로
+        filepath: NetCDF 파일 경로 (리스트이면 open_mfdataset으로 여러 파일 결합)
         engine: xarray 엔진 ('netcdf4', 'h5netcdf', 'scipy')
         decode_times: 시간 디코딩 여부
-        chunks: Dask 청킹 설정 (대용량 데이터용)
+        chunks: Dask 청킹 설정 (None이면 파일의 청크 크기를 따름, Dask 설치 시)
+        dtype: 실수형 변수를 변환할 타입 (예: 'float32'로 메모리/대역폭 절반, None이면 유지)
         
     Returns:
         xarray Dataset 객체
@@ -46,23 +126,53 @@ def load_dataset(
     Example:
         >>> ds = load_dataset('data.nc')
         >>> ds = load_dataset('large_data.nc', chunks={'time': 100, 'lat': 50, 'lon': 50})
+        >>> ds = load_dataset(['sst_2020.nc', 'sst_2021.nc'])
+        >>> ds = load_dataset('data.nc', dtype='float32')
     """
-    if not os.path.exists(filepath):
-        raise FileNotFoundError(f"파일을 찾을 수 없습니다: {filepath}")
+    filepaths = [filepath] if isinstance(filepath, (str, os.PathLike)) else list(filepath)
+    for path in filepaths:
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"파일을 찾을 수 없습니다: {path}")
         
     try:
-        ds = xr.open_dataset(
-            filepath,
-            engine=engine,
-            decode_times=decode_times,
-            chunks=chunks
-        )
+        if not isinstance(filepath, (str, os.PathLike)):
+            # 여러 파일은 지연 로딩으로 결합
+            ds = xr.open_mfdataset(
+                filepaths,
+                engine=engine,
+                decode_times=decode_times,
+                chunks=chunks if chunks is not None else {},
+                combine='by_coords'
+            )
+        else:
+            ds = xr.open_dataset(
+                filepath,
+                engine=engine,
+                decode_times=decode_times,
+                chunks=chunks
+            )
+
+            # 파일의 청크 크기에 맞춰 Dask 청킹 (이후 subset이 청크 단위 지연 읽기가 됨)
+            if chunks is None and _HAS_DASK:
+                disk_chunks = _disk_chunks(ds)
+                if disk_chunks:
+                    ds = ds.chunk(disk_chunks)
+        
+        # 실수형 변수 정밀도 변환 (정수형 플래그/마스크 변수는 유지)
+        if dtype is not None:
+            ds = ds.assign({
+                v: da.astype(dtype, copy=False)
+                for v, da in ds.data_vars.items() if np.issubdtype(da.dtype, np.floating)
+            })
         
         # 기본 정보 출력
-        print(f"데이터셋 로드 완료: {filepath}")
-        print(f"차원: {list(ds.dims.keys())}")
-        print(f"변수: {list(ds.data_vars.keys())}")
-        print(f"시간 범위: {ds.time.min().values} ~ {ds.time.max().values}" if 'time' in ds else "")
+        _log(f"데이터셋 로드 완료: {filepath}")
+        if _VERBOSE:
+            _log(f"차원: {dict(ds.sizes)}")
+            _log(f"변수: {list(ds.data_vars)}")
+            if 'time' in ds.indexes:
+                time_index = ds.indexes['time']
+                _log(f"시간 범위: {time_index.min()} ~ {time_index.max()}")
         
         return ds
         
@@ -70,6 +180,46 @@ def load_dataset(
         raise RuntimeError(f"데이터셋 로딩 실패: {str(e)}")
 
 
+_LON_NAMES = ('longitude', 'lon', 'x')
+_LAT_NAMES = ('latitude', 'lat', 'y')
+_TIME_NAMES = ('time', 't', 'date')
+_KNOWN_DIMS = frozenset(_LON_NAMES + _LAT_NAMES + _TIME_NAMES)
+
+
+@lru_cache(maxsize=128)
+def _resolve_dims(dims: Tuple[str, ...]) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """
+    차원 이름 튜플에서 (경도, 위도, 시간) 차원 이름 찾기 (차원 구성별로 캐시)
+
+    후보가 여러 개면 _LON_NAMES 등의 순서대로 우선한다.
+    """
+    present = _KNOWN_DIMS.intersection(dims)
+    return tuple(
+        next((name for name in names if name in present), None)
+        for names in (_LON_NAMES, _LAT_NAMES, _TIME_NAMES)
+    )
+
+
+def _match_lon_convention(
+    ds: xr.Dataset,
+    lon_dim: str,
+    lon_range: Tuple[float, float]
+) -> Tuple[float, float]:
+    """
+    데이터 경도가 0-360 범위이면 음수 경도 범위를 0-360으로 변환
+
+    정렬된 인덱스는 끝값이 최댓값이므로 전체 리덕션을 생략한다.
+    """
+    lon_index = ds.indexes.get(lon_dim)
+    if lon_index is not None and lon_index.is_monotonic_increasing:
+        lon_max = lon_index[-1]
+    else:
+        lon_max = np.nanmax(ds[lon_dim].values)
+    if lon_max > 180:
+        lon_range = tuple(lon if lon >= 0 else lon + 360 for lon in lon_range)
+    return lon_range
+
+
 def subset_region(
     ds: xr.Dataset,
     lon_range: Tuple[float, float],
@@ -94,22 +244,12 @@ def subset_region(
         >>> ds_subset = subset_region(ds, (120, 135), (30, 45))  # 동해 지역
     """
     # 차원 이름 확인 및 자동 매칭
-    possible_lon = ['longitude', 'lon', 'x']
-    possible_lat = ['latitude', 'lat', 'y']
-    
-    for dim in possible_lon:
-        if dim in ds.dims:
-            lon_dim = dim
-            break
-            
-    for dim in possible_lat:
-        if dim in ds.dims:
-            lat_dim = dim
-            break
+    found_lon, found_lat, _ = _resolve_dims(tuple(ds.dims))
+    lon_dim = found_lon or lon_dim
+    lat_dim = found_lat or lat_dim
     
     # 경도가 0-360 범위인 경우 처리
-    if ds[lon_dim].max() > 180:
-        lon_range = tuple(lon if lon >= 0 else lon + 360 for lon in lon_range)
+    lon_range = _match_lon_convention(ds, lon_dim, lon_range)
     
     # 지역 추출
     ds_subset = ds.sel(
@@ -119,8 +259,9 @@ def subset_region(
         }
     )
     
-    print(f"지역 추출 완료: 경도 {lon_range}, 위도 {lat_range}")
-    print(f"추출된 크기: {dict(ds_subset.dims)}")
+    if _VERBOSE:
+        _log(f"지역 추출 완료: 경도 {lon_range}, 위도 {lat_range}")
+        _log(f"추출된 크기: {dict(ds_subset.sizes)}")
     
     return ds_subset
 
@@ -154,22 +295,125 @@ def subset_time(
     
     # 시간 차원 확인
     if time_dim not in ds.dims:
-        for dim in ['time', 't', 'date']:
-            if dim in ds.dims:
-                time_dim = dim
-                break
-        else:
-            raise ValueError(f"시간 차원을 찾을 수 없습니다. 사용 가능한 차원: {list(ds.dims.keys())}")
+        time_dim = _resolve_dims(tuple(ds.dims))[2]
+        if time_dim is None:
+            raise ValueError(f"시간 차원을 찾을 수 없습니다. 사용 가능한 차원: {list(ds.dims)}")
     
     # 시간 추출
     ds_subset = ds.sel({time_dim: slice(start_date, end_date)})
     
-    print(f"시간 추출 완료: {start_date} ~ {end_date}")
-    print(f"추출된 시간 스텝: {len(ds_subset[time_dim])}")
-    
+    if _VERBOSE:
+        _log(f"시간 추출 완료: {start_date} ~ {end_date}")
+        _log(f"추출된 시간 스텝: {len(ds_subset[time_dim])}")
+
     return ds_subset
 
 
+def _label_slice(values: np.ndarray, start: Any, stop: Any) -> Optional[slice]:
+    """
+    1D 좌표값에서 sel(slice(start, stop))과 동일한 정수 slice 계산
+
+    단조 증가/감소 좌표만 지원하며, 그 외에는 None 반환
+    """
+    n = len(values)
+    if n < 2 or values[-1] >= values[0]:
+        if n >= 2 and np.any(values[1:] < values[:-1]):
+            return None
+        lo = 0 if start is None else int(np.searchsorted(values, start, side='left'))
+        hi = n if stop is None else int(np.searchsorted(values, stop, side='right'))
+    else:
+        reversed_values = values[::-1]
+        if np.any(reversed_values[1:] < reversed_values[:-1]):
+            return None
+        lo = 0 if start is None else n - int(np.searchsorted(reversed_values, start, side='right'))
+        hi = n if stop is None else n - int(np.searchsorted(reversed_values, stop, side='left'))
+    return slice(lo, max(lo, hi))
+
+
+def subset(
+    ds: xr.Dataset,
+    lon_range: Optional[Tuple[float, float]] = None,
+    lat_range: Optional[Tuple[float, float]] = None,
+    start_date: Optional[Union[str, datetime]] = None,
+    end_date: Optional[Union[str, datetime]] = None
+) -> xr.Dataset:
+    """
+    지역/시간 동시 추출 (단일 isel 호출)
+
+    좌표 배열에 searchsorted로 정수 slice를 구한 뒤 한 번의 isel로 추출하여
+    subset_region + subset_time을 연달아 호출할 때의 반복 sel 비용을 줄인다.
+
+    Parameters:
+        ds: xarray Dataset
+        lon_range: 경도 범위 (min, max), None이면 전체
+        lat_range: 위도 범위 (min, max), None이면 전체
+        start_date: 시작 날짜, None이면 처음부터
+        end_date: 종료 날짜, None이면 끝까지
+
+    Returns:
+        추출된 Dataset
+
+    Example:
+        >>> ds_subset = subset(ds, (120, 135), (30, 45), '2020-01-01', '2020-12-31')
+    """
+    indexers = {}
+    labels = {}
+
+    # 경도/위도 차원 확인
+    lon_dim, lat_dim, time_dim = _resolve_dims(tuple(ds.dims))
+
+    if lon_range is not None and lon_dim is not None:
+        # 경도가 0-360 범위인 경우 처리
+        labels[lon_dim] = _match_lon_convention(ds, lon_dim, lon_range)
+
+    if lat_range is not None and lat_dim is not None:
+        labels[lat_dim] = lat_range
+
+    if start_date is not None or end_date is not None:
+        if time_dim is None:
+            raise ValueError(f"시간 차원을 찾을 수 없습니다. 사용 가능한 차원: {list(ds.dims)}")
+        start = None if start_date is None else np.datetime64(pd.to_datetime(start_date))
+        end = None if end_date is None else np.datetime64(pd.to_datetime(end_date))
+        labels[time_dim] = (start, end)
+
+    # 좌표값 → 정수 slice 변환
+    fallback = {}
+    for dim, (start, stop) in labels.items():
+        index_slice = _label_slice(ds[dim].values, start, stop)
+        if index_slice is None:
+            fallback[dim] = slice(start, stop)
+        else:
+            indexers[dim] = index_slice
+
+    ds_subset = ds.isel(indexers) if indexers else ds
+    if fallback:
+        # 단조 좌표가 아닌 경우 sel로 처리
+        ds_subset = ds_subset.sel(fallback)
+
+    if _VERBOSE:
+        _log(f"추출 완료: {dict(ds_subset.sizes)}")
+
+    return ds_subset
+
+
+def _area_weighted_mean(values: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """
+    마지막 두 축 (lat, lon)에 대한 위도 가중 평균 (NaN 제외)
+
+    가중치 배열을 (..., lat, lon)으로 broadcast하지 않고 einsum으로 바로 축소
+    """
+    valid = ~np.isnan(values)
+    filled = np.where(valid, values, 0)
+    weights = weights.astype(np.float64)
+
+    # float32 입력도 읽기만 float32로 하고 누적은 float64로
+    numerator = np.einsum('...yx,y->...', filled, weights, dtype=np.float64)
+    denominator = np.einsum('...yx,y->...', valid, weights, dtype=np.float64)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return numerator / denominator
+
+
 def calculate_spatial_mean(
     ds: xr.Dataset,
     var_name: str,
@@ -197,45 +441,69 @@ def calculate_spatial_mean(
     data = ds[var_name]
     
     if weighted:
-        # 위도 가중치 계산
-        weights = np.cos(np.deg2rad(ds[lat_dim]))
-        weights = weights / weights.sum()
+        # 위도 가중치 계산 (cos(lat))
+        weights = xr.DataArray(
+            np.cos(np.deg2rad(ds[lat_dim].values)),
+            dims=[lat_dim]
+        )
         
-        # 가중 평균 계산
-        weighted_data = data.weighted(weights)
-        mean_data = weighted_data.mean(dim=[lat_dim, 'longitude'], skipna=True)
+        # 가중 평균 계산 (broadcast 없이 einsum으로 축소, Dask 배열은 청크 단위로 처리)
+        mean_data = xr.apply_ufunc(
+            _area_weighted_mean,
+            data,
+            weights,
+            input_core_dims=[[lat_dim, 'longitude'], [lat_dim]],
+            dask='parallelized',
+            output_dtypes=[np.float64],
+            dask_gufunc_kwargs={'allow_rechunk': True}
+        )
+        mean_data.name = data.name
     else:
         # 단순 평균
         mean_data = data.mean(dim=['latitude', 'longitude'], skipna=True)
     
-    print(f"공간 평균 계산 완료: {var_name}")
+    _log(f"공간 평균 계산 완료: {var_name}")
     
     return mean_data
 
 
+def _nearest_index(values: np.ndarray, point: Union[float, np.ndarray]) -> Union[int, xr.DataArray]:
+    """
+    좌표 배열에서 가장 가까운 위치의 정수 인덱스 찾기
+
+    point가 배열이면 'point' 차원의 DataArray를 반환하므로
+    여러 지점을 한 번의 isel로 추출할 수 있다.
+    """
+    if np.ndim(point) == 0:
+        return int(np.abs(values - point).argmin())
+    idx = np.abs(values[None, :] - np.asarray(point)[:, None]).argmin(axis=1)
+    return xr.DataArray(idx, dims='point')
+
+
 def create_timeseries(
     ds: xr.Dataset,
     var_name: str,
-    lon_point: Optional[float] = None,
-    lat_point: Optional[float] = None,
+    lon_point: Optional[Union[float, List[float]]] = None,
+    lat_point: Optional[Union[float, List[float]]] = None,
     spatial_mean: bool = False
-) -> pd.Series:
+) -> Union[pd.Series, pd.DataFrame]:
     """
     시계열 데이터 생성
     
     Parameters:
         ds: xarray Dataset
         var_name: 변수 이름
-        lon_point: 특정 경도 (None이면 공간 평균)
-        lat_point: 특정 위도 (None이면 공간 평균)
+        lon_point: 특정 경도 (None이면 공간 평균, 리스트면 여러 지점)
+        lat_point: 특정 위도 (None이면 공간 평균, 리스트면 여러 지점)
         spatial_mean: 공간 평균 계산 여부
         
     Returns:
-        시계열 pandas Series
+        시계열 pandas Series (여러 지점이면 지점별 열을 가진 DataFrame)
         
     Example:
         >>> ts = create_timeseries(ds, 'sst', spatial_mean=True)
         >>> ts_point = create_timeseries(ds, 'sst', lon_point=130, lat_point=38)
+        >>> ts_points = create_timeseries(ds, 'sst', lon_point=[125, 130], lat_point=[35, 38])
     """
     if var_name not in ds.data_vars:
         raise ValueError(f"변수 '{var_name}'를 찾을 수 없습니다.")
@@ -245,20 +513,23 @@ def create_timeseries(
         data = calculate_spatial_mean(ds, var_name)
         ts = data.to_pandas()
     else:
-        # 특정 지점 시계열
-        data = ds[var_name].sel(
-            longitude=lon_point,
-            latitude=lat_point,
-            method='nearest'
-        )
-        ts = data.to_pandas()
-    
-    # Series로 변환
+        # 특정 지점 시계열 - 최근접 정수 인덱스로 isel (라벨 인덱싱 오버헤드 생략)
+        indexers = {}
+        if lon_point is not None:
+            indexers['longitude'] = _nearest_index(ds['longitude'].values, lon_point)
+        if lat_point is not None:
+            indexers['latitude'] = _nearest_index(ds['latitude'].values, lat_point)
+        ts = ds[var_name].isel(indexers).to_pandas()
+    
+    # Series로 변환 (여러 지점이면 DataFrame 유지)
     if isinstance(ts, pd.DataFrame):
-        ts = ts.squeeze()
+        ts = ts.squeeze(axis=1) if ts.shape[1] == 1 else ts
     
-    ts.name = var_name
-    print(f"시계열 생성 완료: {len(ts)} 시간 스텝")
+    if isinstance(ts, pd.Series):
+        ts.name = var_name
+    else:
+        ts.columns.name = var_name
+    _log(f"시계열 생성 완료: {len(ts)} 시간 스텝")
     
     return ts
 
@@ -275,7 +546,9 @@ def plot_map(
     projection: ccrs.Projection = ccrs.PlateCarree(),
     add_coastlines: bool = True,
     add_gridlines: bool = True,
-    save_path: Optional[str] = None
+    save_path: Optional[str] = None,
+    decimate: bool = True,
+    dpi: int = 150
 ) -> Tuple[Figure, Axes]:
     """
     지도 시각화
@@ -292,6 +565,8 @@ def plot_map(
         add_coastlines: 해안선 추가 여부
         add_gridlines: 격자선 추가 여부
         save_path: 저장 경로
+        decimate: 화면 해상도에 맞춰 격자 축소 여부
+        dpi: 저장 해상도 (축소 기준 해상도로도 사용)
         
     Returns:
         Figure, Axes 객체
@@ -311,13 +586,20 @@ def plot_map(
         data = ds[var_name]
         time_str = ""
     
+    # 화면 해상도보다 촘촘한 격자는 블록 평균으로 축소 (1픽셀 미만 셀은 그려도 보이지 않음)
+    if decimate:
+        stride_y = max(1, data.sizes['latitude'] // (figsize[1] * dpi))
+        stride_x = max(1, data.sizes['longitude'] // (figsize[0] * dpi))
+        if stride_y > 1 or stride_x > 1:
+            data = data.coarsen(latitude=stride_y, longitude=stride_x, boundary='trim').mean()
+    
     # 그림 생성
     fig = plt.figure(figsize=figsize)
     ax = plt.axes(projection=projection)
     
     # 데이터 플롯
-    lon = ds.longitude.values
-    lat = ds.latitude.values
+    lon = data.longitude.values
+    lat = data.latitude.values
     
     im = ax.pcolormesh(
         lon, lat, data,
@@ -325,7 +607,8 @@ def plot_map(
         cmap=cmap,
         vmin=vmin,
         vmax=vmax,
-        shading='auto'
+        shading='auto',
+        rasterized=True
     )
     
     # 해안선 추가
@@ -352,8 +635,8 @@ def plot_map(
     
     # 저장
     if save_path:
-        plt.savefig(save_path, dpi=150, bbox_inches='tight')
-        print(f"그림 저장: {save_path}")
+        plt.savefig(save_path, dpi=dpi, bbox_inches='tight')
+        _log(f"그림 저장: {save_path}")
     
     return fig, ax
 
@@ -423,7 +706,7 @@ def plot_timeseries(
     # 저장
     if save_path:
         plt.savefig(save_path, dpi=150, bbox_inches='tight')
-        print(f"그림 저장: {save_path}")
+        _log(f"그림 저장: {save_path}")
     
     return fig, ax
 
@@ -431,35 +714,85 @@ def plot_timeseries(
 def export_to_csv(
     data: Union[xr.Dataset, xr.DataArray, pd.DataFrame, pd.Series],
     filepath: str,
-    var_names: Optional[List[str]] = None
-) -> None:
+    var_names: Optional[List[str]] = None,
+    format: str = 'csv',
+    max_csv_rows: int = 1_000_000
+) -> str:
     """
-    CSV 파일로 내보내기
+    CSV 파일로 내보내기 (대용량은 Parquet/Zarr로 전환)
     
     Parameters:
         data: 내보낼 데이터
         filepath: 저장 경로
         var_names: Dataset인 경우 내보낼 변수 이름 리스트
+        format: 저장 형식 ('csv', 'parquet', 'zarr')
+        max_csv_rows: CSV로 저장할 최대 행 수. 초과하면 xarray 데이터는 Zarr,
+            표 형식 데이터는 Parquet으로 저장 (해당 라이브러리가 없으면 gzip 압축 CSV).
+            확장자가 바뀌며 ExportFormatWarning으로 알림
+        
+    Returns:
+        실제 저장된 경로
         
     Example:
         >>> export_to_csv(ds, 'output.csv', var_names=['sst', 'salinity'])
+        >>> export_to_csv(ds, 'output.zarr', format='zarr')
     """
+    if format not in ('csv', 'parquet', 'zarr'):
+        raise ValueError(f"알 수 없는 형식: {format}")
+    
+    if isinstance(data, xr.Dataset) and var_names:
+        data = data[var_names]
+    
+    # 행 수 계산 (to_dataframe은 좌표의 전체 조합을 만들기 때문에 미리 확인)
+    if isinstance(data, (xr.Dataset, xr.DataArray)):
+        nrows = int(np.prod(list(data.sizes.values())))
+    elif isinstance(data, (pd.DataFrame, pd.Series)):
+        nrows = len(data)
+    else:
+        raise TypeError(f"지원하지 않는 데이터 타입: {type(data)}")
+    
+    if format == 'csv' and nrows > max_csv_rows:
+        # 저장 라이브러리가 설치된 경우에만 형식 전환, 없으면 gzip 압축 CSV
+        if isinstance(data, (xr.Dataset, xr.DataArray)):
+            format, suffix = ('zarr', '.zarr') if _HAS_ZARR else ('csv', '.csv.gz')
+        else:
+            format, suffix = ('parquet', '.parquet') if _HAS_PARQUET else ('csv', '.csv.gz')
+        filepath = f"{os.path.splitext(filepath)[0]}{suffix}"
+        warnings.warn(
+            f"행 수가 많아 ({nrows:,}행 > {max_csv_rows:,}행) {filepath}에 저장합니다.",
+            ExportFormatWarning, stacklevel=2
+        )
+    
+    # Zarr 저장 (청크 단위, xarray 전용)
+    if format == 'zarr':
+        if isinstance(data, xr.DataArray):
+            data = data.to_dataset(name=data.name or 'data')
+        elif not isinstance(data, xr.Dataset):
+            raise TypeError("zarr 형식은 xarray 데이터만 지원합니다.")
+        data.to_zarr(filepath, mode='w')
+        _log(f"Zarr 저장: {filepath}")
+        return filepath
+    
     # 데이터 타입에 따라 처리
     if isinstance(data, xr.Dataset):
-        if var_names:
-            df = data[var_names].to_dataframe()
-        else:
-            df = data.to_dataframe()
+        df = data.to_dataframe()
     elif isinstance(data, xr.DataArray):
         df = data.to_dataframe(name=data.name or 'data')
-    elif isinstance(data, (pd.DataFrame, pd.Series)):
-        df = data
     else:
-        raise TypeError(f"지원하지 않는 데이터 타입: {type(data)}")
+        df = data
+    
+    if format == 'parquet':
+        if isinstance(df, pd.Series):
+            df = df.to_frame(name=df.name or 'data')
+        df.to_parquet(filepath, compression='snappy')
+        _log(f"Parquet 파일 저장: {filepath}")
+        return filepath
     
-    # CSV 저장
+    # CSV 저장 (.gz 확장자면 pandas가 자동으로 압축)
     df.to_csv(filepath)
-    print(f"CSV 파일 저장: {filepath}")
+    _log(f"CSV 파일 저장: {filepath}")
+    
+    return filepath
 
 
 def calculate_anomaly(
@@ -487,21 +820,44 @@ def calculate_anomaly(
     
     # 기준 기간 설정
     if reference_period:
-        ref_data = subset_time(ds, reference_period[0], reference_period[1])[var_name]
+        ref_data = subset(ds, start_date=reference_period[0], end_date=reference_period[1])[var_name]
     else:
         ref_data = data
     
     # 월별 평균 계산 (계절성 제거)
     if 'time' in ref_data.dims:
+        if method not in ('subtract', 'percentage'):
+            raise ValueError(f"알 수 없는 방법: {method}")
+
         climatology = ref_data.groupby('time.month').mean('time')
         
-        # 이상치 계산
-        if method == 'subtract':
-            anomaly = data.groupby('time.month') - climatology
-        elif method == 'percentage':
-            anomaly = ((data.groupby('time.month') - climatology) / climatology) * 100
+        if data.chunks is not None:
+            # Dask 배열은 groupby 연산으로 지연 계산 유지
+            if method == 'subtract':
+                anomaly = data.groupby('time.month') - climatology
+            else:
+                anomaly = ((data.groupby('time.month') - climatology).groupby('time.month') / climatology) * 100
         else:
-            raise ValueError(f"알 수 없는 방법: {method}")
+            # 월별 기후값을 (12, ...) 배열로 한 번 만든 뒤 월 인덱스로 gather
+            months = data['time'].dt.month.values
+            climatology = climatology.transpose('month', *[d for d in data.dims if d != 'time'])
+            clim = np.full((12,) + climatology.shape[1:], np.nan)
+            clim[climatology['month'].values - 1] = climatology.values
+            clim = np.moveaxis(clim[months - 1], 0, data.get_axis_num('time'))
+            
+            # 이상치 계산 (numexpr가 있으면 중간 배열 없이 한 번에 계산)
+            expr = '(x - c) / c * 100' if method == 'percentage' else 'x - c'
+            if _HAS_NUMEXPR:
+                values = ne.evaluate(expr, local_dict={'x': data.values, 'c': clim})
+            else:
+                values = np.subtract(data.values, clim)
+                if method == 'percentage':
+                    values /= clim
+                    values *= 100
+            
+            anomaly = data.copy(data=values)
+            anomaly.attrs = {}
+            anomaly = anomaly.assign_coords(month=('time', months))
     else:
         # 시간 차원이 없는 경우
         mean_val = ref_data.mean()
@@ -511,11 +867,48 @@ def calculate_anomaly(
             anomaly = ((data - mean_val) / mean_val) * 100
     
     anomaly.name = f"{var_name}_anomaly"
-    print(f"이상치 계산 완료: {var_name}")
+    _log(f"이상치 계산 완료: {var_name}")
     
     return anomaly
 
 
+def _dispatch(handlers: Dict[type, Any], data: Any) -> Any:
+    """
+    타입별 처리 함수 찾기 (정확한 타입은 딕셔너리 조회, 하위 클래스만 isinstance로 확인)
+    """
+    handler = handlers.get(type(data))
+    if handler is None:
+        for cls, func in handlers.items():
+            if isinstance(data, cls):
+                return func
+    return handler
+
+
+def _moving_average_series(data: pd.Series, window: int, center: bool, min_periods: int) -> pd.Series:
+    if not _HAS_BOTTLENECK or not 0 < window <= len(data):
+        return data.rolling(window=window, center=center, min_periods=min_periods).mean()
+
+    # bottleneck 이동평균 (중앙 정렬은 끝에 NaN을 붙여 계산한 뒤 앞으로 당김)
+    shift = (window - 1) // 2 if center else 0
+    values = np.asarray(data.values, dtype=np.float64)
+    if shift:
+        values = np.concatenate([values, np.full(shift, np.nan)])
+    smoothed = bn.move_mean(values, window=window, min_count=min_periods)[shift:]
+    return pd.Series(smoothed, index=data.index, name=data.name)
+
+
+def _moving_average_dataarray(data: xr.DataArray, window: int, center: bool, min_periods: int) -> xr.DataArray:
+    if 'time' not in data.dims:
+        raise ValueError("시간 차원이 필요합니다.")
+    return data.rolling(time=window, center=center, min_periods=min_periods).mean()
+
+
+_MOVING_AVERAGE_HANDLERS = {
+    pd.Series: _moving_average_series,
+    xr.DataArray: _moving_average_dataarray,
+}
+
+
 def apply_moving_average(
     data: Union[pd.Series, xr.DataArray],
     window: int,
@@ -537,29 +930,93 @@ def apply_moving_average(
     Example:
         >>> smoothed = apply_moving_average(ts, window=12)
     """
-    if isinstance(data, pd.Series):
-        smoothed = data.rolling(
-            window=window,
-            center=center,
-            min_periods=min_periods or 1
-        ).mean()
-    elif isinstance(data, xr.DataArray):
-        if 'time' in data.dims:
-            smoothed = data.rolling(
-                time=window,
-                center=center,
-                min_periods=min_periods or 1
-            ).mean()
-        else:
-            raise ValueError("시간 차원이 필요합니다.")
-    else:
+    handler = _dispatch(_MOVING_AVERAGE_HANDLERS, data)
+    if handler is None:
         raise TypeError(f"지원하지 않는 데이터 타입: {type(data)}")
+    smoothed = handler(data, window, center, min_periods or 1)
     
-    print(f"이동평균 적용 완료: window={window}")
+    _log(f"이동평균 적용 완료: window={window}")
     
     return smoothed
 
 
+def _pairwise_slopes(y: np.ndarray, max_pairs: int = 5_000_000) -> np.ndarray:
+    """
+    Sen's slope용 모든 (i < j) 쌍의 기울기 계산 (벡터화)
+
+    쌍 개수가 max_pairs 이하이면 triu_indices로 한 번에 계산하고,
+    그보다 크면 인덱스 배열 없이 i 기준 행 단위로 미리 할당한 배열을 채운다.
+    """
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    n_pairs = n * (n - 1) // 2
+
+    if n_pairs <= max_pairs:
+        i, j = np.triu_indices(n, k=1)
+        return (y[j] - y[i]) / (j - i)
+
+    slopes = np.empty(n_pairs, dtype=np.float64)
+    offsets = np.arange(1, n, dtype=np.float64)
+    pos = 0
+    for i in range(n - 1):
+        m = n - 1 - i
+        row = slopes[pos:pos + m]
+        np.subtract(y[i + 1:], y[i], out=row)
+        row /= offsets[:m]
+        pos += m
+
+    return slopes
+
+
+def _linear_fit(x: np.ndarray, y: np.ndarray) -> Tuple[float, float, float, float, float]:
+    """
+    단순 선형 회귀 (slope, intercept, r, p-value, 기울기 표준오차)
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    xm, ym = x.mean(), y.mean()
+    dx, dy = x - xm, y - ym
+    sxx = np.einsum('i,i->', dx, dx)
+    syy = np.einsum('i,i->', dy, dy)
+    r_value, p_value = _pearson(x, y)
+
+    slope = np.einsum('i,i->', dx, dy) / sxx
+    intercept = ym - slope * xm
+    std_err = np.sqrt((1 - r_value**2) * syy / sxx / (n - 2))
+    return slope, intercept, r_value, p_value, std_err
+
+
+def _quadratic_fit(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    2차 다항식 최소제곱 피팅 (np.polyfit(x, y, 2)와 같은 내림차순 계수)
+
+    조건수를 줄이기 위해 x를 [-1, 1]로 정규화한 뒤 3x3 정규방정식을 풀고
+    계수를 원래 x 기준으로 되돌린다.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    center = (x.max() + x.min()) / 2
+    scale = (x.max() - x.min()) / 2 or 1.0
+    t = (x - center) / scale
+    t2 = t * t
+
+    st, st2, st3, st4 = t.sum(), t2.sum(), np.dot(t2, t), np.dot(t2, t2)
+    A = np.array([
+        [len(t), st, st2],
+        [st, st2, st3],
+        [st2, st3, st4],
+    ])
+    b = np.array([y.sum(), np.dot(t, y), np.dot(t2, y)])
+    c0, c1, c2 = np.linalg.solve(A, b)
+
+    # t = (x - center) / scale 치환을 전개해 x에 대한 계수로 변환
+    a2 = c2 / scale**2
+    a1 = c1 / scale - 2 * c2 * center / scale**2
+    a0 = c0 - c1 * center / scale + c2 * center**2 / scale**2
+    return np.array([a2, a1, a0])
+
+
 def calculate_trend(
     ts: pd.Series,
     method: str = 'linear',
@@ -592,8 +1049,8 @@ def calculate_trend(
     result = {}
     
     if method == 'linear':
-        # 선형 회귀
-        slope, intercept, r_value, p_value, std_err = stats.linregress(x, y)
+        # 선형 회귀 (편차 내적으로 직접 계산, stats.linregress와 같은 결과)
+        slope, intercept, r_value, p_value, std_err = _linear_fit(x, y)
         
         result['slope'] = slope
         result['intercept'] = intercept
@@ -612,8 +1069,8 @@ def calculate_trend(
             result['annual_trend'] = slope * samples_per_year
             
     elif method == 'polynomial':
-        # 2차 다항식 피팅
-        coeffs = np.polyfit(x, y, 2)
+        # 2차 다항식 피팅 (3x3 정규방정식)
+        coeffs = _quadratic_fit(x, y)
         result['coefficients'] = coeffs
         result['trend_line'] = pd.Series(
             np.polyval(coeffs, x),
@@ -622,12 +1079,8 @@ def calculate_trend(
         
     elif method == 'sen':
         # Sen's slope (비모수 방법)
-        n = len(y)
-        slopes = []
-        for i in range(n):
-            for j in range(i+1, n):
-                slopes.append((y[j] - y[i]) / (j - i))
-        
+        slopes = _pairwise_slopes(y)
+
         result['slope'] = np.median(slopes)
         result['trend_line'] = pd.Series(
             result['slope'] * x + np.median(y - result['slope'] * x),
@@ -637,11 +1090,47 @@ def calculate_trend(
     else:
         raise ValueError(f"알 수 없는 방법: {method}")
     
-    print(f"트렌드 계산 완료: {method}")
+    _log(f"트렌드 계산 완료: {method}")
     
     return result
 
 
+def _dataframe_to_series(data: pd.DataFrame) -> pd.Series:
+    return data.squeeze()
+
+
+def _dataarray_to_series(data: xr.DataArray) -> pd.Series:
+    data = data.to_pandas()
+    return data.squeeze() if type(data) is pd.DataFrame else data
+
+
+_TO_SERIES_HANDLERS = {
+    pd.Series: lambda data: data,
+    xr.DataArray: _dataarray_to_series,
+    pd.DataFrame: _dataframe_to_series,
+}
+
+
+def _as_series(data: Any) -> Any:
+    handler = _dispatch(_TO_SERIES_HANDLERS, data)
+    return data if handler is None else handler(data)
+
+
+def _pearson(a: np.ndarray, b: np.ndarray) -> Tuple[float, float]:
+    """
+    Pearson 상관계수와 양측 p-value (scipy.stats.pearsonr와 같은 결과)
+    """
+    n = len(a)
+    a = a - a.mean()
+    b = b - b.mean()
+    with np.errstate(invalid='ignore', divide='ignore'):
+        corr = np.einsum('i,i->', a, b) / np.sqrt(np.einsum('i,i->', a, a) * np.einsum('i,i->', b, b))
+        corr = np.clip(corr, -1.0, 1.0)
+        t_stat = corr * np.sqrt((n - 2) / (1.0 - corr * corr))
+    pval = 2 * stats.t.sf(abs(t_stat), n - 2)
+    return float(corr), float(pval)
+
+
 def calculate_correlation(
     data1: Union[pd.Series, xr.DataArray],
     data2: Union[pd.Series, xr.DataArray],
@@ -663,33 +1152,31 @@ def calculate_correlation(
     Example:
         >>> corr, pval = calculate_correlation(sst, wind_speed, lag=3)
     """
-    # xarray를 pandas로 변환
-    if isinstance(data1, xr.DataArray):
-        data1 = data1.to_pandas()
-    if isinstance(data2, xr.DataArray):
-        data2 = data2.to_pandas()
-    
-    # Series로 변환
-    if isinstance(data1, pd.DataFrame):
-        data1 = data1.squeeze()
-    if isinstance(data2, pd.DataFrame):
-        data2 = data2.squeeze()
+    # xarray/DataFrame을 pandas Series로 변환
+    data1 = _as_series(data1)
+    data2 = _as_series(data2)
     
     # 시차 적용
     if lag != 0:
         data2 = data2.shift(lag)
     
-    # NaN 제거
-    valid_idx = ~(data1.isna() | data2.isna())
-    d1 = data1[valid_idx]
-    d2 = data2[valid_idx]
+    # 인덱스가 다르면 공통 구간으로 정렬
+    if not data1.index.equals(data2.index):
+        data1, data2 = data1.align(data2, join='inner')
+    
+    # NaN/inf 제거 (두 배열을 한 번에 마스킹)
+    a = np.asarray(data1.values, dtype=np.float64)
+    b = np.asarray(data2.values, dtype=np.float64)
+    valid = np.isfinite(a) & np.isfinite(b)
+    d1 = a[valid]
+    d2 = b[valid]
     
     if len(d1) < 3:
         raise ValueError("상관관계 계산을 위해 최소 3개의 데이터가 필요합니다.")
     
     # 상관관계 계산
     if method == 'pearson':
-        corr, pval = stats.pearsonr(d1, d2)
+        corr, pval = _pearson(d1, d2)
     elif method == 'spearman':
         corr, pval = stats.spearmanr(d1, d2)
     elif method == 'kendall':
@@ -697,7 +1184,7 @@ def calculate_correlation(
     else:
         raise ValueError(f"알 수 없는 방법: {method}")
     
-    print(f"상관관계: {corr:.3f} (p-value: {pval:.4f}, lag: {lag})")
+    _log(f"상관관계: {corr:.3f} (p-value: {pval:.4f}, lag: {lag})")
     
     return corr, pval
 
@@ -741,22 +1228,22 @@ def apply_filter(
     if len(values_clean) < order * 2:
         raise ValueError(f"데이터가 너무 짧습니다. 최소 {order * 2}개 필요")
     
-    # Butterworth 필터 설계
-    from scipy.signal import butter, filtfilt
+    # Butterworth 필터 설계 (2차 섹션 형태: 고차에서도 수치적으로 안정)
+    from scipy.signal import butter, sosfiltfilt
     
     if filter_type == 'lowpass':
-        b, a = butter(order, cutoff_freq, btype='low')
+        sos = butter(order, cutoff_freq, btype='low', output='sos')
     elif filter_type == 'highpass':
-        b, a = butter(order, cutoff_freq, btype='high')
+        sos = butter(order, cutoff_freq, btype='high', output='sos')
     elif filter_type == 'bandpass':
         if not isinstance(cutoff_freq, (list, tuple)) or len(cutoff_freq) != 2:
             raise ValueError("bandpass 필터는 2개의 차단 주파수가 필요합니다.")
-        b, a = butter(order, cutoff_freq, btype='band')
+        sos = butter(order, cutoff_freq, btype='band', output='sos')
     else:
         raise ValueError(f"알 수 없는 필터 타입: {filter_type}")
     
-    # 필터 적용
-    filtered_clean = filtfilt(b, a, values_clean)
+    # 필터 적용 (안정성을 위해 float64로 계산, 결과는 입력 dtype으로 저장)
+    filtered_clean = sosfiltfilt(sos, values_clean.astype(np.float64, copy=False))
     
     # NaN 위치 복원
     filtered = np.full_like(values, np.nan)
@@ -771,11 +1258,22 @@ def apply_filter(
     else:
         result = filtered
     
-    print(f"필터링 완료: {filter_type} (cutoff: {cutoff_freq})")
+    _log(f"필터링 완료: {filter_type} (cutoff: {cutoff_freq})")
     
     return result
 
 
+def _find_runs(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    불리언 마스크에서 연속된 True 구간 찾기
+
+    Returns:
+        (시작 인덱스 배열, 종료 인덱스 배열) - 종료 인덱스는 구간 다음 위치
+    """
+    edges = np.flatnonzero(np.diff(np.r_[0, np.asarray(mask, dtype=np.int8), 0]))
+    return edges[0::2], edges[1::2]
+
+
 def detect_extremes(
     data: Union[pd.Series, xr.DataArray],
     threshold_type: str = 'percentile',
@@ -817,52 +1315,146 @@ def detect_extremes(
     else:
         raise ValueError(f"알 수 없는 임계값 타입: {threshold_type}")
     
-    # 극값 탐지
-    extreme_mask = ts > threshold
-    
-    # 이벤트 그룹화
-    events = []
-    in_event = False
-    event_start = None
-    
-    for i, (idx, val) in enumerate(ts.items()):
-        if extreme_mask.iloc[i] and not in_event:
-            # 이벤트 시작
-            in_event = True
-            event_start = idx
-        elif not extreme_mask.iloc[i] and in_event:
-            # 이벤트 종료
-            in_event = False
-            event_end = ts.index[i-1]
-            event_data = ts[event_start:event_end]
-            
-            # 지속 기간 체크
-            if duration is None or len(event_data) >= duration:
-                events.append({
-                    'start': event_start,
-                    'end': event_end,
-                    'duration': len(event_data),
-                    'max_value': event_data.max(),
-                    'mean_value': event_data.mean(),
-                    'sum_excess': (event_data - threshold).sum()
-                })
-    
-    # 마지막 이벤트 처리
-    if in_event:
-        event_end = ts.index[-1]
-        event_data = ts[event_start:event_end]
-        if duration is None or len(event_data) >= duration:
-            events.append({
-                'start': event_start,
-                'end': event_end,
-                'duration': len(event_data),
-                'max_value': event_data.max(),
-                'mean_value': event_data.mean(),
-                'sum_excess': (event_data - threshold).sum()
-            })
+    # 극값 탐지 (연속 구간 run-length encoding)
+    values = ts.to_numpy(dtype=np.float64)
+    starts, ends = _find_runs(values > threshold)
+    lengths = ends - starts
+
+    # 지속 기간 체크
+    if duration is not None:
+        keep = lengths >= duration
+        starts, ends, lengths = starts[keep], ends[keep], lengths[keep]
+
+    # 이벤트별 집계: [시작, 종료) 경계를 번갈아 넣어 reduceat 결과의 짝수 번째만 사용
+    if len(starts):
+        bounds = np.column_stack([starts, ends]).ravel()
+        event_sum = np.add.reduceat(np.append(values, 0.0), bounds)[::2]
+        max_value = np.maximum.reduceat(np.append(values, -np.inf), bounds)[::2]
+    else:
+        event_sum = max_value = np.empty(0)
+
+    result = pd.DataFrame({
+        'start': ts.index[starts],
+        'end': ts.index[ends - 1],
+        'duration': lengths,
+        'max_value': max_value,
+        'mean_value': event_sum / np.maximum(lengths, 1),
+        'sum_excess': event_sum - threshold * lengths
+    })
+    _log(f"극값 이벤트 탐지 완료: {len(result)}개 이벤트 (임계값: {threshold:.2f})")
     
-    result = pd.DataFrame(events)
-    print(f"극값 이벤트 탐지 완료: {len(events)}개 이벤트 (임계값: {threshold:.2f})")
+    return result
+
+
+_EXTREME_STATS = ('n_events', 'total_duration', 'max_duration', 'max_value', 'sum_excess')
+
+
+def _extreme_stats(
+    values: np.ndarray,
+    threshold: Union[float, np.ndarray],
+    duration: Optional[int] = None
+) -> Tuple[np.ndarray, ...]:
+    """
+    (..., time) 배열의 격자점별 극값 이벤트 요약 (모든 격자점을 한 번에 run-length encoding)
+
+    Returns:
+        _EXTREME_STATS 순서의 배열 튜플 (각각 values.shape[:-1] 크기)
+    """
+    shape = values.shape[:-1]
+    n_time = values.shape[-1]
+    values = np.asarray(values, dtype=np.float64).reshape(-1, n_time)
+    n_cells = values.shape[0]
+    threshold = np.broadcast_to(np.asarray(threshold, dtype=np.float64), shape).reshape(-1, 1)
+
+    # 격자점마다 양 끝을 0으로 감싸 이벤트가 다른 격자점으로 이어지지 않게 함
+    exceed = np.zeros((n_cells, n_time + 2), dtype=np.int8)
+    exceed[:, 1:-1] = values > threshold
+    cell, start = np.nonzero(np.diff(exceed, axis=1) == 1)
+    _, end = np.nonzero(np.diff(exceed, axis=1) == -1)
+    lengths = end - start
+
+    if duration is not None:
+        keep = lengths >= duration
+        cell, start, end, lengths = cell[keep], start[keep], end[keep], lengths[keep]
+
+    n_events = np.bincount(cell, minlength=n_cells)
+    total_duration = np.bincount(cell, weights=lengths, minlength=n_cells)
+    max_duration = np.zeros(n_cells, dtype=np.int64)
+    np.maximum.at(max_duration, cell, lengths)
+
+    max_value = np.full(n_cells, np.nan)
+    sum_excess = np.zeros(n_cells)
+    if len(cell):
+        # 평탄화한 배열에서 [시작, 종료) 경계를 번갈아 넣어 이벤트별 합/최댓값 계산
+        flat = values.ravel()
+        offset = cell * n_time
+        bounds = np.column_stack([offset + start, offset + end]).ravel()
+        event_sum = np.add.reduceat(np.append(flat, 0.0), bounds)[::2]
+        event_max = np.maximum.reduceat(np.append(flat, -np.inf), bounds)[::2]
+        np.fmax.at(max_value, cell, event_max)
+        sum_excess = np.bincount(cell, weights=event_sum - threshold[cell, 0] * lengths, minlength=n_cells)
+
+    return (
+        n_events.astype(np.int32).reshape(shape),
+        total_duration.astype(np.int32).reshape(shape),
+        max_duration.astype(np.int32).reshape(shape),
+        max_value.reshape(shape),
+        sum_excess.reshape(shape),
+    )
+
+
+def detect_extremes_grid(
+    data: xr.DataArray,
+    threshold_type: str = 'percentile',
+    threshold_value: float = 95,
+    duration: Optional[int] = None,
+    dim: str = 'time'
+) -> xr.Dataset:
+    """
+    격자 전체의 극값 이벤트 탐지 (격자점별 요약 통계)
+    
+    Parameters:
+        data: (time, lat, lon) 등 시간 차원을 가진 DataArray
+        threshold_type: 임계값 타입 ('percentile', 'absolute', 'std') - 격자점별로 계산
+        threshold_value: 임계값
+        duration: 최소 지속 기간
+        dim: 시간 차원 이름
+        
+    Returns:
+        n_events, total_duration, max_duration, max_value, sum_excess 변수를 가진 Dataset
+        
+    Example:
+        >>> mhw = detect_extremes_grid(ds['sst'], threshold_value=90, duration=5)
+        >>> mhw['n_events'].plot()
+    """
+    # 시간 축은 한 청크여야 격자점별 이벤트가 끊기지 않음
+    if data.chunks is not None:
+        data = data.chunk({dim: -1})
+    
+    # 격자점별 임계값 계산
+    if threshold_type == 'percentile':
+        threshold = data.quantile(threshold_value / 100, dim=dim, skipna=True).drop_vars('quantile')
+    elif threshold_type == 'absolute':
+        threshold = threshold_value
+    elif threshold_type == 'std':
+        threshold = data.mean(dim) + threshold_value * data.std(dim, ddof=1)
+    else:
+        raise ValueError(f"알 수 없는 임계값 타입: {threshold_type}")
+    
+    outputs = xr.apply_ufunc(
+        _extreme_stats,
+        data,
+        threshold,
+        kwargs={'duration': duration},
+        input_core_dims=[[dim], []],
+        output_core_dims=[[] for _ in _EXTREME_STATS],
+        dask='parallelized',
+        output_dtypes=[np.int32, np.int32, np.int32, np.float64, np.float64]
+    )
+    result = xr.Dataset(dict(zip(_EXTREME_STATS, outputs)))
+    
+    if _VERBOSE:
+        _log(f"격자 극값 이벤트 탐지 완료: {dict(result.sizes)} 격자")
     
     return result
 
@@ -889,15 +1481,12 @@ def merge_datasets(
     if len(datasets) < 2:
         raise ValueError("최소 2개의 데이터셋이 필요합니다.")
     
-    # 첫 번째 데이터셋을 기준으로 시작
-    merged = datasets[0]
-    
-    # 순차적으로 병합
-    for ds in datasets[1:]:
-        if dim == 'time':
-            merged = xr.concat([merged, ds], dim=dim)
-        else:
-            merged = xr.merge([merged, ds], join=method)
+    # 한 번에 병합 (순차 병합 시 매 단계마다 전체 복사가 발생)
+    if dim == 'time':
+        merged = xr.concat(datasets, dim=dim, join=method, combine_attrs='override')
+    else:
+        # 공간 분할 데이터처럼 같은 변수가 나뉘어 있으면 겹치지 않는 값을 합침
+        merged = xr.merge(datasets, join=method, compat='no_conflicts')
     
     # 중복 제거 및 정렬
     if dim in merged.dims:
@@ -905,12 +1494,80 @@ def merge_datasets(
         if dim == 'time':
             merged = merged.drop_duplicates(dim=dim)
     
-    print(f"데이터셋 병합 완료: {len(datasets)}개 → 1개")
-    print(f"최종 크기: {dict(merged.dims)}")
+    if _VERBOSE:
+        _log(f"데이터셋 병합 완료: {len(datasets)}개 → 1개")
+        _log(f"최종 크기: {dict(merged.sizes)}")
     
     return merged
 
 
+def _block_stats(
+    values: np.ndarray,
+    valid_range: Optional[Tuple[float, float]] = None
+) -> Tuple[int, int, float, float, float, float, int]:
+    """
+    블록 하나의 요약 통계를 한 번에 계산
+
+    Returns:
+        (결측 개수, 유효 개수, 평균, 편차제곱합, 최소, 최대, 범위 밖 개수)
+    """
+    values = np.asarray(values, dtype=np.float64).ravel()
+    finite = values[~np.isnan(values)]
+    n = finite.size
+    if n == 0:
+        return values.size, 0, 0.0, 0.0, np.nan, np.nan, 0
+
+    mean = finite.mean()
+    m2 = np.dot(finite - mean, finite - mean)
+    oor = 0
+    if valid_range:
+        oor = int(np.count_nonzero((finite < valid_range[0]) | (finite > valid_range[1])))
+    return values.size - n, n, mean, m2, finite.min(), finite.max(), oor
+
+
+def _nanstats(
+    data: xr.DataArray,
+    valid_range: Optional[Tuple[float, float]] = None,
+    block_size: int = 1 << 20
+) -> Dict[str, float]:
+    """
+    결측 개수, 최소/최대/평균/표준편차, 범위 밖 개수를 블록 단위 단일 패스로 계산
+
+    블록별 (개수, 평균, 편차제곱합)을 Chan 방식으로 병합하므로 nanstd와 같은 결과를 준다.
+    Dask 배열은 청크마다 한 번씩만 계산한다.
+    """
+    if data.chunks is not None and _HAS_DASK:
+        blocks = data.data.to_delayed().ravel()
+        parts = dask.compute(*[dask.delayed(_block_stats)(b, valid_range) for b in blocks])
+    else:
+        flat = np.asarray(data.values).ravel()
+        parts = [_block_stats(flat[i:i + block_size], valid_range)
+                 for i in range(0, max(flat.size, 1), block_size)]
+
+    nan_count = n = oor = 0
+    mean = m2 = 0.0
+    vmin, vmax = np.inf, -np.inf
+    for b_nan, b_n, b_mean, b_m2, b_min, b_max, b_oor in parts:
+        nan_count += b_nan
+        oor += b_oor
+        if b_n == 0:
+            continue
+        total = n + b_n
+        delta = b_mean - mean
+        mean += delta * b_n / total
+        m2 += b_m2 + delta * delta * n * b_n / total
+        n = total
+        vmin = min(vmin, b_min)
+        vmax = max(vmax, b_max)
+
+    if n == 0:
+        return {'missing_count': nan_count, 'out_of_range_count': oor,
+                'min': np.nan, 'max': np.nan, 'mean': np.nan, 'std': np.nan}
+    return {'missing_count': nan_count, 'out_of_range_count': oor,
+            'min': float(vmin), 'max': float(vmax),
+            'mean': float(mean), 'std': float(np.sqrt(m2 / n))}
+
+
 def quality_check(
     ds: xr.Dataset,
     var_name: str,
@@ -943,44 +1600,34 @@ def quality_check(
         'dtype': str(data.dtype)
     }
     
+    # 결측값/범위/기본 통계를 한 번의 패스로 계산
+    summary = _nanstats(data, valid_range)
+    
     # 결측값 통계
-    nan_count = np.isnan(data).sum().item()
+    nan_count = summary['missing_count']
     result['missing_count'] = nan_count
     result['missing_percent'] = (nan_count / data.size) * 100
     result['coverage'] = 1 - (nan_count / data.size)
     
     # 범위 검사
     if valid_range:
-        valid_mask = (data >= valid_range[0]) & (data <= valid_range[1])
-        invalid_count = (~valid_mask).sum().item() - nan_count
+        invalid_count = summary['out_of_range_count']
         result['out_of_range_count'] = invalid_count
         result['out_of_range_percent'] = (invalid_count / data.size) * 100
     
     # 기본 통계
-    result['min'] = float(np.nanmin(data))
-    result['max'] = float(np.nanmax(data))
-    result['mean'] = float(np.nanmean(data))
-    result['std'] = float(np.nanstd(data))
+    for key in ('min', 'max', 'mean', 'std'):
+        result[key] = summary[key]
     
     # 시간 차원이 있는 경우 연속 결측 검사
     if 'time' in data.dims and max_gap:
         time_series = data.mean(dim=[d for d in data.dims if d != 'time'])
-        nan_mask = np.isnan(time_series)
-        
-        # 연속 결측 구간 찾기
-        gaps = []
-        in_gap = False
-        gap_start = 0
         
-        for i, is_nan in enumerate(nan_mask.values):
-            if is_nan and not in_gap:
-                in_gap = True
-                gap_start = i
-            elif not is_nan and in_gap:
-                in_gap = False
-                gap_length = i - gap_start
-                if gap_length > max_gap:
-                    gaps.append((gap_start, i, gap_length))
+        # 연속 결측 구간 찾기 (run-length)
+        starts, ends = _find_runs(np.isnan(time_series.values))
+        lengths = ends - starts
+        long_gap = lengths > max_gap
+        gaps = list(zip(starts[long_gap].tolist(), ends[long_gap].tolist(), lengths[long_gap].tolist()))
         
         result['long_gaps'] = gaps
         result['max_gap_length'] = max(g[2] for g in gaps) if gaps else 0
@@ -992,9 +1639,10 @@ def quality_check(
         result.get('max_gap_length', 0) <= (max_gap or float('inf'))
     )
     
-    print(f"품질 검사 완료: {var_name}")
-    print(f"  - 커버리지: {result['coverage']:.1%}")
-    print(f"  - 품질 통과: {'✓' if result['quality_pass'] else '✗'}")
+    if _VERBOSE:
+        _log(f"품질 검사 완료: {var_name}")
+        _log(f"  - 커버리지: {result['coverage']:.1%}")
+        _log(f"  - 품질 통과: {'✓' if result['quality_pass'] else '✗'}")
     
     return result
 
@@ -1032,24 +1680,24 @@ def save_config(config: Dict, filepath: str) -> None:
     """분석 설정 저장"""
     with open(filepath, 'w') as f:
         json.dump(config, f, indent=2, default=str)
-    print(f"설정 저장: {filepath}")
+    _log(f"설정 저장: {filepath}")
 
 
 def load_config(filepath: str) -> Dict:
     """분석 설정 로드"""
     with open(filepath, 'r') as f:
         config = json.load(f)
-    print(f"설정 로드: {filepath}")
+    _log(f"설정 로드: {filepath}")
     return config
 
 
-print("Copernicus Utils 모듈 로드 완료!")
-print("사용 가능한 함수:", [
-    'load_dataset', 'subset_region', 'subset_time', 
+_log("Copernicus Utils 모듈 로드 완료!")
+_log("사용 가능한 함수:", [
+    'load_dataset', 'subset_region', 'subset_time', 'subset',
     'calculate_spatial_mean', 'create_timeseries',
     'plot_map', 'plot_timeseries', 'export_to_csv',
     'calculate_anomaly', 'apply_moving_average',
     'calculate_trend', 'calculate_correlation',
-    'apply_filter', 'detect_extremes', 'merge_datasets',
+    'apply_filter', 'detect_extremes', 'detect_extremes_grid', 'merge_datasets',
     'quality_check'
 ])
\ No newline at end of file
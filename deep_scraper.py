@@ -6,120 +6,344 @@ Deep Scraper for Copernicus Marine Service
 
 import requests
 from bs4 import BeautifulSoup
+from tqdm import tqdm
+from urllib3.util import Retry
+from urllib3.util.request import ACCEPT_ENCODING
 import json
 import re
 from pathlib import Path
 import time
-from urllib.parse import urljoin, urlparse, unquote
-from typing import List, Dict, Set, Tuple
+from urllib.parse import urljoin, urlsplit, unquote
+from typing import List, Dict, Set, Tuple, Union, Optional
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import threading
+import socket
+import zlib
 import hashlib
+import itertools
+import shutil
+from functools import lru_cache
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+# 다운로드할 파일 확장자
+TARGET_EXTENSIONS = [
+    '.ipynb', '.zip', '.tar', '.gz', '.tar.gz', '.7z',
+    '.nc', '.netcdf', '.hdf', '.hdf5', '.grib', '.grib2'
+]
+# 확장자는 경로 구분자/쿼리/끝 앞에 올 때만 인정, 긴 확장자 우선 (.tar.gz > .tar)
+_EXT_RE = re.compile(
+    r'(\.(?:' + '|'.join(re.escape(ext[1:]) for ext in sorted(TARGET_EXTENSIONS, key=len, reverse=True)) + r'))(?:[?#/]|$)',
+    re.IGNORECASE
+)
+_DOWNLOAD_KEYWORD_RE = re.compile(r'download|export|fetch|retrieve|/get/', re.IGNORECASE)
+
+# 알려진 파일 호스팅 패턴 (하나의 정규식으로 합쳐 한 번에 검사)
+FILE_HOSTING_PATTERNS = [
+    r'github\.com/.*?/raw/',
+    r'github\.com/.*?/releases/download/',
+    r'gitlab\.com/.*?/-/raw/',
+    r'bitbucket\.org/.*?/raw/',
+    r'drive\.google\.com/.*?/download',
+    r'dropbox\.com/.*?\?dl=1',
+    r'zenodo\.org/record/',
+    r'figshare\.com/.*?/download',
+    r'data\.marine\.copernicus\.eu/.*?/download',
+    r'resources\.marine\.copernicus\.eu/.*?/download',
+    r'mercator-ocean\.fr/.*?/download',
+]
+_FILE_HOSTING_RE = re.compile('|'.join(FILE_HOSTING_PATTERNS), re.IGNORECASE)
+
+# GitHub 저장소 / 노트북 링크
+_GITHUB_PATTERNS = [
+    re.compile(r'https?://github\.com/[\w\-]+/[\w\-]+(?:/tree/[\w\-]+)?'),
+    re.compile(r'https?://github\.com/[\w\-]+/[\w\-]+/blob/[\w\-]+/[\w\-/]+\.ipynb'),
+]
+
+# 하위 페이지로 따라갈 링크 키워드와 페이지당 최대 링크 수
+_LINK_KEYWORD_RE = re.compile(
+    r'tutorial|notebook|example|demo|training|learn|education|material|resource'
+    r'|download|data|dataset|file|github|gitlab|code',
+    re.IGNORECASE
+)
+MAX_CHILD_LINKS = 40
+
+# 크롤링할 HTML 페이지 최대 크기 (바이트)
+MAX_PAGE_BYTES = 5_000_000
+
+# 다운로드 진행률 갱신 간격 (바이트)
+PROGRESS_BYTES = 1_048_576
+
+# 다운로드 복사 버퍼 크기 (바이트)
+COPY_BUFFER_BYTES = 1_048_576
+
+# 시작 URL 외에 크롤링 중 접속하는 호스트 (DNS 미리 조회)
+EXTRA_HOSTS = ['api.github.com', 'raw.githubusercontent.com', 'zenodo.org']
+
+# 노트북을 찾아볼 저장소 내 경로 (GitHub contents API 기준, 루트를 먼저 확인)
+GITHUB_CONTENT_PATHS = ['', '/notebooks', '/examples']
+
+# GitHub API 응답 형식
+GITHUB_API_HEADERS = {'Accept': 'application/vnd.github+json'}
+
+# JavaScript에 숨겨진 파일 URL
+_SCRIPT_PATTERNS = [
+    re.compile(r'["\']url["\']\s*:\s*["\']([^"\']+\.(?:ipynb|zip|tar|gz))["\']', re.IGNORECASE),
+    re.compile(r'download["\']?\s*:\s*["\']([^"\']+)["\']', re.IGNORECASE),
+    re.compile(r'href\s*=\s*["\']([^"\']+\.(?:ipynb|zip|tar|gz))["\']', re.IGNORECASE),
+]
+
+# Content-Disposition 파일명, 안전한 파일명 변환
+_FILENAME_RE = re.compile(r'filename[^;=\n]*=(([\'"]).*?\2|[^\s]+)')
+_SAFE_FILENAME_RE = re.compile(r'[^\w\-_\.]')
+_SAFE_TABLE = {c: '_' for c in range(128) if not (chr(c).isalnum() or chr(c) in '-_.')}
+
+
+@lru_cache(maxsize=4096)
+def _is_downloadable_url(url: str) -> bool:
+    """확장자 / 다운로드 키워드 / 파일 호스팅 패턴 확인 (URL별 캐시)"""
+    return bool(
+        _EXT_RE.search(url)
+        or _DOWNLOAD_KEYWORD_RE.search(url)
+        or _FILE_HOSTING_RE.search(url)
+    )
+
+
+@lru_cache(maxsize=4096)
+def _classify_url(url: str) -> str:
+    """URL 소스 분류 (URL별 캐시)"""
+    if 'github.com' in url:
+        return 'github'
+    elif 'gitlab.com' in url:
+        return 'gitlab'
+    elif 'copernicus' in url:
+        return 'copernicus'
+    elif 'mercator' in url:
+        return 'mercator'
+    elif 'zenodo.org' in url:
+        return 'zenodo'
+    else:
+        return 'other'
+
+
+@lru_cache(maxsize=8192)
+def _netloc(url: str) -> str:
+    """URL의 호스트 부분 (같은 도메인 판별용)"""
+    return urlsplit(url).netloc
+
+
+@lru_cache(maxsize=4096)
+def _parse_file_url(url: str) -> Tuple[str, Optional[str]]:
+    """URL에서 (파일명, 확장자) 추출 (URL별 캐시)"""
+    path = unquote(urlsplit(url).path)
+    
+    # 파일명 추출
+    filename = path.split('/')[-1] if '/' in path else path
+    
+    # 파일명이 없거나 너무 짧으면 URL 해시 사용
+    if not filename or len(filename) < 3:
+        filename = f"{zlib.crc32(url.encode()):08x}"
+        
+    # 확장자 추출
+    match = _EXT_RE.search(filename)
+    extension = match.group(1).lower() if match else None
+    return filename, extension
+
+
+def _safe_filename(filename: str) -> str:
+    """파일명에서 허용되지 않는 문자를 '_'로 변환 (ASCII는 translate, 그 외는 정규식)"""
+    if filename.isascii():
+        return filename.translate(_SAFE_TABLE)
+    return _SAFE_FILENAME_RE.sub('_', filename)
+
+
+def _json_bytes(obj, indent: bool = False) -> bytes:
+    """JSON 직렬화 (orjson이 있으면 사용, 한글은 그대로 UTF-8로 저장)"""
+    if _HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+class _ProgressWriter:
+    """쓴 바이트 수를 세어 PROGRESS_BYTES마다 콜백으로 보고하는 파일 래퍼"""
+    
+    def __init__(self, fileobj, on_progress=None):
+        self._file = fileobj
+        self._on_progress = on_progress
+        self._reported = 0
+        self.written = 0
+        
+    def write(self, data) -> int:
+        n = self._file.write(data)
+        self.written += n
+        if self._on_progress and self.written - self._reported >= PROGRESS_BYTES:
+            self.flush_progress()
+        return n
+        
+    def flush_progress(self):
+        """아직 보고하지 않은 바이트를 콜백으로 전달"""
+        if self._on_progress and self.written > self._reported:
+            self._on_progress(self.written - self._reported)
+            self._reported = self.written
+
+
+class PageCache:
+    """크롤링한 HTML 페이지 디스크 캐시 (ETag / Last-Modified로 재검증)"""
+    
+    def __init__(self, cache_dir: Path, expire_after: int = 3600):
+        """
+        Parameters:
+            cache_dir: 캐시 디렉토리 경로
+            expire_after: 재검증 없이 캐시를 그대로 쓰는 시간 (초)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.expire_after = expire_after
+        self.index_file = self.cache_dir / 'page_index.json'
+        self.index = self._load_index()
+        self._lock = threading.Lock()
+        
+    def _load_index(self) -> Dict:
+        """캐시 인덱스 로드"""
+        if self.index_file.exists():
+            try:
+                with open(self.index_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                pass
+        return {}
+        
+    def save_index(self):
+        """캐시 인덱스 저장"""
+        with self._lock:
+            with open(self.index_file, 'w', encoding='utf-8') as f:
+                json.dump(self.index, f, indent=2, ensure_ascii=False)
+                
+    def _get_cache_key(self, url: str) -> str:
+        """URL에서 캐시 키 생성"""
+        return hashlib.md5(url.encode()).hexdigest()
+        
+    def lookup(self, url: str) -> Optional[Dict]:
+        """캐시 항목 반환 (본문 파일이 없으면 None)"""
+        with self._lock:
+            entry = self.index.get(self._get_cache_key(url))
+        if entry and (self.cache_dir / entry['filename']).exists():
+            return entry
+        return None
+        
+    def is_fresh(self, entry: Dict) -> bool:
+        """재검증 없이 사용할 수 있는지 확인"""
+        return time.time() - entry['date'] < self.expire_after
+        
+    def conditional_headers(self, entry: Dict) -> Dict:
+        """조건부 요청 헤더 (If-None-Match / If-Modified-Since)"""
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+        
+    def read(self, entry: Dict) -> bytes:
+        """캐시된 본문 읽기"""
+        return (self.cache_dir / entry['filename']).read_bytes()
+        
+    def touch(self, url: str):
+        """304 응답 후 캐시 시각 갱신"""
+        with self._lock:
+            entry = self.index.get(self._get_cache_key(url))
+            if entry:
+                entry['date'] = time.time()
+                
+    def store(self, url: str, response: requests.Response, content: bytes):
+        """응답 본문과 검증 헤더 저장 (Cache-Control: no-store는 저장하지 않음)"""
+        if 'no-store' in response.headers.get('Cache-Control', ''):
+            return
+        cache_key = self._get_cache_key(url)
+        filename = f"{cache_key}.html"
+        (self.cache_dir / filename).write_bytes(content)
+        with self._lock:
+            self.index[cache_key] = {
+                'url': url,
+                'filename': filename,
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'date': time.time()
+            }
+
 
 class DeepCopernicusScraper:
     """깊이 있는 크롤링을 수행하는 스크래퍼"""
     
-    def __init__(self, max_depth: int = 3):
+    def __init__(self, max_depth: int = 3, max_workers: int = 8,
+                 api_cache_file: Optional[str] = None,
+                 cache_dir: Optional[str] = None, cache_expire: int = 3600,
+                 results_file: Optional[str] = None):
         """
         Parameters:
             max_depth: 최대 크롤링 깊이
+            max_workers: 동시에 가져올 최대 페이지 수
+            api_cache_file: GitHub API 응답(ETag 포함)을 저장할 JSON 파일 (None이면 메모리에만 캐시)
+            cache_dir: 크롤링한 페이지를 저장할 디스크 캐시 디렉토리 (None이면 캐시 안 함)
+            cache_expire: 페이지 캐시를 재검증 없이 쓰는 시간 (초)
+            results_file: 찾은 리소스를 발견 즉시 한 줄씩 기록할 NDJSON 파일 (None이면 기록 안 함)
         """
         self.max_depth = max_depth
+        self.max_workers = max_workers
         self.visited_urls = set()
         self.found_files = []
+        
+        # 크롤링 중 리소스 스트리밍 기록 (NDJSON)
+        self.results_file = results_file
+        self._results_fp = None
+        self._streamed_urls = set()
+        
+        # GitHub API 응답 캐시 (URL -> {'etag', 'files'})
+        self.api_cache_file = api_cache_file
+        self._api_cache = self._load_api_cache()
+        self._api_checked = set()
+        self._api_missing = set()
+        self._api_rate_limited = False
+        self._api_lock = threading.Lock()
+        self._download_lock = threading.Lock()
+        
+        # 페이지 디스크 캐시
+        self.page_cache = PageCache(Path(cache_dir), cache_expire) if cache_dir else None
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
+            # brotli/zstd 패키지가 설치되어 있으면 br/zstd도 요청 (디코딩 가능한 인코딩만)
+            'Accept-Encoding': ACCEPT_ENCODING,
             'Connection': 'keep-alive',
         })
+        # 연결 재사용 (호스트별 풀 32개, 풀당 연결 최대 64개 - 크롤링/다운로드 스레드보다 넉넉하게)
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=max(64, max_workers * 2),
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         
         # 다운로드할 파일 확장자
-        self.target_extensions = [
-            '.ipynb', '.zip', '.tar', '.gz', '.tar.gz', '.7z',
-            '.nc', '.netcdf', '.hdf', '.hdf5', '.grib', '.grib2'
-        ]
+        self.target_extensions = TARGET_EXTENSIONS
         
         # 알려진 파일 호스팅 패턴
-        self.file_hosting_patterns = [
-            r'github\.com/.*?/raw/',
-            r'github\.com/.*?/releases/download/',
-            r'gitlab\.com/.*?/-/raw/',
-            r'bitbucket\.org/.*?/raw/',
-            r'drive\.google\.com/.*?/download',
-            r'dropbox\.com/.*?\?dl=1',
-            r'zenodo\.org/record/',
-            r'figshare\.com/.*?/download',
-            r'data\.marine\.copernicus\.eu/.*?/download',
-            r'resources\.marine\.copernicus\.eu/.*?/download',
-            r'mercator-ocean\.fr/.*?/download',
-        ]
+        self.file_hosting_patterns = FILE_HOSTING_PATTERNS
         
     def is_downloadable_file(self, url: str) -> bool:
         """URL이 다운로드 가능한 파일인지 확인"""
-        url_lower = url.lower()
-        
-        # 확장자 확인
-        for ext in self.target_extensions:
-            if ext in url_lower:
-                return True
-                
-        # 다운로드 키워드 확인
-        download_keywords = ['download', 'export', 'get', 'fetch', 'retrieve']
-        for keyword in download_keywords:
-            if keyword in url_lower:
-                return True
-                
-        # 파일 호스팅 패턴 확인
-        for pattern in self.file_hosting_patterns:
-            if re.search(pattern, url, re.IGNORECASE):
-                return True
-                
-        return False
+        return _is_downloadable_url(url)
         
-    def extract_file_info(self, url: str, link_text: str = "") -> Dict:
-        """파일 정보 추출"""
-        parsed_url = urlparse(url)
-        path = unquote(parsed_url.path)
-        
-        # 파일명 추출
-        filename = path.split('/')[-1] if '/' in path else path
-        
-        # 파일명이 없거나 너무 짧으면 URL 해시 사용
-        if not filename or len(filename) < 3:
-            filename = hashlib.md5(url.encode()).hexdigest()[:8]
-            
-        # 확장자 추출
-        extension = None
-        for ext in self.target_extensions:
-            if ext in filename.lower():
-                extension = ext
-                break
-                
-        if not extension and 'download' in url.lower():
-            # HEAD 요청으로 실제 파일 타입 확인 시도
-            try:
-                head = self.session.head(url, allow_redirects=True, timeout=5)
-                content_type = head.headers.get('content-type', '')
-                content_disposition = head.headers.get('content-disposition', '')
-                
-                # Content-Disposition에서 파일명 추출
-                if 'filename=' in content_disposition:
-                    match = re.search(r'filename[^;=\n]*=(([\'"]).*?\2|[^\s]+)', content_disposition)
-                    if match:
-                        filename = match.group(1).strip('"\'')
-                        
-                # Content-Type에서 확장자 추측
-                if 'zip' in content_type:
-                    extension = '.zip'
-                elif 'notebook' in content_type or 'json' in content_type:
-                    extension = '.ipynb'
-                elif 'netcdf' in content_type:
-                    extension = '.nc'
-                    
-            except:
-                pass
-                
+    def extract_file_info_fast(self, url: str, link_text: str = "") -> Dict:
+        """파일 정보 추출 (URL만 사용, 네트워크 요청 없음)"""
+        filename, extension = _parse_file_url(url)
         return {
             'url': url,
             'filename': filename,
@@ -128,73 +352,161 @@ class DeepCopernicusScraper:
             'source_type': self.classify_source(url)
         }
         
+    def needs_probe(self, file_info: Dict) -> bool:
+        """URL로 확장자를 알 수 없는 다운로드 링크인지 확인"""
+        return not file_info['extension'] and 'download' in file_info['url'].lower()
+        
+    def probe_head(self, file_info: Dict) -> Dict:
+        """HEAD 요청으로 실제 파일명/타입 확인 (file_info를 갱신해 반환)"""
+        try:
+            head = self.session.head(file_info['url'], allow_redirects=True, timeout=5)
+            content_type = head.headers.get('content-type', '')
+            content_disposition = head.headers.get('content-disposition', '')
+            
+            # Content-Disposition에서 파일명 추출
+            if 'filename=' in content_disposition:
+                match = _FILENAME_RE.search(content_disposition)
+                if match:
+                    file_info['filename'] = match.group(1).strip('"\'')
+                    
+            # Content-Type에서 확장자 추측
+            if 'zip' in content_type:
+                file_info['extension'] = '.zip'
+            elif 'notebook' in content_type or 'json' in content_type:
+                file_info['extension'] = '.ipynb'
+            elif 'netcdf' in content_type:
+                file_info['extension'] = '.nc'
+                
+        except:
+            pass
+            
+        return file_info
+        
+    def probe_heads(self, file_infos: List[Dict]) -> List[Dict]:
+        """여러 링크의 HEAD 요청을 동시에 수행"""
+        if not file_infos:
+            return []
+        with ThreadPoolExecutor(max_workers=min(len(file_infos), self.max_workers)) as executor:
+            return list(executor.map(self.probe_head, file_infos))
+        
+    def extract_file_info(self, url: str, link_text: str = "") -> Dict:
+        """파일 정보 추출 (확장자를 모르는 다운로드 링크는 HEAD 요청으로 확인)"""
+        file_info = self.extract_file_info_fast(url, link_text)
+        if self.needs_probe(file_info):
+            self.probe_head(file_info)
+        return file_info
+        
     def classify_source(self, url: str) -> str:
         """URL 소스 분류"""
-        if 'github.com' in url:
-            return 'github'
-        elif 'gitlab.com' in url:
-            return 'gitlab'
-        elif 'copernicus' in url:
-            return 'copernicus'
-        elif 'mercator' in url:
-            return 'mercator'
-        elif 'zenodo.org' in url:
-            return 'zenodo'
-        else:
-            return 'other'
+        return _classify_url(url)
+            
+    def _get_repo_contents(self, api_url: str) -> Optional[List[Dict]]:
+        """
+        GitHub contents API 조회 (실행 중에는 URL당 한 번만 요청)
+        
+        이전 실행의 ETag가 있으면 If-None-Match로 보내 304 응답이면 저장된 목록을 재사용
+        (GitHub은 304 응답을 요청 한도에 포함하지 않음)
+        
+        Returns:
+            파일 목록 (경로가 없으면(404) None, 요청 한도 초과(403) 이후에는 빈 리스트)
+        """
+        with self._api_lock:
+            if api_url in self._api_missing:
+                return None
+            if api_url in self._api_checked:
+                return self._api_cache.get(api_url, {}).get('files', [])
+            cached = self._api_cache.get(api_url)
+            rate_limited = self._api_rate_limited
+            
+        if rate_limited:
+            return cached['files'] if cached else []
+            
+        headers = dict(GITHUB_API_HEADERS)
+        if cached and cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+            
+        files = []
+        try:
+            api_response = self.session.get(api_url, headers=headers, timeout=5)
+            if api_response.status_code == 304 and cached:
+                files = cached['files']
+            elif api_response.status_code == 200:
+                data = api_response.json()
+                if isinstance(data, list):
+                    files = [
+                        {'name': f.get('name', ''), 'download_url': f.get('download_url', '')}
+                        for f in data
+                    ]
+                with self._api_lock:
+                    self._api_cache[api_url] = {'etag': api_response.headers.get('ETag'), 'files': files}
+            elif api_response.status_code == 404:
+                with self._api_lock:
+                    self._api_missing.add(api_url)
+                return None
+            elif api_response.status_code == 403:
+                with self._api_lock:
+                    first = not self._api_rate_limited
+                    self._api_rate_limited = True
+                if first:
+                    print("  ⚠ GitHub API 요청 한도 초과 - 이번 실행에서는 API 조회를 중단합니다")
+                return cached['files'] if cached else []
+        except:
+            pass
+            
+        with self._api_lock:
+            self._api_checked.add(api_url)
+        return files
+        
+    def _load_api_cache(self) -> Dict:
+        """GitHub API 캐시 파일 로드"""
+        if self.api_cache_file and Path(self.api_cache_file).exists():
+            try:
+                with open(self.api_cache_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                pass
+        return {}
+        
+    def save_api_cache(self):
+        """GitHub API 캐시 파일 저장 (ETag와 파일 목록)"""
+        if not self.api_cache_file:
+            return
+        with open(self.api_cache_file, 'w', encoding='utf-8') as f:
+            json.dump(self._api_cache, f, indent=2, ensure_ascii=False)
             
     def find_github_resources(self, content: str, base_url: str) -> List[Dict]:
         """GitHub 저장소 링크에서 리소스 찾기"""
         resources = []
         
-        # GitHub 저장소 패턴
-        github_patterns = [
-            r'https?://github\.com/[\w\-]+/[\w\-]+(?:/tree/[\w\-]+)?',
-            r'https?://github\.com/[\w\-]+/[\w\-]+/blob/[\w\-]+/[\w\-/]+\.ipynb',
-        ]
-        
-        for pattern in github_patterns:
-            matches = re.findall(pattern, content)
+        for pattern in _GITHUB_PATTERNS:
+            # 같은 저장소가 여러 번 언급되어도 한 번만 처리
+            matches = dict.fromkeys(pattern.findall(content))
             for match in matches:
                 # blob을 raw로 변환
                 raw_url = match.replace('/blob/', '/raw/')
                 
                 # 저장소 메인 페이지인 경우, 일반적인 위치 확인
                 if '/tree/' not in match and '/blob/' not in match:
-                    # 일반적인 노트북 위치들
-                    common_paths = [
-                        '/raw/main/notebooks/',
-                        '/raw/master/notebooks/',
-                        '/raw/main/examples/',
-                        '/raw/master/examples/',
-                        '/raw/main/',
-                        '/raw/master/',
-                    ]
-                    
+                    # 일반적인 노트북 위치들 (main/master 구분 없이 API 경로는 3개)
                     repo_base = match.rstrip('/')
-                    for path in common_paths:
-                        # API를 통해 파일 목록 가져오기 시도
-                        api_url = repo_base.replace('github.com', 'api.github.com/repos') + '/contents'
-                        if 'notebooks' in path:
-                            api_url += '/notebooks'
-                        elif 'examples' in path:
-                            api_url += '/examples'
-                            
-                        try:
-                            api_response = self.session.get(api_url, timeout=5)
-                            if api_response.status_code == 200:
-                                files = api_response.json()
-                                for file in files:
-                                    if file.get('name', '').endswith('.ipynb'):
-                                        resources.append({
-                                            'url': file.get('download_url', ''),
-                                            'filename': file.get('name', ''),
-                                            'extension': '.ipynb',
-                                            'link_text': f"GitHub: {file.get('name', '')}",
-                                            'source_type': 'github'
-                                        })
-                        except:
-                            pass
+                    api_base = repo_base.replace('github.com', 'api.github.com/repos') + '/contents'
+                    for subpath in GITHUB_CONTENT_PATHS:
+                        files = self._get_repo_contents(api_base + subpath)
+                        if files is None:
+                            # 저장소 루트가 없으면 하위 경로도 없음
+                            if not subpath:
+                                break
+                            continue
+                        for file in files:
+                            name = file.get('name', '')
+                            if name.endswith('.ipynb'):
+                                resources.append({
+                                    'url': file.get('download_url', ''),
+                                    'filename': name,
+                                    'extension': '.ipynb',
+                                    'link_text': f"GitHub: {name}",
+                                    'source_type': 'github'
+                                })
                             
                 # 직접 .ipynb 링크인 경우
                 elif '.ipynb' in match:
@@ -202,23 +514,79 @@ class DeepCopernicusScraper:
                     
         return resources
         
-    def deep_crawl(self, url: str, depth: int = 0) -> List[Dict]:
-        """깊이 우선 크롤링"""
+    def fetch_page(self, url: str) -> Optional[bytes]:
+        """
+        페이지 본문 가져오기 (캐시가 있으면 신선한 캐시 사용, 오래된 캐시는 조건부 요청으로 재검증)
         
-        if depth > self.max_depth or url in self.visited_urls:
-            return []
+        Returns:
+            HTML 본문 (HTML이 아니거나 MAX_PAGE_BYTES보다 크면 None)
+        """
+        entry = self.page_cache.lookup(url) if self.page_cache else None
+        if entry and self.page_cache.is_fresh(entry):
+            return self.page_cache.read(entry)
+            
+        headers = self.page_cache.conditional_headers(entry) if entry else {}
+        response = self.session.get(url, timeout=15, headers=headers, stream=True)
+        if response.status_code == 304 and entry:
+            response.close()
+            self.page_cache.touch(url)
+            return self.page_cache.read(entry)
+        response.raise_for_status()
+        
+        # 본문을 읽기 전에 헤더로 HTML이 아니거나 너무 큰 응답은 건너뜀
+        content_type = response.headers.get('Content-Type', '')
+        content_length = int(response.headers.get('Content-Length') or 0)
+        if (content_type and 'html' not in content_type) or content_length > MAX_PAGE_BYTES:
+            response.close()
+            return None
             
-        self.visited_urls.add(url)
+        # Content-Length가 없는 경우에도 최대 크기까지만 읽음
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(chunk_size=65536):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > MAX_PAGE_BYTES:
+                response.close()
+                return None
+        content = b''.join(chunks)
+        
+        if self.page_cache:
+            self.page_cache.store(url, response, content)
+        return content
+        
+    def crawl_page(self, url: str, depth: int = 0) -> Tuple[List[Dict], List[str]]:
+        """
+        페이지 하나 크롤링 (하위 페이지는 따라가지 않음)
+        
+        Returns:
+            (발견한 리소스 리스트, 따라갈 하위 페이지 URL 리스트)
+        """
         found_resources = []
+        resource_urls = set()  # 이 페이지에서 이미 찾은 (또는 확인 대기 중인) URL
+        pending = []  # HEAD 확인이 필요한 링크 (페이지 파싱 후 한 번에 확인)
+        child_urls = []
+        
+        def collect(file_info: Dict, announce: bool = False):
+            if file_info['extension']:  # 확장자가 확인된 경우만
+                found_resources.append(file_info)
+                resource_urls.add(file_info['url'])
+                if announce:
+                    print(f"{'  ' * depth}  ✓ 발견: {file_info['filename']}")
+            elif self.needs_probe(file_info):
+                pending.append(file_info)
+                resource_urls.add(file_info['url'])
         
         print(f"{'  ' * depth}크롤링 (깊이 {depth}): {url[:80]}...")
         
         try:
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
+            content = self.fetch_page(url)
+            if content is None:
+                print(f"{'  ' * depth}  - HTML 아님/크기 초과, 건너뜀")
+                return found_resources, child_urls
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            content = response.text
+            # lxml 파서 (인코딩은 lxml이 바이트에서 직접 판별)
+            soup = BeautifulSoup(content, 'lxml')
             
             # 1. 직접적인 파일 링크 찾기
             all_links = soup.find_all('a', href=True)
@@ -233,35 +601,27 @@ class DeepCopernicusScraper:
                 
                 # 다운로드 가능한 파일인지 확인
                 if self.is_downloadable_file(absolute_url):
-                    file_info = self.extract_file_info(absolute_url, link.get_text(strip=True))
-                    if file_info['extension']:  # 확장자가 확인된 경우만
-                        found_resources.append(file_info)
-                        print(f"{'  ' * depth}  ✓ 발견: {file_info['filename']}")
+                    collect(self.extract_file_info_fast(absolute_url, link.get_text(strip=True)), announce=True)
                         
+            # 정규식 검색 대상은 전체 HTML 대신 링크 주소와 <script> 내용으로 한정
+            script_text = "\n".join(script.get_text() for script in soup.find_all('script'))
+            href_text = "\n".join(link['href'] for link in all_links)
+            
             # 2. GitHub 리소스 찾기
-            github_resources = self.find_github_resources(content, url)
+            github_resources = self.find_github_resources(href_text + "\n" + script_text, url)
             found_resources.extend(github_resources)
+            resource_urls.update(r['url'] for r in github_resources)
             
             # 3. JavaScript에 숨겨진 URL 찾기
-            script_patterns = [
-                r'["\']url["\']\s*:\s*["\']([^"\']+\.(?:ipynb|zip|tar|gz))["\']',
-                r'download["\']?\s*:\s*["\']([^"\']+)["\']',
-                r'href\s*=\s*["\']([^"\']+\.(?:ipynb|zip|tar|gz))["\']',
-            ]
-            
-            for pattern in script_patterns:
-                matches = re.findall(pattern, content, re.IGNORECASE)
+            for pattern in _SCRIPT_PATTERNS:
+                matches = pattern.findall(script_text)
                 for match in matches:
                     absolute_url = urljoin(url, match)
-                    if absolute_url not in [r['url'] for r in found_resources]:
-                        file_info = self.extract_file_info(absolute_url, "JavaScript Link")
-                        if file_info['extension']:
-                            found_resources.append(file_info)
+                    if absolute_url not in resource_urls:
+                        collect(self.extract_file_info_fast(absolute_url, "JavaScript Link"))
                             
             # 4. 데이터 속성에서 URL 찾기
-            data_links = soup.find_all(attrs={'data-download': True})
-            data_links.extend(soup.find_all(attrs={'data-href': True}))
-            data_links.extend(soup.find_all(attrs={'data-url': True}))
+            data_links = soup.select('[data-download], [data-href], [data-url]')
             
             for elem in data_links:
                 for attr in ['data-download', 'data-href', 'data-url']:
@@ -269,42 +629,114 @@ class DeepCopernicusScraper:
                         data_url = elem[attr]
                         absolute_url = urljoin(url, data_url)
                         if self.is_downloadable_file(absolute_url):
-                            file_info = self.extract_file_info(absolute_url, "Data Attribute Link")
-                            if file_info['extension']:
-                                found_resources.append(file_info)
+                            collect(self.extract_file_info_fast(absolute_url, "Data Attribute Link"))
                                 
+            # 확장자를 모르는 다운로드 링크는 HEAD 요청을 동시에 보내 확인
+            for file_info in self.probe_heads(pending):
+                if file_info['extension']:
+                    found_resources.append(file_info)
+                    print(f"{'  ' * depth}  ✓ 발견: {file_info['filename']}")
+                    
             # 5. 하위 페이지 크롤링 (관련 페이지만)
             if depth < self.max_depth:
-                # 관련 키워드가 있는 링크만 따라가기
-                relevant_keywords = [
-                    'tutorial', 'notebook', 'example', 'demo', 'training',
-                    'learn', 'education', 'material', 'resource', 'download',
-                    'data', 'dataset', 'file', 'github', 'gitlab', 'code'
-                ]
+                parent_netloc = _netloc(url)
                 
-                for link in all_links[:20]:  # 최대 20개 링크만
-                    href = link.get('href', '')
-                    link_text = link.get_text(strip=True).lower()
-                    
-                    # 관련 키워드 확인
-                    if any(keyword in link_text or keyword in href.lower() for keyword in relevant_keywords):
+                def candidates():
+                    """관련 키워드가 있는 같은 도메인의 페이지 링크 (DOM 순서대로 지연 생성)"""
+                    for link in all_links:
+                        href = link['href']
+                        if not (_LINK_KEYWORD_RE.search(href) or _LINK_KEYWORD_RE.search(link.get_text(strip=True))):
+                            continue
                         absolute_url = urljoin(url, href)
                         
                         # 외부 도메인 제외
-                        if urlparse(absolute_url).netloc != urlparse(url).netloc:
+                        if _netloc(absolute_url) != parent_netloc:
                             continue
                             
-                        # 이미 방문한 URL 제외
-                        if absolute_url not in self.visited_urls:
-                            # 재귀적으로 크롤링
-                            sub_resources = self.deep_crawl(absolute_url, depth + 1)
-                            found_resources.extend(sub_resources)
+                        # 확장자로 파일임이 확실한 링크는 페이지로 크롤링하지 않음
+                        if _parse_file_url(absolute_url)[1]:
+                            continue
+                        yield absolute_url
+                        
+                # 이미 방문한 URL은 deep_crawl에서 제외
+                child_urls.extend(itertools.islice(candidates(), MAX_CHILD_LINKS))
                             
         except Exception as e:
             print(f"{'  ' * depth}  ✗ 에러: {str(e)[:50]}")
             
+        return found_resources, child_urls
+        
+    def deep_crawl(self, urls: Union[str, List[str]], depth: int = 0) -> List[Dict]:
+        """
+        작업 큐 방식 병렬 크롤링
+        
+        페이지 하나가 끝나는 즉시 그 하위 링크를 스레드 풀에 제출하므로,
+        느린 페이지가 있어도 다른 페이지의 하위 탐색이 기다리지 않는다.
+        방문 표시는 작업을 제출하기 전에 메인 스레드에서만 하므로 락이 필요 없다.
+        
+        Parameters:
+            urls: 시작 URL (또는 URL 리스트)
+            depth: 시작 깊이
+        """
+        start_urls = [urls] if isinstance(urls, str) else list(urls)
+        found_resources = []
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = {}
+            
+            def submit(url: str, url_depth: int):
+                # 방문하지 않은 URL만 제출
+                if url_depth <= self.max_depth and url not in self.visited_urls:
+                    self.visited_urls.add(url)
+                    pending[executor.submit(self.crawl_page, url, url_depth)] = url_depth
+                    
+            for url in start_urls:
+                submit(url, depth)
+                
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    page_depth = pending.pop(future)
+                    resources, child_urls = future.result()
+                    found_resources.extend(resources)
+                    self._stream_resources(resources)
+                    for child_url in child_urls:
+                        submit(child_url, page_depth + 1)
+                        
+                # 디스크에 바로 반영해 중간에 멈춰도 결과가 남도록
+                if self._results_fp:
+                    self._results_fp.flush()
+                    
         return found_resources
         
+    def _stream_resources(self, resources: List[Dict]):
+        """새로 찾은 리소스를 NDJSON 결과 파일에 한 줄씩 기록 (URL 기준 중복 제외)"""
+        if not self._results_fp:
+            return
+        for resource in resources:
+            if resource['url'] not in self._streamed_urls:
+                self._streamed_urls.add(resource['url'])
+                self._results_fp.write(_json_bytes(resource) + b'\n')
+                
+    def prefetch_dns(self, hosts: List[str], port: int = 443):
+        """
+        여러 호스트의 DNS 조회를 병렬로 미리 수행
+        
+        시스템 리졸버 캐시(systemd-resolved, nscd 등)를 데워 첫 요청의 DNS 지연을 줄인다.
+        """
+        hosts = list(dict.fromkeys(h for h in hosts if h))
+        if not hosts:
+            return
+            
+        def resolve(host: str):
+            try:
+                socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+            except OSError:
+                pass
+                
+        with ThreadPoolExecutor(max_workers=len(hosts)) as executor:
+            list(executor.map(resolve, hosts))
+            
     def scrape_copernicus_resources(self) -> Dict:
         """Copernicus Marine Service 리소스 스크래핑"""
         
@@ -323,13 +755,22 @@ class DeepCopernicusScraper:
             "https://github.com/mercator-ocean",
         ]
         
-        all_resources = []
+        # 시작 호스트와 이후 접속할 GitHub 호스트의 DNS를 미리 병렬 조회
+        self.prefetch_dns([urlsplit(u).hostname for u in start_urls] + EXTRA_HOSTS)
         
-        for url in start_urls:
-            print(f"\n시작점: {url}")
-            print("-" * 40)
-            resources = self.deep_crawl(url, 0)
-            all_resources.extend(resources)
+        print(f"\n시작점 {len(start_urls)}개 병렬 크롤링 (스레드 {self.max_workers}개)")
+        print("-" * 40)
+        if self.results_file:
+            self._results_fp = open(self.results_file, 'wb', buffering=1 << 20)
+        try:
+            all_resources = self.deep_crawl(start_urls, 0)
+        finally:
+            if self._results_fp:
+                self._results_fp.close()
+                self._results_fp = None
+        self.save_api_cache()
+        if self.page_cache:
+            self.page_cache.save_index()
             
         # 중복 제거
         unique_resources = []
@@ -358,80 +799,111 @@ class DeepCopernicusScraper:
             
         return results
         
-    def download_resources(self, resources: List[Dict], output_dir: str = "downloads") -> List[Dict]:
-        """리소스 다운로드"""
+    def _download_one(self, index: int, resource: Dict, output_path: Path, claimed: Set[Path],
+                      on_progress=None) -> Dict:
+        """리소스 하나 다운로드 (스레드 풀 작업 단위, 진행률은 PROGRESS_BYTES마다 보고)"""
+        try:
+            # 파일명 정리
+            safe_filename = _safe_filename(resource['filename'])
+            if not safe_filename:
+                safe_filename = f"file_{index}"
+                
+            # 확장자 추가
+            if resource['extension'] and not safe_filename.endswith(resource['extension']):
+                safe_filename += resource['extension']
+                
+            filepath = output_path / safe_filename
+            
+            # 이미 존재하거나 다른 작업이 같은 파일을 받는 중이면 스킵
+            with self._download_lock:
+                duplicate = filepath in claimed
+                claimed.add(filepath)
+            if duplicate or filepath.exists():
+                return {
+                    'resource': resource,
+                    'status': 'skipped',
+                    'filepath': str(filepath)
+                }
+                
+            # 다운로드
+            response = self.session.get(resource['url'], stream=True, timeout=30)
+            response.raise_for_status()
+            
+            # 파일 저장
+            # 복사 루프는 shutil(C 레벨)에 맡기고, 바이트 수는 래퍼에서 집계
+            response.raw.decode_content = True
+            with open(filepath, 'wb') as f:
+                writer = _ProgressWriter(f, on_progress)
+                shutil.copyfileobj(response.raw, writer, length=COPY_BUFFER_BYTES)
+                writer.flush_progress()
+            downloaded = writer.written
+                
+            return {
+                'resource': resource,
+                'status': 'success',
+                'filepath': str(filepath),
+                'size': downloaded
+            }
+            
+        except Exception as e:
+            return {
+                'resource': resource,
+                'status': 'failed',
+                'error': str(e)
+            }
+            
+    def download_resources(self, resources: List[Dict], output_dir: str = "downloads",
+                           max_workers: int = 16) -> List[Dict]:
+        """
+        리소스 병렬 다운로드
+        
+        Parameters:
+            resources: 다운로드할 리소스 리스트
+            output_dir: 저장 디렉토리
+            max_workers: 동시 다운로드 스레드 수
+            
+        Returns:
+            리소스 순서대로 정렬된 다운로드 결과 리스트
+        """
         
         output_path = Path(output_dir)
         output_path.mkdir(exist_ok=True)
         
         print("\n" + "="*60)
-        print("리소스 다운로드")
+        print(f"리소스 다운로드 ({len(resources)}개, 스레드 {max_workers}개)")
         print("="*60)
         
         download_results = []
+        claimed = set()
         
-        for i, resource in enumerate(resources, 1):
-            print(f"\n[{i}/{len(resources)}] {resource['filename']}")
-            print(f"  URL: {resource['url'][:80]}...")
+        # 전체 바이트 진행률 (스레드들이 PROGRESS_BYTES 단위로 갱신)
+        byte_bar = tqdm(desc="수신", unit='B', unit_scale=True, unit_divisor=1024, position=1)
+        byte_lock = threading.Lock()
+        
+        def on_progress(nbytes: int):
+            with byte_lock:
+                byte_bar.update(nbytes)
+                
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._download_one, i, resource, output_path, claimed, on_progress)
+                for i, resource in enumerate(resources, 1)
+            ]
             
-            try:
-                # 파일명 정리
-                safe_filename = re.sub(r'[^\w\-_\.]', '_', resource['filename'])
-                if not safe_filename:
-                    safe_filename = f"file_{i}"
-                    
-                # 확장자 추가
-                if resource['extension'] and not safe_filename.endswith(resource['extension']):
-                    safe_filename += resource['extension']
+            with tqdm(total=len(futures), desc="다운로드", position=0) as pbar:
+                for future in futures:
+                    result = future.result()
+                    download_results.append(result)
                     
-                filepath = output_path / safe_filename
-                
-                # 이미 존재하면 스킵
-                if filepath.exists():
-                    print(f"  ⚠ 이미 존재: {filepath}")
-                    download_results.append({
-                        'resource': resource,
-                        'status': 'skipped',
-                        'filepath': str(filepath)
-                    })
-                    continue
+                    if result['status'] == 'success':
+                        pbar.set_postfix({'last': f"{result['size'] / 1024:.1f}KB"})
+                    elif result['status'] == 'skipped':
+                        tqdm.write(f"  ⚠ 이미 존재: {result['filepath']}")
+                    else:
+                        tqdm.write(f"  ✗ 실패: {result['resource']['filename']} - {result['error'][:100]}")
+                    pbar.update(1)
                     
-                # 다운로드
-                response = self.session.get(resource['url'], stream=True, timeout=30)
-                response.raise_for_status()
-                
-                # 파일 저장
-                total_size = int(response.headers.get('content-length', 0))
-                downloaded = 0
-                
-                with open(filepath, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
-                            downloaded += len(chunk)
-                            
-                            # 진행 상황 표시
-                            if total_size > 0:
-                                progress = (downloaded / total_size) * 100
-                                print(f"\r  다운로드: {progress:.1f}%", end='')
-                                
-                print(f"\n  ✓ 완료: {filepath} ({downloaded / 1024:.1f} KB)")
-                
-                download_results.append({
-                    'resource': resource,
-                    'status': 'success',
-                    'filepath': str(filepath),
-                    'size': downloaded
-                })
-                
-            except Exception as e:
-                print(f"  ✗ 실패: {str(e)[:100]}")
-                download_results.append({
-                    'resource': resource,
-                    'status': 'failed',
-                    'error': str(e)
-                })
-                
+        byte_bar.close()
         return download_results
 
 
@@ -439,7 +911,12 @@ def main():
     """메인 실행 함수"""
     
     # 스크래퍼 초기화
-    scraper = DeepCopernicusScraper(max_depth=2)
+    scraper = DeepCopernicusScraper(
+        max_depth=2,
+        api_cache_file='github_api_cache.json',
+        cache_dir='page_cache',
+        results_file='deep_scraping_results.ndjson'
+    )
     
     # 리소스 찾기
     results = scraper.scrape_copernicus_resources()
@@ -459,8 +936,8 @@ def main():
         print(f"  {source}: {count}개")
         
     # 결과 저장
-    with open('deep_scraping_results.json', 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    with open('deep_scraping_results.json', 'wb') as f:
+        f.write(_json_bytes(results, indent=True))
     print(f"\n결과 저장: deep_scraping_results.json")
     
     # .ipynb와 .zip 파일만 필터링
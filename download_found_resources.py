@@ -5,6 +5,7 @@ Download found resources from smart_scraping_results.json
 
 import json
 import requests
+import shutil
 from pathlib import Path
 
 def download_resources():
@@ -41,10 +42,9 @@ def download_resources():
         response = requests.get(target_resource['url'], stream=True, timeout=60)
         response.raise_for_status()
         
+        response.raw.decode_content = True
         with open(filepath, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
+            shutil.copyfileobj(response.raw, f, length=1024 * 1024)
         
         actual_size = filepath.stat().st_size / 1024
         print(f"✓ 다운로드 완료: {actual_size:.1f} KB")
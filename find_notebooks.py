@@ -2,29 +2,313 @@
 """
 Find Jupyter notebooks from various sources
 더 많은 소스에서 노트북 찾기
+
+GITHUB_TOKEN 환경 변수에 개인 액세스 토큰을 넣으면 GitHub API 요청에 인증 헤더를 붙인다.
+(코드 검색 API는 인증이 필요하며, 요청 한도도 시간당 60회에서 5000회로 늘어남)
 """
 
+import os
 import requests
+from requests.adapters import HTTPAdapter
 import json
 from pathlib import Path
 import re
+import time
+import threading
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from collections import namedtuple
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+try:
+    import httpx
+    import h2  # noqa: F401 (httpx의 HTTP/2 지원에 필요)
+    _HAS_HTTP2 = True
+except ImportError:
+    _HAS_HTTP2 = False
+
+# GitHub API 요청 한도 초과 시 재시도 설정
+MAX_RETRIES = 3
+MAX_BACKOFF = 60
+
+# GitHubClient.get 결과 - 호출하는 쪽은 status_code와 content만 사용
+# (304 응답에 캐시된 본문을 담을 때 응답 객체 내부를 고치지 않도록 별도 객체로 반환)
+ApiResponse = namedtuple('ApiResponse', ['status_code', 'content', 'headers'])
+
+def _json_loads(data):
+    """JSON 파싱 (orjson이 있으면 사용)"""
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
 
-def find_copernicus_notebooks():
-    """다양한 소스에서 Copernicus 관련 노트북 찾기"""
+def _json_bytes(obj, indent=False):
+    """JSON 직렬화 (orjson이 있으면 사용, 한글은 그대로 UTF-8로 저장)"""
+    if _HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+@lru_cache(maxsize=None)
+def get_session():
+    """
+    검색과 다운로드가 함께 쓰는 requests.Session
     
+    같은 호스트(api.github.com, raw.githubusercontent.com)로의 연결과 TLS 세션을 재사용한다.
+    """
     session = requests.Session()
     session.headers.update({
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
     })
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+@lru_cache(maxsize=None)
+def get_api_client():
+    """
+    GitHub API 요청용 HTTP 클라이언트
+    
+    httpx와 h2가 설치되어 있으면 HTTP/2 클라이언트를 써서 동시 요청을 api.github.com과의
+    연결 하나에 다중화하고, 없으면 get_session()의 requests.Session을 그대로 쓴다.
+    """
+    if not _HAS_HTTP2:
+        return get_session()
+    return httpx.Client(
+        http2=True,
+        headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'},
+        limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        timeout=15,
+        follow_redirects=True
+    )
+
+class GitHubClient:
+    """
+    동시 요청 수를 제한하고 요청 한도(403/429) 응답을 재시도하는 GitHub API 클라이언트
+    
+    requests.Session.get과 같은 방식으로 호출하며, 결과는 ApiResponse(status_code, content, headers)로 반환한다.
+    cache_file을 주면 응답을 ETag와 함께 저장해 두고 다음 실행에서 If-None-Match로 보내,
+    304 응답이면 저장된 본문을 사용한다 (GitHub은 304 응답을 요청 한도에 포함하지 않음).
+    """
+    
+    def __init__(self, session, max_concurrent=8, cache_file=None, cache_ttl=86400, token=None):
+        """
+        Parameters:
+            session: 요청에 사용할 HTTP 클라이언트 (requests.Session 또는 httpx.Client)
+            max_concurrent: 동시에 보낼 최대 API 요청 수
+            cache_file: ETag 캐시를 저장할 JSON 파일 (None이면 캐시 안 함)
+            cache_ttl: 캐시 항목 보관 시간 (초, 지나면 버림)
+            token: GitHub 개인 액세스 토큰 (API 요청에만 붙임)
+        """
+        self.session = session
+        self.auth_headers = {'Authorization': f"Bearer {token}"} if token else {}
+        self.sem = threading.BoundedSemaphore(max_concurrent)
+        self.cache_file = cache_file
+        self.cache_ttl = cache_ttl
+        self._cache_lock = threading.Lock()
+        self.cache = self._load_cache()
+        
+    def _load_cache(self):
+        """ETag 캐시 파일 로드 (보관 시간이 지난 항목은 제외)"""
+        if not self.cache_file or not Path(self.cache_file).exists():
+            return {}
+        try:
+            cache = _json_loads(Path(self.cache_file).read_bytes())
+        except:
+            return {}
+        now = time.time()
+        return {k: v for k, v in cache.items() if now - v.get('date', 0) < self.cache_ttl}
+        
+    def save_cache(self):
+        """ETag 캐시 파일 저장"""
+        if not self.cache_file:
+            return
+        with self._cache_lock:
+            with open(self.cache_file, 'wb') as f:
+                f.write(_json_bytes(self.cache))
+                
+    def _retry_delay(self, response, attempt):
+        """Retry-After / X-RateLimit-Reset 헤더로 대기 시간 계산 (없으면 지수 백오프)"""
+        retry_after = response.headers.get('Retry-After')
+        if retry_after and retry_after.isdigit():
+            return int(retry_after)
+        reset = response.headers.get('X-RateLimit-Reset')
+        if reset and reset.isdigit() and response.headers.get('X-RateLimit-Remaining') == '0':
+            return max(0, int(reset) - time.time())
+        return 2 ** attempt
+        
+    def _request(self, url, **kwargs):
+        """GET 요청 (요청 한도 초과면 최대 MAX_RETRIES번 대기 후 재시도)"""
+        kwargs['headers'] = {**self.auth_headers, **(kwargs.get('headers') or {})}
+        for attempt in range(MAX_RETRIES + 1):
+            with self.sem:
+                response = self.session.get(url, **kwargs)
+                
+            if response.status_code not in (403, 429) or attempt == MAX_RETRIES:
+                return response
+                
+            # 한도 해제까지 너무 오래 기다려야 하면 포기
+            delay = self._retry_delay(response, attempt)
+            if delay > MAX_BACKOFF:
+                return response
+            time.sleep(delay)
+            
+        return response
+        
+    def get(self, url, params=None, **kwargs):
+        """캐시를 거치는 GET 요청"""
+        if not self.cache_file:
+            response = self._request(url, params=params, **kwargs)
+            return ApiResponse(response.status_code, response.content, response.headers)
+            
+        key = requests.Request('GET', url, params=params).prepare().url
+        with self._cache_lock:
+            cached = self.cache.get(key)
+            
+        headers = dict(kwargs.pop('headers', None) or {})
+        if cached and cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+            
+        response = self._request(url, params=params, headers=headers, **kwargs)
+        
+        if response.status_code == 304 and cached:
+            # 저장된 본문을 200 결과로 반환
+            with self._cache_lock:
+                cached['date'] = time.time()
+            return ApiResponse(200, cached['body'].encode('utf-8'), response.headers)
+            
+        if response.status_code == 200 and response.headers.get('ETag'):
+            with self._cache_lock:
+                self.cache[key] = {
+                    'etag': response.headers['ETag'],
+                    'body': response.text,
+                    'date': time.time()
+                }
+                
+        return ApiResponse(response.status_code, response.content, response.headers)
+
+def _check_official_repo(session, org, repo):
+    """공식 저장소 존재 확인 후 노트북 검색 (저장소가 없으면 None)"""
+    api_url = f"https://api.github.com/repos/{org}/{repo}"
+    notebooks = []
+    
+    try:
+        response = session.get(api_url, timeout=5)
+        if response.status_code != 200:
+            return None
+        # contents API로 파일 목록 가져오기
+        contents_url = f"{api_url}/contents"
+        search_for_notebooks(session, contents_url, notebooks, org, repo)
+    except:
+        return None
+        
+    return notebooks
+
+def _search_code(session, query):
+    """GitHub 코드 검색 한 건 실행 (상태 코드, 노트북 리스트) 반환"""
+    # GitHub 검색 API
+    search_url = "https://api.github.com/search/code"
+    params = {
+        'q': query,
+        'per_page': 5,
+        'sort': 'indexed',
+        'order': 'desc'
+    }
+    
+    response = session.get(search_url, params=params, timeout=10)
+    notebooks = []
+    
+    if response.status_code == 200:
+        data = _json_loads(response.content)
+        items = data.get('items', [])
+        
+        for item in items:
+            # raw URL 생성
+            html_url = item.get('html_url', '')
+            if html_url and '.ipynb' in html_url:
+                raw_url = convert_to_raw_url(html_url)
+                
+                notebooks.append({
+                    'name': item.get('name', 'notebook.ipynb'),
+                    'url': raw_url,
+                    'repo': item.get('repository', {}).get('full_name', 'unknown'),
+                    'path': item.get('path', ''),
+                    'size': item.get('size', 0)
+                })
+                
+    return response.status_code, notebooks
+
+def _list_known_repo(session, repo_url, repo_name):
+    """알려진 저장소 디렉토리에서 노트북 목록 가져오기"""
+    notebooks = []
     
-    found_notebooks = []
+    try:
+        response = session.get(repo_url, timeout=10)
+        if response.status_code == 200:
+            items = _json_loads(response.content)
+            
+            for item in items:
+                name = item.get('name') or ''
+                if name.endswith('.ipynb'):
+                    notebooks.append({
+                        'name': name,
+                        'url': item.get('download_url'),
+                        'repo': repo_name,
+                        'path': item.get('path'),
+                        'size': item.get('size', 0)
+                    })
+    except:
+        pass
+        
+    return notebooks
+
+def find_copernicus_notebooks(max_workers=16, cache_file='github_etag_cache.json',
+                              results_file='found_notebooks.jsonl'):
+    """
+    다양한 소스에서 Copernicus 관련 노트북 찾기
+    
+    공식 저장소 확인, 코드 검색, 알려진 저장소 조회를 모두 스레드 풀에 한 번에 제출해
+    GitHub API 응답 대기 시간을 겹치고, 결과는 원래 순서대로 출력한다.
+    
+    Parameters:
+        max_workers: 동시에 보낼 최대 요청 수
+        cache_file: GitHub API 응답 ETag 캐시 파일 (None이면 캐시 안 함)
+        results_file: 발견한 노트북을 바로 한 줄씩 기록할 JSON Lines 파일 (None이면 기록 안 함)
+    """
+    
+    token = os.environ.get('GITHUB_TOKEN')
+    if not token:
+        print("⚠ GITHUB_TOKEN이 없어 인증 없이 요청합니다 (코드 검색이 제한될 수 있음)")
+    client = GitHubClient(get_api_client(), cache_file=cache_file, token=token)
+    
+    # URL -> 노트북 정보 (처음 발견한 항목만 유지)
+    found_notebooks = {}
+    total_found = 0
+    
+    # 중간에 멈춰도 결과가 남도록 발견 즉시 기록
+    out = open(results_file, 'wb', buffering=8192) if results_file else None
+    
+    def add_notebooks(notebooks):
+        nonlocal total_found
+        total_found += len(notebooks)
+        for nb in notebooks:
+            if nb['url'] not in found_notebooks:
+                found_notebooks[nb['url']] = nb
+                if out:
+                    out.write(_json_bytes(nb) + b"\n")
+        if out:
+            out.flush()
     
     print("="*60)
     print("Copernicus Marine 노트북 검색")
     print("="*60)
     
     # 1. Copernicus Marine Toolbox 공식 저장소 (새로운 URL)
-    print("\n1. 공식 저장소 검색...")
     official_repos = [
         # 가능한 조직명들
         ("copernicus-marine", "toolbox"),
@@ -35,22 +319,7 @@ def find_copernicus_notebooks():
         ("mercator-ocean-international", "notebooks"),
     ]
     
-    for org, repo in official_repos:
-        api_url = f"https://api.github.com/repos/{org}/{repo}"
-        print(f"  체크: {org}/{repo}")
-        
-        try:
-            response = session.get(api_url, timeout=5)
-            if response.status_code == 200:
-                print(f"    ✓ 저장소 발견!")
-                # contents API로 파일 목록 가져오기
-                contents_url = f"{api_url}/contents"
-                search_for_notebooks(session, contents_url, found_notebooks, org, repo)
-        except:
-            pass
-    
     # 2. GitHub 코드 검색 (더 구체적인 검색어)
-    print("\n2. GitHub 코드 검색...")
     search_queries = [
         "copernicus marine extension:ipynb",
         "cmems extension:ipynb", 
@@ -58,50 +327,7 @@ def find_copernicus_notebooks():
         "mercator ocean extension:ipynb"
     ]
     
-    for query in search_queries:
-        print(f"  검색: {query}")
-        
-        try:
-            # GitHub 검색 API
-            search_url = "https://api.github.com/search/code"
-            params = {
-                'q': query,
-                'per_page': 5,
-                'sort': 'indexed',
-                'order': 'desc'
-            }
-            
-            response = session.get(search_url, params=params, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                items = data.get('items', [])
-                
-                for item in items:
-                    # raw URL 생성
-                    html_url = item.get('html_url', '')
-                    if html_url and '.ipynb' in html_url:
-                        raw_url = convert_to_raw_url(html_url)
-                        
-                        found_notebooks.append({
-                            'name': item.get('name', 'notebook.ipynb'),
-                            'url': raw_url,
-                            'repo': item.get('repository', {}).get('full_name', 'unknown'),
-                            'path': item.get('path', ''),
-                            'size': item.get('size', 0)
-                        })
-                        
-                print(f"    ✓ {len(items)} 노트북 발견")
-                
-            elif response.status_code == 403:
-                print(f"    ⚠ API 제한")
-                break
-                
-        except Exception as e:
-            print(f"    ✗ 에러: {str(e)[:50]}")
-    
     # 3. 알려진 교육 자료 저장소
-    print("\n3. 알려진 교육 저장소...")
     known_repos = [
         # 해양 데이터 분석 교육 자료
         "https://api.github.com/repos/pangeo-data/pangeo-tutorial/contents",
@@ -110,32 +336,51 @@ def find_copernicus_notebooks():
         "https://api.github.com/repos/xarray-contrib/xarray-tutorial/contents/workshops",
     ]
     
-    for repo_url in known_repos:
-        repo_name = repo_url.split('/repos/')[1].split('/contents')[0]
-        print(f"  체크: {repo_name}")
-        
-        try:
-            response = session.get(repo_url, timeout=10)
-            if response.status_code == 200:
-                items = response.json()
-                notebook_count = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        official_futures = [
+            executor.submit(_check_official_repo, client, org, repo)
+            for org, repo in official_repos
+        ]
+        search_futures = [executor.submit(_search_code, client, query) for query in search_queries]
+        known_futures = []
+        for repo_url in known_repos:
+            repo_name = repo_url.split('/repos/')[1].split('/contents')[0]
+            known_futures.append((repo_name, executor.submit(_list_known_repo, client, repo_url, repo_name)))
+            
+        print("\n1. 공식 저장소 검색...")
+        for (org, repo), future in zip(official_repos, official_futures):
+            print(f"  체크: {org}/{repo}")
+            notebooks = future.result()
+            if notebooks is not None:
+                print(f"    ✓ 저장소 발견!")
+                add_notebooks(notebooks)
+                
+        print("\n2. GitHub 코드 검색...")
+        for query, future in zip(search_queries, search_futures):
+            print(f"  검색: {query}")
+            
+            try:
+                status_code, notebooks = future.result()
                 
-                for item in items:
-                    if item.get('name', '').endswith('.ipynb'):
-                        found_notebooks.append({
-                            'name': item.get('name'),
-                            'url': item.get('download_url'),
-                            'repo': repo_name,
-                            'path': item.get('path'),
-                            'size': item.get('size', 0)
-                        })
-                        notebook_count += 1
-                        
-                if notebook_count > 0:
-                    print(f"    ✓ {notebook_count} 노트북 발견")
+                if status_code == 200:
+                    add_notebooks(notebooks)
+                    print(f"    ✓ {len(notebooks)} 노트북 발견")
+                elif status_code == 403:
+                    print(f"    ⚠ API 제한")
                     
-        except:
-            pass
+            except Exception as e:
+                print(f"    ✗ 에러: {str(e)[:50]}")
+                
+        print("\n3. 알려진 교육 저장소...")
+        for repo_name, future in known_futures:
+            print(f"  체크: {repo_name}")
+            notebooks = future.result()
+            add_notebooks(notebooks)
+            
+            if notebooks:
+                print(f"    ✓ {len(notebooks)} 노트북 발견")
+                
+    client.save_cache()
     
     # 4. Binder/nbviewer에서 인기 있는 노트북
     print("\n4. 추가 소스 검색...")
@@ -149,36 +394,33 @@ def find_copernicus_notebooks():
     for url in binder_examples:
         if 'ocean' in url.lower() or 'marine' in url.lower() or 'copernicus' in url.lower():
             name = url.split('/')[-1]
-            found_notebooks.append({
+            add_notebooks([{
                 'name': name,
                 'url': url,
                 'repo': 'binder-examples',
                 'path': name,
                 'size': 0
-            })
+            }])
+    
+    if out:
+        out.close()
     
     # 결과 정리
     print("\n" + "="*60)
     print("검색 결과")
     print("="*60)
-    print(f"총 {len(found_notebooks)}개 노트북 발견")
-    
-    # 중복 제거
-    unique_notebooks = []
-    seen_urls = set()
+    print(f"총 {total_found}개 노트북 발견")
     
-    for nb in found_notebooks:
-        if nb['url'] not in seen_urls:
-            seen_urls.add(nb['url'])
-            unique_notebooks.append(nb)
+    # 중복은 발견 시점에 이미 제거됨
+    unique_notebooks = list(found_notebooks.values())
     
     print(f"중복 제거 후: {len(unique_notebooks)}개")
     
     # 결과 저장
-    with open('found_notebooks.json', 'w', encoding='utf-8') as f:
-        json.dump(unique_notebooks, f, indent=2, ensure_ascii=False)
+    with open('found_notebooks.json', 'wb') as f:
+        f.write(_json_bytes(unique_notebooks, indent=True))
     
-    print(f"\n결과 저장: found_notebooks.json")
+    print(f"\n결과 저장: found_notebooks.json" + (f", {results_file}" if results_file else ""))
     
     # 상위 10개 출력
     if unique_notebooks:
@@ -199,21 +441,26 @@ def search_for_notebooks(session, contents_url, found_list, org, repo, path="",
     try:
         response = session.get(contents_url, timeout=10)
         if response.status_code == 200:
-            items = response.json()
+            items = _json_loads(response.content)
+            
+            repo_name = f"{org}/{repo}"
             
             for item in items:
-                if item.get('type') == 'file' and item.get('name', '').endswith('.ipynb'):
+                name = item.get('name') or ''
+                item_type = item.get('type')
+                
+                if item_type == 'file' and name.endswith('.ipynb'):
                     found_list.append({
-                        'name': item.get('name'),
+                        'name': name,
                         'url': item.get('download_url'),
-                        'repo': f"{org}/{repo}",
+                        'repo': repo_name,
                         'path': item.get('path'),
                         'size': item.get('size', 0)
                     })
-                elif item.get('type') == 'dir' and depth < max_depth:
+                elif item_type == 'dir' and depth < max_depth:
                     # 관련 디렉토리만 탐색
-                    dir_name = item.get('name', '').lower()
-                    if any(keyword in dir_name for keyword in ['notebook', 'example', 'tutorial', 'demo']):
+                    dir_name = name.lower()
+                    if 'notebook' in dir_name or 'example' in dir_name or 'tutorial' in dir_name or 'demo' in dir_name:
                         sub_url = item.get('url')
                         if sub_url:
                             search_for_notebooks(session, sub_url, found_list, org, repo, 
@@ -230,8 +477,37 @@ def convert_to_raw_url(github_url):
     
     return raw_url
 
-def download_notebooks(notebooks, max_downloads=3):
-    """노트북 다운로드"""
+def _download_notebook(session, url, filepath):
+    """노트북 하나를 스트리밍으로 저장하고 크기(KB) 반환"""
+    with session.get(url, stream=True, timeout=30) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        with open(filepath, 'wb') as f:
+            shutil.copyfileobj(response.raw, f, length=64 * 1024)
+            
+    return filepath.stat().st_size / 1024
+
+def _head_size(session, url):
+    """HEAD 요청으로 Content-Length 확인 (알 수 없으면 0)"""
+    try:
+        response = session.head(url, allow_redirects=True, timeout=10)
+        return int(response.headers.get('Content-Length') or 0)
+    except:
+        return 0
+
+def download_notebooks(notebooks, max_downloads=3, max_workers=8, max_size=2 * 1024 * 1024):
+    """
+    노트북 다운로드
+    
+    크기 정보가 없는 노트북은 먼저 HEAD 요청을 동시에 보내 크기를 확인하고,
+    크기가 작은 것부터 남은 개수만큼 동시에 받고, 실패한 만큼 다음 노트북으로 채운다.
+    
+    Parameters:
+        notebooks: 노트북 정보 리스트
+        max_downloads: 다운로드할 최대 노트북 수
+        max_workers: 동시 다운로드 스레드 수
+        max_size: 이보다 큰 노트북은 받지 않음 (바이트)
+    """
     
     if not notebooks:
         print("다운로드할 노트북이 없습니다.")
@@ -244,45 +520,65 @@ def download_notebooks(notebooks, max_downloads=3):
     download_dir = Path('copernicus_downloads')
     download_dir.mkdir(exist_ok=True)
     
-    session = requests.Session()
-    
-    # 크기가 작은 것부터 다운로드
-    notebooks_sorted = sorted(notebooks, key=lambda x: x.get('size', 0))
+    session = get_session()
     
-    downloaded = 0
-    for nb in notebooks_sorted:
-        if downloaded >= max_downloads:
-            break
-            
-        filename = nb['name']
-        url = nb['url']
-        
-        if not url:
+    # 이미 존재하거나 URL이 없는 노트북은 제외
+    candidates = []
+    for nb in notebooks:
+        if not nb['url']:
             continue
-        
-        filepath = download_dir / filename
-        
-        # 이미 존재하면 스킵
+        filepath = download_dir / nb['name']
         if filepath.exists():
-            print(f"⚠ 이미 존재: {filename}")
+            print(f"⚠ 이미 존재: {nb['name']}")
             continue
+        candidates.append((nb, filepath))
+    
+    downloaded = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # 크기를 모르는 노트북은 HEAD로 확인 (같은 세션으로 연결 재사용)
+        unknown = [i for i, (nb, _) in enumerate(candidates) if not nb.get('size')]
+        sizes = executor.map(lambda i: _head_size(session, candidates[i][0]['url']), unknown)
+        for i, size in zip(unknown, sizes):
+            nb, filepath = candidates[i]
+            candidates[i] = (dict(nb, size=size), filepath)
+            
+        too_large = [nb for nb, _ in candidates if nb.get('size', 0) > max_size]
+        for nb in too_large:
+            print(f"⚠ 너무 큼 ({nb['size'] / 1024 / 1024:.1f} MB): {nb['name']}")
+        candidates = [(nb, fp) for nb, fp in candidates if nb.get('size', 0) <= max_size]
         
-        print(f"\n다운로드: {filename}")
-        print(f"  URL: {url[:60]}...")
+        # 크기가 작은 것부터 다운로드
+        candidates.sort(key=lambda c: c[0].get('size', 0))
         
-        try:
-            response = session.get(url, timeout=30)
-            response.raise_for_status()
-            
-            with open(filepath, 'wb') as f:
-                f.write(response.content)
+        # 받았거나 받는 중인 경로 (다른 저장소의 같은 이름 노트북이 한 파일에 동시에 쓰지 않도록)
+        claimed = set()
+        while downloaded < max_downloads and candidates:
+            batch, deferred = [], []
+            for nb, filepath in candidates:
+                if filepath in claimed:
+                    print(f"⚠ 이미 존재: {nb['name']}")
+                elif len(batch) < max_downloads - downloaded and \
+                        all(filepath != fp for _, fp in batch):
+                    batch.append((nb, filepath))
+                else:
+                    # 같은 이름이 이번 묶음에 있으면 다음 묶음으로 (실패 시 대신 받음)
+                    deferred.append((nb, filepath))
+            candidates = deferred
+            claimed.update(fp for _, fp in batch)
+            futures = [executor.submit(_download_notebook, session, nb['url'], filepath) for nb, filepath in batch]
             
-            size_kb = filepath.stat().st_size / 1024
-            print(f"  ✓ 완료: {size_kb:.1f} KB")
-            downloaded += 1
-            
-        except Exception as e:
-            print(f"  ✗ 실패: {str(e)[:50]}")
+            for (nb, filepath), future in zip(batch, futures):
+                print(f"\n다운로드: {nb['name']}")
+                print(f"  URL: {nb['url'][:60]}...")
+                
+                try:
+                    size_kb = future.result()
+                    print(f"  ✓ 완료: {size_kb:.1f} KB")
+                    downloaded += 1
+                    
+                except Exception as e:
+                    print(f"  ✗ 실패: {str(e)[:50]}")
+                    claimed.discard(filepath)
     
     print(f"\n총 {downloaded}개 노트북 다운로드 완료")
 
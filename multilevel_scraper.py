@@ -5,24 +5,104 @@ Multi-level Copernicus Scraper
 """
 
 import requests
+import json
 from bs4 import BeautifulSoup
 import time
-import json
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
 import re
+import hashlib
+import shutil
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from deep_scraper import PageCache
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+# 링크 매칭 패턴 (모듈 로드 시 한 번만 컴파일)
+_FILE_PAT = re.compile(r'\.(?:ipynb|zip|tar|gz|pdf|nc)', re.I)
+_DL_TEXT_PAT = re.compile(r'download|get|access|retrieve', re.I)
+_DL_CLASS_PAT = re.compile(r'download|btn.*download', re.I)
+_KEYWORD_PAT = re.compile(r'tutorial|training|exercise|example|notebook|data', re.I)
+_PLATFORM_PAT = re.compile(
+    r'atlas\.mercator-ocean\.fr|github\.com|gitlab\.com|zenodo\.org|drive\.google\.com|dropbox\.com',
+    re.I
+)
+_FILENAME_PAT = re.compile('filename="?(.+)"?')
+
+# 다운로드하지 않을 Content-Type (링크가 파일 대신 HTML 안내/로그인 페이지로 연결된 경우)
+# 허용 목록은 NetCDF(application/x-netcdf), raw GitHub 노트북(text/plain) 등을 놓치므로 제외 목록 사용
+_PAGE_TYPES = ('text/html', 'application/xhtml+xml')
+
+def _json_bytes(obj, indent=False):
+    """JSON 직렬화 (orjson이 있으면 사용, 한글은 그대로 UTF-8로 저장)"""
+    if _HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+def _same_origin(href, base_url, origin, base_domain):
+    """
+    링크가 기준 페이지와 같은 도메인인지 판별하고 절대 URL 반환
+    
+    흔한 형태('/path', 'https://같은호스트/...', 상대 경로)는 문자열 비교로 처리하고,
+    그 밖의 경우(다른 스킴, '//host', '.' 경로 조각 등)만 urljoin + urlparse를 쓴다.
+    """
+    if '/.' not in href:
+        if href.startswith('/') and not href.startswith('//'):
+            return True, origin + href
+        if href.startswith(origin) and href[len(origin):len(origin) + 1] in ('', '/', '?', '#'):
+            return True, href
+        if ':' not in href and not href.startswith('//'):
+            return True, urljoin(base_url, href)
+    absolute_url = urljoin(base_url, href)
+    return urlparse(absolute_url).netloc == base_domain, absolute_url
+
+class VisitedURLs:
+    """
+    방문한 URL 집합 (URL 문자열 대신 64비트 해시만 저장해 메모리 절약)
+    
+    해시 충돌 확률은 URL 수십억 개 수준에서야 의미가 있고, 충돌해도 페이지를
+    한 번 건너뛸 뿐 다시 방문하지는 않는다.
+    """
+    
+    def __init__(self):
+        self._keys = set()
+        
+    @staticmethod
+    def _key(url):
+        return int.from_bytes(hashlib.blake2b(url.encode(), digest_size=8).digest(), 'little')
+        
+    def __contains__(self, url):
+        return self._key(url) in self._keys
+        
+    def add(self, url):
+        self._keys.add(self._key(url))
+        
+    def __len__(self):
+        return len(self._keys)
 
 class MultiLevelCopernicusScraper:
     """다단계 크롤링 스크래퍼"""
     
-    def __init__(self):
+    def __init__(self, cache_dir=None, cache_expire=3600, max_workers=8):
+        """
+        Parameters:
+            cache_dir: 크롤링한 페이지를 저장할 디스크 캐시 디렉토리 (None이면 캐시 안 함)
+            cache_expire: 페이지 캐시를 재검증 없이 쓰는 시간 (초)
+            max_workers: 동시에 가져올 최대 페이지 수
+        """
+        self.max_workers = max_workers
+        self.page_cache = PageCache(Path(cache_dir), cache_expire) if cache_dir else None
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
         })
-        self.visited = set()
+        self.visited = VisitedURLs()
         self.download_links = []
         
     def follow_tutorial_path(self, start_url, max_depth=3):
@@ -31,28 +111,101 @@ class MultiLevelCopernicusScraper:
         print(f"\n시작 URL: {start_url}")
         print("="*60)
         
-        return self._crawl_level(start_url, depth=0, max_depth=max_depth)
+        return self.follow_tutorial_paths([start_url], max_depth=max_depth)[0]
+        
+    def follow_tutorial_paths(self, start_urls, max_depth=3, on_resources=None):
+        """
+        여러 시작 URL의 튜토리얼 경로를 한 스레드 풀에서 동시에 따라가기
+        
+        Parameters:
+            start_urls: 시작 URL 리스트
+            max_depth: 최대 크롤링 깊이
+            on_resources: 페이지 하나를 처리할 때마다 그 페이지의 리소스 리스트로 호출할 함수
+            
+        Returns:
+            시작 URL 순서대로 각 경로에서 찾은 리소스 리스트
+        """
+        
+        results = self._crawl_level(start_urls, max_depth=max_depth, on_resources=on_resources)
+        if self.page_cache:
+            self.page_cache.save_index()
+        return results
         
-    def _crawl_level(self, url, depth=0, max_depth=3):
-        """재귀적으로 각 레벨 크롤링"""
+    def fetch_page(self, url):
+        """페이지 본문 가져오기 (신선한 캐시는 그대로, 오래된 캐시는 조건부 요청으로 재검증)"""
         
-        if depth > max_depth or url in self.visited:
-            return []
+        entry = self.page_cache.lookup(url) if self.page_cache else None
+        if entry and self.page_cache.is_fresh(entry):
+            return self.page_cache.read(entry)
+            
+        headers = self.page_cache.conditional_headers(entry) if entry else {}
+        response = self.session.get(url, timeout=15, headers=headers)
+        if response.status_code == 304 and entry:
+            self.page_cache.touch(url)
+            return self.page_cache.read(entry)
+        response.raise_for_status()
+        
+        # HTML 페이지만 캐시 (다운로드 버튼이 가리키는 파일은 저장하지 않음)
+        if self.page_cache and 'html' in response.headers.get('Content-Type', ''):
+            self.page_cache.store(url, response, response.content)
+        return response.content
+        
+    def _crawl_level(self, start_urls, max_depth=3, on_resources=None):
+        """
+        작업 큐 방식으로 여러 레벨 크롤링
+        
+        페이지 하나가 끝나는 즉시 그 하위 링크를 스레드 풀에 제출해 같은 레벨의 페이지들을
+        동시에 가져온다. 방문 표시는 제출 전에 메인 스레드에서만 하므로 락이 필요 없다.
+        시작 URL이 여러 개면 모두 같은 풀에서 동시에 크롤링하고, 이미 다른 경로에서 방문한
+        페이지는 다시 가져오지 않는다.
+        """
+        
+        # 시작 URL별 URL -> 리소스 (처음 발견한 항목만 유지)
+        found_resources = [{} for _ in start_urls]
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = {}
             
-        self.visited.add(url)
+            def submit(url, depth, seed):
+                if depth <= max_depth and url not in self.visited:
+                    self.visited.add(url)
+                    pending[executor.submit(self._crawl_page, url, depth, max_depth)] = (depth, seed)
+                    
+            for seed, start_url in enumerate(start_urls):
+                submit(start_url, 0, seed)
+            
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    depth, seed = pending.pop(future)
+                    resources, child_urls = future.result()
+                    for r in resources:
+                        found_resources[seed].setdefault(r['url'], r)
+                    if on_resources:
+                        on_resources(resources)
+                    for child_url in child_urls:
+                        submit(child_url, depth + 1, seed)
+                        
+        return [list(found.values()) for found in found_resources]
+        
+    def _crawl_page(self, url, depth, max_depth):
+        """페이지 하나 크롤링 (리소스 리스트, 따라갈 하위 URL 리스트) 반환"""
+        
         found_resources = []
+        child_urls = []
         
         indent = "  " * depth
         print(f"{indent}레벨 {depth}: {url.split('/')[-1][:50]}")
         
         try:
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
+            content = self.fetch_page(url)
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(content, 'lxml')
+            # href가 있는 링크는 한 번만 모아 여러 탐색에서 재사용
+            anchors = soup.find_all('a', href=True)
             
             # 1. 직접 다운로드 링크 찾기
-            direct_downloads = self._find_direct_downloads(soup, url)
+            direct_downloads = self._find_direct_downloads(anchors, url)
             if direct_downloads:
                 print(f"{indent}  ✓ {len(direct_downloads)}개 직접 다운로드 발견")
                 found_resources.extend(direct_downloads)
@@ -61,20 +214,18 @@ class MultiLevelCopernicusScraper:
             download_buttons = self._find_download_buttons(soup, url)
             for btn_url in download_buttons:
                 print(f"{indent}  → 다운로드 버튼 클릭: {btn_url.split('/')[-1][:30]}")
-                sub_resources = self._crawl_level(btn_url, depth + 1, max_depth)
-                found_resources.extend(sub_resources)
+                child_urls.append(btn_url)
             
             # 3. 튜토리얼 하위 페이지 찾기
             if depth < max_depth:
-                sub_pages = self._find_tutorial_subpages(soup, url)
+                sub_pages = self._find_tutorial_subpages(anchors, url)
                 for sub_url in sub_pages[:5]:  # 최대 5개 하위 페이지만
                     if sub_url not in self.visited:
                         print(f"{indent}  → 하위 페이지: {sub_url.split('/')[-1][:30]}")
-                        sub_resources = self._crawl_level(sub_url, depth + 1, max_depth)
-                        found_resources.extend(sub_resources)
+                        child_urls.append(sub_url)
             
             # 4. 외부 플랫폼 링크 처리
-            external_links = self._find_external_platforms(soup)
+            external_links = self._find_external_platforms(anchors)
             if external_links:
                 print(f"{indent}  ✓ {len(external_links)}개 외부 플랫폼 링크")
                 for ext in external_links:
@@ -101,28 +252,26 @@ class MultiLevelCopernicusScraper:
         except Exception as e:
             print(f"{indent}  ✗ 에러: {str(e)[:50]}")
             
-        return found_resources
+        return found_resources, child_urls
         
-    def _find_direct_downloads(self, soup, base_url):
+    def _find_direct_downloads(self, anchors, base_url):
         """직접 다운로드 가능한 파일 링크 찾기"""
         
         downloads = []
         
-        # 파일 확장자 패턴
-        file_patterns = [r'\.ipynb', r'\.zip', r'\.tar', r'\.gz', r'\.pdf', r'\.nc']
-        
-        for pattern in file_patterns:
-            links = soup.find_all('a', href=re.compile(pattern, re.I))
-            for link in links:
-                href = link.get('href', '')
-                absolute_url = urljoin(base_url, href)
-                
-                downloads.append({
-                    'url': absolute_url,
-                    'filename': href.split('/')[-1],
-                    'type': 'direct_file',
-                    'text': link.get_text(strip=True)[:50]
-                })
+        # 파일 확장자 패턴 (.ipynb, .zip, .tar, .gz, .pdf, .nc)
+        for link in anchors:
+            href = link['href']
+            if not _FILE_PAT.search(href):
+                continue
+            absolute_url = urljoin(base_url, href)
+            
+            downloads.append({
+                'url': absolute_url,
+                'filename': href.split('/')[-1],
+                'type': 'direct_file',
+                'text': link.get_text(strip=True)[:50]
+            })
                 
         return downloads
         
@@ -133,7 +282,7 @@ class MultiLevelCopernicusScraper:
         
         # 다운로드 관련 텍스트나 클래스를 가진 요소들
         download_elements = soup.find_all(['a', 'button'], 
-                                         text=re.compile(r'download|get|access|retrieve', re.I))
+                                         text=_DL_TEXT_PAT)
         
         for elem in download_elements:
             href = elem.get('href')
@@ -143,7 +292,7 @@ class MultiLevelCopernicusScraper:
                     button_urls.append(absolute_url)
         
         # class나 id에 download가 포함된 링크
-        download_class = soup.find_all('a', class_=re.compile(r'download|btn.*download', re.I))
+        download_class = soup.find_all('a', class_=_DL_CLASS_PAT)
         for elem in download_class:
             href = elem.get('href')
             if href:
@@ -153,54 +302,38 @@ class MultiLevelCopernicusScraper:
                     
         return list(set(button_urls))  # 중복 제거
         
-    def _find_tutorial_subpages(self, soup, base_url):
+    def _find_tutorial_subpages(self, anchors, base_url):
         """튜토리얼 관련 하위 페이지 찾기"""
         
         subpages = []
-        base_domain = urlparse(base_url).netloc
-        
-        # 관련 키워드
-        keywords = ['tutorial', 'training', 'exercise', 'example', 'notebook', 'data']
-        
-        for keyword in keywords:
-            links = soup.find_all('a', href=re.compile(keyword, re.I))
-            for link in links:
-                href = link.get('href', '')
-                if href and not href.startswith('#'):
-                    absolute_url = urljoin(base_url, href)
-                    
-                    # 같은 도메인인지 확인
-                    if urlparse(absolute_url).netloc == base_domain:
-                        subpages.append(absolute_url)
+        parsed = urlparse(base_url)
+        base_domain = parsed.netloc
+        origin = f"{parsed.scheme}://{parsed.netloc}"
+        
+        # 관련 키워드 (tutorial, training, exercise, example, notebook, data)
+        for link in anchors:
+            href = link['href']
+            if href and not href.startswith('#') and _KEYWORD_PAT.search(href):
+                # 같은 도메인인지 확인
+                same, absolute_url = _same_origin(href, base_url, origin, base_domain)
+                if same:
+                    subpages.append(absolute_url)
                         
         return list(set(subpages))  # 중복 제거
         
-    def _find_external_platforms(self, soup):
+    def _find_external_platforms(self, anchors):
         """외부 플랫폼 링크 찾기"""
         
-        external = []
+        # 알려진 플랫폼 (Mercator Ocean, GitHub, GitLab, Zenodo, Google Drive, Dropbox)
+        return list({link['href'] for link in anchors if _PLATFORM_PAT.search(link['href'])})
         
-        # 알려진 플랫폼 패턴
-        platforms = [
-            r'atlas\.mercator-ocean\.fr',
-            r'github\.com',
-            r'gitlab\.com',
-            r'zenodo\.org',
-            r'drive\.google\.com',
-            r'dropbox\.com'
-        ]
-        
-        for platform in platforms:
-            links = soup.find_all('a', href=re.compile(platform, re.I))
-            for link in links:
-                href = link.get('href', '')
-                if href:
-                    external.append(href)
-                    
-        return list(set(external))
+    def test_specific_tutorials(self, results_file='multilevel_scraping_results.jsonl'):
+        """
+        특정 튜토리얼 테스트
         
-    def test_specific_tutorials(self):
-        """특정 튜토리얼 테스트"""
+        Parameters:
+            results_file: 발견한 리소스를 바로 한 줄씩 기록할 JSON Lines 파일 (None이면 기록 안 함)
+        """
         
         print("\n" + "="*60)
         print("특정 튜토리얼 심층 테스트")
@@ -213,27 +346,40 @@ class MultiLevelCopernicusScraper:
             "https://atlas.mercator-ocean.fr/s/ZqtwdLNzoQH55JE"
         ]
         
-        all_resources = []
+        # URL -> 리소스 (처음 발견한 항목만 유지)
+        all_resources = {}
         
+        # 중간에 멈춰도 결과가 남도록 페이지마다 기록
+        out = open(results_file, 'wb', buffering=8192) if results_file else None
+        
+        def collect(resources):
+            for r in resources:
+                if r['url'] not in all_resources:
+                    all_resources[r['url']] = r
+                    if out:
+                        out.write(_json_bytes(r) + b"\n")
+            if out:
+                out.flush()
+                
+        # 세 시작 URL을 동시에 크롤링 (방문 기록은 공유)
+        print(f"\n테스트 {len(test_urls)}개 동시 크롤링 (스레드 {self.max_workers}개)")
         for url in test_urls:
+            print(f"  - {url}")
+        print("-"*40)
+        
+        try:
+            results = self.follow_tutorial_paths(test_urls, max_depth=2, on_resources=collect)
+        finally:
+            if out:
+                out.close()
+                
+        for url, resources in zip(test_urls, results):
             print(f"\n테스트: {url}")
-            print("-"*40)
-            
-            resources = self.follow_tutorial_path(url, max_depth=2)
-            all_resources.extend(resources)
-            
-            print(f"\n발견된 리소스: {len(resources)}개")
+            print(f"발견된 리소스: {len(resources)}개")
             for r in resources[:5]:
                 print(f"  - [{r['type']}] {r.get('filename', r['url'].split('/')[-1][:30])}")
-                
-        # 중복 제거
-        unique_resources = []
-        seen_urls = set()
-        
-        for r in all_resources:
-            if r['url'] not in seen_urls:
-                seen_urls.add(r['url'])
-                unique_resources.append(r)
+            
+        unique_resources = list(all_resources.values())
                 
         print("\n" + "="*60)
         print(f"총 발견 리소스: {len(unique_resources)}개")
@@ -250,8 +396,8 @@ class MultiLevelCopernicusScraper:
             print(f"  {t}: {count}개")
             
         # 결과 저장
-        with open('multilevel_scraping_results.json', 'w', encoding='utf-8') as f:
-            json.dump(unique_resources, f, indent=2, ensure_ascii=False)
+        with open('multilevel_scraping_results.json', 'wb') as f:
+            f.write(_json_bytes(unique_resources, indent=True))
             
         print(f"\n결과 저장: multilevel_scraping_results.json")
         
@@ -282,6 +428,9 @@ class MultiLevelCopernicusScraper:
                 content_length = head_response.headers.get('content-length', '0')
                 
                 print(f"  타입: {content_type}")
+                if content_type.lower().startswith(_PAGE_TYPES):
+                    print(f"  ⚠ 다운로드 파일이 아님 (웹 페이지) - 건너뜀")
+                    continue
                 if content_length != '0':
                     size_mb = int(content_length) / (1024 * 1024)
                     print(f"  크기: {size_mb:.2f} MB")
@@ -291,11 +440,17 @@ class MultiLevelCopernicusScraper:
                     response = self.session.get(url, stream=True, timeout=30)
                     response.raise_for_status()
                     
+                    # HEAD에서 타입을 알 수 없었던 경우 본문을 받기 전에 다시 확인
+                    get_type = response.headers.get('content-type', '')
+                    if get_type.lower().startswith(_PAGE_TYPES):
+                        response.close()
+                        print(f"  ⚠ 다운로드 파일이 아님 ({get_type}) - 건너뜀")
+                        continue
+                    
                     # 파일명 결정
                     if 'content-disposition' in response.headers:
-                        import re
                         d = response.headers['content-disposition']
-                        fname = re.findall('filename="?(.+)"?', d)
+                        fname = _FILENAME_PAT.findall(d)
                         if fname:
                             filename = fname[0].strip('"')
                         else:
@@ -305,24 +460,23 @@ class MultiLevelCopernicusScraper:
                     
                     filepath = download_dir / filename
                     
-                    # 다운로드
+                    # 다운로드 (앞 4바이트로 파일 타입을 확인하고 나머지는 shutil로 복사)
+                    response.raw.decode_content = True
                     with open(filepath, 'wb') as f:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            if chunk:
-                                f.write(chunk)
+                        header = response.raw.read(4)
+                        f.write(header)
+                        shutil.copyfileobj(response.raw, f, length=1024 * 1024)
                     
                     actual_size = filepath.stat().st_size / 1024
                     print(f"  ✓ 성공: {filename} ({actual_size:.1f} KB)")
                     
                     # ZIP 파일인지 확인
-                    with open(filepath, 'rb') as f:
-                        header = f.read(4)
-                        if header.startswith(b'PK'):
-                            print(f"  ✓ ZIP 파일 확인")
-                        elif header.startswith(b'%PDF'):
-                            print(f"  ✓ PDF 파일 확인")
-                        else:
-                            print(f"  ? 파일 타입: {header}")
+                    if header.startswith(b'PK'):
+                        print(f"  ✓ ZIP 파일 확인")
+                    elif header.startswith(b'%PDF'):
+                        print(f"  ✓ PDF 파일 확인")
+                    else:
+                        print(f"  ? 파일 타입: {header}")
                 else:
                     print(f"  ⚠ 파일이 너무 큼 (10MB 초과)")
                     
@@ -330,7 +484,7 @@ class MultiLevelCopernicusScraper:
                 print(f"  ✗ 실패: {str(e)[:100]}")
 
 if __name__ == "__main__":
-    scraper = MultiLevelCopernicusScraper()
+    scraper = MultiLevelCopernicusScraper(cache_dir='multilevel_cache')
     
     # 테스트 실행
     resources = scraper.test_specific_tutorials()
@@ -10,16 +10,223 @@ import xarray as xr
 import matplotlib.pyplot as plt
 import matplotlib.colors as mcolors
 import matplotlib.cm as cm
+import matplotlib.image as mimage
+import matplotlib.ticker as mticker
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.gridspec import GridSpec
 from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 import cartopy.crs as ccrs
 import cartopy.feature as cfeature
 from scipy import interpolate, signal
 from typing import Union, List, Dict, Tuple, Optional, Any
 import warnings
+from functools import lru_cache
+
+try:
+    import dask
+    _HAS_DASK = True
+except ImportError:
+    _HAS_DASK = False
+
+try:
+    import numba
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+try:
+    import datashader as dsh
+    _HAS_DATASHADER = True
+except ImportError:
+    _HAS_DATASHADER = False
 
 warnings.filterwarnings('ignore')
 
+# 선형 밀도 근사 계수 (calculate_density_simple)
+_LINEAR_ALPHA = 0.2  # 열팽창 계수 근사
+_LINEAR_BETA = 0.78  # 염분 수축 계수 근사
+
+# 해안선/육지 해상도 선택 기준 (cartopy 기본 LAND/COASTLINE과 동일)
+_COAST_SCALER = cfeature.AdaptiveScaler('110m', (('50m', 50), ('10m', 15)))
+
+
+def _compute(*arrays: Any) -> Tuple[Any, ...]:
+    """
+    Dask 기반 배열들을 한 번의 compute로 함께 계산 (그래프를 합쳐 원본 읽기를 공유)
+    
+    메모리에 올라온 배열은 그대로 반환
+    """
+    if _HAS_DASK:
+        return dask.compute(*arrays)
+    return arrays
+
+
+def _regular_extent(coord: Any) -> Optional[Tuple[float, float]]:
+    """
+    1D 좌표가 등간격이면 셀 경계 기준 (시작, 끝) 범위를, 아니면 None 반환
+    """
+    values = np.asarray(coord)
+    if values.ndim != 1 or values.size < 2 or not np.issubdtype(values.dtype, np.number):
+        return None
+    steps = np.diff(values)
+    if not np.allclose(steps, steps[0]):
+        return None
+    half = steps[0] / 2
+    return float(values[0] - half), float(values[-1] + half)
+
+
+@lru_cache(maxsize=8)
+def _natural_earth_geometries(name: str, scale: str) -> Tuple[Any, ...]:
+    """
+    Natural Earth 지형(육지/해안선) geometry를 한 번만 읽어 재사용
+    """
+    return tuple(cfeature.NaturalEarthFeature('physical', name, scale).geometries())
+
+
+def _add_land_and_coast(ax: plt.Axes, extent: Tuple[float, float, float, float]) -> None:
+    """
+    캐시된 육지/해안선 geometry를 지도 축에 추가 (extent: 경도/위도 범위로 해상도 결정)
+    """
+    scale = _COAST_SCALER.scale_from_extent(extent)
+    ax.add_geometries(_natural_earth_geometries('land', scale), ccrs.PlateCarree(),
+                      facecolor='lightgray', edgecolor='none')
+    ax.add_geometries(_natural_earth_geometries('coastline', scale), ccrs.PlateCarree(),
+                      facecolor='none', edgecolor='black', linewidth=0.5)
+
+
+@lru_cache(maxsize=32)
+def _density_grid(
+    smin: float, smax: float, tmin: float, tmax: float, n: int = 100,
+    formula: str = 'linear'
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    T-S 다이어그램 등밀도선용 (염분 격자, 온도 격자, 밀도) 계산 결과 캐시
+    
+    캐시된 배열이 수정되지 않도록 읽기 전용으로 반환
+    """
+    sal_grid = np.linspace(smin, smax, n)
+    temp_grid = np.linspace(tmin, tmax, n)
+    
+    # 밀도 계산 (sigma-t) - meshgrid 대신 브로드캐스팅으로 2D 격자 생성
+    density = _density_function(formula)(temp_grid[:, None], sal_grid[None, :])
+    for arr in (sal_grid, temp_grid, density):
+        arr.setflags(write=False)
+    return sal_grid, temp_grid, density
+
+
+def _draw_isopycnals(
+    ax: plt.Axes,
+    sal_grid: np.ndarray,
+    temp_grid: np.ndarray,
+    density: np.ndarray,
+    formula: str,
+    levels: int = 15
+) -> None:
+    """
+    T-S 축에 등밀도선 그리기
+    
+    선형 근사식은 등밀도선이 정확히 직선(-alpha*T + beta*S = c)이므로
+    contour 추적 없이 선분을 해석적으로 계산해 LineCollection 하나로 그림
+    비선형식('unesco')은 contour + clabel 사용
+    """
+    if formula != 'linear':
+        cs = ax.contour(sal_grid, temp_grid, density, levels=levels,
+                        colors='gray', alpha=0.4, linewidths=0.8)
+        ax.clabel(cs, inline=True, fontsize=8, fmt='%.1f')
+        return
+        
+    smin, smax = sal_grid[0], sal_grid[-1]
+    tmin, tmax = temp_grid[0], temp_grid[-1]
+    # contour(levels=n)과 같은 방식으로 보기 좋은 레벨 선택
+    values = mticker.MaxNLocator(levels + 1).tick_values(density.min(), density.max())
+    values = values[(values > density.min()) & (values < density.max())]
+    
+    # 각 레벨에서 T = (beta*S - c) / alpha 직선을 격자 범위로 잘라 선분 생성
+    s_lo = np.maximum(smin, (_LINEAR_ALPHA * tmin + values) / _LINEAR_BETA)
+    s_hi = np.minimum(smax, (_LINEAR_ALPHA * tmax + values) / _LINEAR_BETA)
+    t_lo = (_LINEAR_BETA * s_lo - values) / _LINEAR_ALPHA
+    t_hi = (_LINEAR_BETA * s_hi - values) / _LINEAR_ALPHA
+    segments = np.stack([np.column_stack([s_lo, t_lo]),
+                         np.column_stack([s_hi, t_hi])], axis=1)
+    
+    ax.add_collection(LineCollection(segments, colors='gray', alpha=0.4, linewidths=0.8))
+    for c, sm, tm in zip(values, (s_lo + s_hi) / 2, (t_lo + t_hi) / 2):
+        ax.text(sm, tm, f'{c:.1f}', fontsize=8, color='gray', ha='center', va='center', zorder=3,
+                bbox=dict(boxstyle='square,pad=0.1', fc='white', ec='none', alpha=0.7))
+
+
+def _use_datashader(backend: str) -> bool:
+    """
+    backend='datashader' 요청 시 사용 가능 여부 확인 (미설치면 matplotlib으로 대체)
+    """
+    if backend != 'datashader':
+        return False
+    if not _HAS_DATASHADER:
+        print("datashader가 설치되지 않아 matplotlib으로 그립니다 (pip install datashader)")
+        return False
+    return True
+
+
+def _decimate(
+    data: xr.DataArray,
+    x_dim: str,
+    y_dim: str,
+    max_cells: Optional[Tuple[int, int]]
+) -> xr.DataArray:
+    """
+    격자가 max_cells (x, y)보다 크면 블록 평균(coarsen)으로 축소
+    
+    화면 해상도를 넘는 셀은 구분되지 않으므로 렌더링 비용만 늘림 (None이면 축소 안 함)
+    """
+    if max_cells is None:
+        return data
+    fx = max(1, data.sizes[x_dim] // max_cells[0])
+    fy = max(1, data.sizes[y_dim] // max_cells[1])
+    if fx == 1 and fy == 1:
+        return data
+    return data.coarsen({x_dim: fx, y_dim: fy}, boundary='trim').mean()
+
+
+def _subsample(max_points: Optional[int], *arrays: Optional[np.ndarray]) -> Tuple[Optional[np.ndarray], ...]:
+    """
+    점 개수가 max_points를 넘으면 같은 무작위 인덱스로 배열들을 함께 추출 (재현 가능하도록 시드 고정)
+    
+    None인 배열은 그대로 두고, max_points가 None이면 추출하지 않음
+    """
+    n = arrays[0].size
+    if max_points is None or n <= max_points:
+        return arrays
+    idx = np.sort(np.random.default_rng(0).choice(n, max_points, replace=False))
+    return tuple(None if a is None else a[idx] for a in arrays)
+
+
+def _update_pcolor(im: Any, values: np.ndarray) -> None:
+    """
+    _pcolor가 만든 artist의 데이터만 교체 (AxesImage/QuadMesh 공용)
+    """
+    if isinstance(im, mimage.AxesImage):
+        im.set_data(values)
+    else:
+        im.set_array(np.asarray(values).ravel())
+
+
+def _pcolor(ax: plt.Axes, x: Any, y: Any, data: Any, **kwargs) -> Any:
+    """
+    등간격 격자는 pcolorfast(이미지 경로)로, 그 외(곡선 격자 등)는 pcolormesh로 그리기
+
+    Cartopy 축에서는 데이터 좌표계(transform)가 지도 투영법과 같을 때만 pcolorfast 사용
+    """
+    transform = kwargs.get('transform')
+    same_crs = transform is None or getattr(ax, 'projection', None) == transform
+    x_extent = _regular_extent(x)
+    y_extent = _regular_extent(y)
+    if same_crs and x_extent is not None and y_extent is not None:
+        kwargs.pop('transform', None)
+        return ax.pcolorfast(x_extent, y_extent, np.asarray(data), **kwargs)
+    return ax.pcolormesh(x, y, data, shading='auto', **kwargs)
+
 
 def plot_ts_diagram(
     temperature: Union[np.ndarray, xr.DataArray],
@@ -31,6 +238,9 @@ def plot_ts_diagram(
     figsize: Tuple[float, float] = (10, 8),
     cmap: str = 'viridis_r',
     marker_size: int = 20,
+    max_points: Optional[int] = 50000,
+    backend: str = 'matplotlib',
+    formula: str = 'linear',
     save_path: Optional[str] = None
 ) -> Tuple[plt.Figure, plt.Axes]:
     """
@@ -47,6 +257,9 @@ def plot_ts_diagram(
         figsize: 그래프 크기
         cmap: 컬러맵
         marker_size: 마커 크기
+        max_points: 산점도 최대 점 개수 (초과 시 무작위 추출, None이면 전체 표시)
+        backend: 'matplotlib' (산점도) 또는 'datashader' (전체 점을 격자로 집계, 대용량용)
+        formula: 등밀도선 계산식 ('linear': 선형 근사, 'unesco': UNESCO 1983 전체식)
         save_path: 저장 경로
         
     Returns:
@@ -70,11 +283,33 @@ def plot_ts_diagram(
     if depth is not None:
         depth = depth[mask]
         
+    use_datashader = _use_datashader(backend)
+    
+    # 점이 너무 많으면 분포가 유지되도록 무작위 추출 (datashader는 전체 점을 집계)
+    if not use_datashader:
+        temperature, salinity, depth = _subsample(max_points, temperature, salinity, depth)
+        
     # 그래프 생성
     fig, ax = plt.subplots(figsize=figsize)
     
+    if use_datashader:
+        # 점을 픽셀 격자로 집계 (깊이가 있으면 픽셀별 평균 깊이, 없으면 점 개수)
+        df = pd.DataFrame({'S': salinity, 'T': temperature})
+        if depth is not None:
+            df['D'] = depth
+        cvs = dsh.Canvas(plot_width=800, plot_height=600,
+                         x_range=(salinity.min(), salinity.max()),
+                         y_range=(temperature.min(), temperature.max()))
+        if depth is not None:
+            agg = cvs.points(df, 'S', 'T', agg=dsh.mean('D'))
+        else:
+            agg = cvs.points(df, 'S', 'T', agg=dsh.count())
+            agg = agg.where(agg > 0)
+        im = _pcolor(ax, agg['S'], agg['T'], agg, cmap=cmap)
+        cbar = plt.colorbar(im, ax=ax,
+                            label=colorbar_label if depth is not None else 'Count')
     # 깊이에 따른 색상 매핑
-    if depth is not None:
+    elif depth is not None:
         scatter = ax.scatter(salinity, temperature, c=depth, s=marker_size,
                            cmap=cmap, alpha=0.6, edgecolors='k', linewidth=0.5)
         cbar = plt.colorbar(scatter, ax=ax, label=colorbar_label)
@@ -85,17 +320,15 @@ def plot_ts_diagram(
     # 등밀도선 추가
     if density_lines:
         # Simplified UNESCO 1983 equation for density anomaly
-        sal_grid = np.linspace(salinity.min(), salinity.max(), 100)
-        temp_grid = np.linspace(temperature.min(), temperature.max(), 100)
-        sal_mesh, temp_mesh = np.meshgrid(sal_grid, temp_grid)
-        
-        # 간단한 밀도 계산 (sigma-t)
-        density = calculate_density_simple(temp_mesh, sal_mesh)
+        # 범위를 0.1 단위로 바깥쪽 반올림해 비슷한 범위의 반복 호출은 캐시된 격자 재사용
+        sal_grid, temp_grid, density = _density_grid(
+            np.floor(salinity.min() * 10) / 10, np.ceil(salinity.max() * 10) / 10,
+            np.floor(temperature.min() * 10) / 10, np.ceil(temperature.max() * 10) / 10,
+            formula=formula
+        )
         
         # 등밀도선 그리기
-        cs = ax.contour(sal_mesh, temp_mesh, density, levels=15,
-                       colors='gray', alpha=0.4, linewidths=0.8)
-        ax.clabel(cs, inline=True, fontsize=8, fmt='%.1f')
+        _draw_isopycnals(ax, sal_grid, temp_grid, density, formula)
         
     # 레이블 및 제목
     ax.set_xlabel('Salinity (PSU)', fontsize=12)
@@ -125,6 +358,8 @@ def plot_hovmoller(
     cmap: str = 'RdBu_r',
     figsize: Tuple[float, float] = (14, 8),
     contour_levels: Optional[int] = None,
+    label_contours: Optional[bool] = None,
+    max_cells: Optional[Tuple[int, int]] = (2000, 2000),
     save_path: Optional[str] = None
 ) -> Tuple[plt.Figure, plt.Axes]:
     """
@@ -140,6 +375,9 @@ def plot_hovmoller(
         cmap: 컬러맵
         figsize: 그래프 크기
         contour_levels: 등고선 레벨 수
+        label_contours: 등고선 값 표시 여부 (None이면 레벨 10개 이하일 때만 표시,
+            촘촘한 등고선은 레이블 배치가 느리고 어차피 읽기 어려움)
+        max_cells: (x, y) 최대 셀 수, 초과 시 블록 평균으로 축소 (None이면 원본 해상도)
         save_path: 저장 경로
         
     Returns:
@@ -163,6 +401,10 @@ def plot_hovmoller(
         other_dims = [d for d in plot_data.dims if d not in [x_dim, y_dim]]
         plot_data = plot_data.mean(dim=other_dims)
         
+    # pcolor/contour가 지연 계산을 각각 반복하지 않도록 한 번만 계산
+    plot_data = _decimate(plot_data, x_dim, y_dim, max_cells)
+    plot_data, = _compute(plot_data)
+        
     # 시간 축이 x축인 경우 포맷 조정
     if x_dim == 'time' or 'time' in x_dim.lower():
         plot_data = plot_data.transpose(y_dim, x_dim)
@@ -171,14 +413,16 @@ def plot_hovmoller(
     fig, ax = plt.subplots(figsize=figsize)
     
     # Pcolormesh 플롯
-    im = ax.pcolormesh(plot_data[x_dim], plot_data[y_dim], plot_data,
-                      cmap=cmap, shading='auto')
+    im = _pcolor(ax, plot_data[x_dim], plot_data[y_dim], plot_data, cmap=cmap)
     
     # 등고선 추가
     if contour_levels:
         cs = ax.contour(plot_data[x_dim], plot_data[y_dim], plot_data,
                        levels=contour_levels, colors='k', alpha=0.3, linewidths=0.5)
-        ax.clabel(cs, inline=True, fontsize=8)
+        if label_contours is None:
+            label_contours = contour_levels <= 10
+        if label_contours:
+            ax.clabel(cs, inline=True, fontsize=8)
         
     # 컬러바
     cbar = plt.colorbar(im, ax=ax, label=plot_data.attrs.get('units', 'Values'))
@@ -251,11 +495,16 @@ def plot_vertical_profile(
         if colors is None:
             colors = plt.cm.tab10(np.linspace(0, 1, data_values.shape[1]))
             
-        for i in range(data_values.shape[1]):
-            label = variables[i] if variables else f'Profile {i+1}'
-            ax.plot(data_values[:, i], depth_values, label=label,
-                   color=colors[i], linewidth=2)
-        ax.legend()
+        # 프로파일 전체를 LineCollection 하나로 그리고 범례는 핸들로 구성
+        n_profiles = data_values.shape[1]
+        segments = [np.column_stack([data_values[:, i], depth_values])
+                    for i in range(n_profiles)]
+        ax.add_collection(LineCollection(segments, colors=colors[:n_profiles], linewidths=2))
+        ax.autoscale_view()
+        
+        labels = variables if variables else [f'Profile {i+1}' for i in range(n_profiles)]
+        ax.legend(handles=[Line2D([0], [0], color=colors[i], linewidth=2, label=labels[i])
+                           for i in range(n_profiles)])
     else:
         ax.plot(data_values, depth_values, linewidth=2, color='b')
         
@@ -285,6 +534,8 @@ def plot_ocean_section(
     cmap: str = 'RdBu_r',
     figsize: Tuple[float, float] = (14, 8),
     bathymetry: Optional[np.ndarray] = None,
+    backend: str = 'matplotlib',
+    max_cells: Optional[Tuple[int, int]] = (2000, 2000),
     save_path: Optional[str] = None
 ) -> Tuple[plt.Figure, plt.Axes]:
     """
@@ -299,6 +550,8 @@ def plot_ocean_section(
         cmap: 컬러맵
         figsize: 그래프 크기
         bathymetry: 해저 지형 데이터
+        backend: 'matplotlib' 또는 'datashader' (화면 해상도 격자로 재집계, 고해상도 단면용)
+        max_cells: (x, y) 최대 셀 수, 초과 시 블록 평균으로 축소 (None이면 원본 해상도)
         save_path: 저장 경로
         
     Returns:
@@ -307,8 +560,16 @@ def plot_ocean_section(
     fig, ax = plt.subplots(figsize=figsize)
     
     # 데이터 플롯
-    im = ax.pcolormesh(data[x_coord], data[y_coord], data,
-                      cmap=cmap, shading='auto')
+    if _use_datashader(backend):
+        # 원본 격자를 800x600 화면 격자로 평균 집계한 뒤 이미지로 표시
+        cvs = dsh.Canvas(plot_width=800, plot_height=600)
+        grid = cvs.quadmesh(data.rename('value'), x=x_coord, y=y_coord,
+                            agg=dsh.mean('value'))
+        im = _pcolor(ax, grid[x_coord], grid[y_coord], grid, cmap=cmap)
+    else:
+        # 해저 지형은 원본 x 좌표를 쓰므로 축소한 격자는 플롯에만 사용
+        plot_data = _decimate(data, x_coord, y_coord, max_cells)
+        im = _pcolor(ax, plot_data[x_coord], plot_data[y_coord], plot_data, cmap=cmap)
     
     # 해저 지형 추가
     if bathymetry is not None:
@@ -378,23 +639,29 @@ def plot_vector_field(
     ax = plt.axes(projection=projection)
     
     # 해안선 추가
-    ax.add_feature(cfeature.LAND, color='lightgray')
-    ax.add_feature(cfeature.COASTLINE, linewidth=0.5)
+    extent = (float(u[x_coord].min()), float(u[x_coord].max()),
+              float(u[y_coord].min()), float(u[y_coord].max()))
+    _add_land_and_coast(ax, extent)
     ax.gridlines(draw_labels=True, alpha=0.3)
     
     # 속도 크기 계산
     if magnitude is None:
-        magnitude = np.sqrt(u**2 + v**2)
+        # np.hypot: 중간 배열(u², v², 합) 없이 한 번에 계산, Dask 데이터는 청크별 병렬 처리
+        magnitude = xr.apply_ufunc(np.hypot, u, v, dask='parallelized',
+                                   output_dtypes=[u.dtype])
         
     # 배경 컬러맵
-    im = ax.pcolormesh(u[x_coord], u[y_coord], magnitude,
-                      transform=ccrs.PlateCarree(),
-                      cmap=cmap, shading='auto', alpha=0.7)
+    im = _pcolor(ax, u[x_coord], u[y_coord], magnitude,
+                 transform=ccrs.PlateCarree(), cmap=cmap, alpha=0.7)
     
     # 벡터 화살표
-    skip = (slice(None, None, arrow_density), slice(None, None, arrow_density))
-    ax.quiver(u[x_coord][skip[1]], u[y_coord][skip[0]],
-             u.values[skip], v.values[skip],
+    # 좌표 기준으로 n번째 격자만 선택 (Dask 데이터는 선택된 격자만 읽음)
+    skip = {y_coord: slice(None, None, arrow_density),
+            x_coord: slice(None, None, arrow_density)}
+    u_sub = u.isel(skip)
+    v_sub = v.isel(skip)
+    ax.quiver(u_sub[x_coord].values, u_sub[y_coord].values,
+             u_sub.values, v_sub.values,
              transform=ccrs.PlateCarree(),
              scale=arrow_scale, scale_units='inches',
              color='black', alpha=0.6)
@@ -452,6 +719,9 @@ def plot_mixed_layer_evolution(
         mld_series = mld_data.mean(dim=[lat_dim, lon_dim])
         subtitle = ' (Spatial Average)'
         
+    # 시계열 플롯과 계절 평균이 같은 계산 결과를 공유
+    mld_series, = _compute(mld_series)
+        
     # 시계열 플롯
     time = mld_series[time_dim]
     ax1.plot(time, mld_series, 'b-', linewidth=2, label='MLD')
@@ -493,6 +763,8 @@ def plot_water_mass_analysis(
     water_mass_definitions: Dict[str, Dict[str, Tuple[float, float]]],
     title: str = 'Water Mass Analysis',
     figsize: Tuple[float, float] = (14, 10),
+    max_points: Optional[int] = 50000,
+    formula: Optional[str] = None,
     save_path: Optional[str] = None
 ) -> Tuple[plt.Figure, plt.Axes]:
     """
@@ -507,19 +779,36 @@ def plot_water_mass_analysis(
             예: {'NPIW': {'T': (2, 7), 'S': (33.8, 34.2)}}
         title: 그래프 제목
         figsize: 그래프 크기
+        max_points: 산점도 최대 점 개수 (초과 시 무작위 추출, None이면 전체 표시)
+        formula: 등밀도선 계산식 ('linear' 또는 'unesco', None이면 등밀도선 표시 안 함)
         save_path: 저장 경로
         
     Returns:
         Figure와 Axes 객체
     """
+    # 산점도용 원본과 평균 프로파일을 한 번의 compute로 함께 계산
+    temperature, salinity, depth, mean_temp, mean_sal = _compute(
+        temperature, salinity, depth,
+        temperature.mean(dim=['longitude', 'latitude']),
+        salinity.mean(dim=['longitude', 'latitude'])
+    )
+    
     fig = plt.figure(figsize=figsize)
     gs = GridSpec(2, 2, figure=fig, hspace=0.3, wspace=0.3)
     
     # T-S 다이어그램
+    # 1D 깊이 좌표는 온도 격자에 맞춰 브로드캐스팅, 평탄화와 NaN 마스크는 한 번만 계산
+    depth_grid = depth
+    if isinstance(depth, xr.DataArray) and depth.shape != temperature.shape:
+        depth_grid = xr.broadcast(depth, temperature)[0].transpose(*temperature.dims)
+    t_flat = np.ascontiguousarray(temperature.values).ravel()
+    s_flat = np.ascontiguousarray(salinity.values).ravel()
+    d_flat = np.ascontiguousarray(np.asarray(depth_grid)).ravel()
+    mask = np.isfinite(t_flat) & np.isfinite(s_flat)
+    t_flat, s_flat, d_flat = _subsample(max_points, t_flat[mask], s_flat[mask], d_flat[mask])
+    
     ax1 = fig.add_subplot(gs[0, :])
-    scatter = ax1.scatter(salinity.values.flatten(), 
-                         temperature.values.flatten(),
-                         c=depth.values.flatten(), 
+    scatter = ax1.scatter(s_flat, t_flat, c=d_flat,
                          s=10, cmap='viridis_r', alpha=0.5)
     
     # 수괴 경계 표시
@@ -535,6 +824,15 @@ def plot_water_mass_analysis(
                         linestyle='--', label=name)
         ax1.add_patch(rect)
         
+    # 등밀도선 추가
+    if formula is not None and t_flat.size:
+        sal_grid, temp_grid, density = _density_grid(
+            np.floor(s_flat.min() * 10) / 10, np.ceil(s_flat.max() * 10) / 10,
+            np.floor(t_flat.min() * 10) / 10, np.ceil(t_flat.max() * 10) / 10,
+            formula=formula
+        )
+        _draw_isopycnals(ax1, sal_grid, temp_grid, density, formula)
+        
     ax1.set_xlabel('Salinity (PSU)', fontsize=12)
     ax1.set_ylabel('Temperature (°C)', fontsize=12)
     ax1.set_title('T-S Diagram with Water Masses', fontsize=14)
@@ -545,7 +843,6 @@ def plot_water_mass_analysis(
     
     # 온도 프로파일
     ax2 = fig.add_subplot(gs[1, 0])
-    mean_temp = temperature.mean(dim=['longitude', 'latitude'])
     ax2.plot(mean_temp, depth, 'r-', linewidth=2)
     ax2.set_xlabel('Temperature (°C)')
     ax2.set_ylabel('Depth (m)')
@@ -555,7 +852,6 @@ def plot_water_mass_analysis(
     
     # 염분 프로파일
     ax3 = fig.add_subplot(gs[1, 1])
-    mean_sal = salinity.mean(dim=['longitude', 'latitude'])
     ax3.plot(mean_sal, depth, 'b-', linewidth=2)
     ax3.set_xlabel('Salinity (PSU)')
     ax3.set_ylabel('Depth (m)')
@@ -579,20 +875,79 @@ def calculate_density_simple(temperature: np.ndarray, salinity: np.ndarray) -> n
     
     Parameters:
         temperature: 온도 (°C)
-        salinity: 염분 (PSU)
+        salinity: 염분 (PSU) - temperature와 브로드캐스팅 가능한 shape
         
     Returns:
         밀도 anomaly (sigma-t, kg/m³)
     """
     # 간단한 선형 근사
-    rho0 = 1000.0  # 기준 밀도
-    alpha = 0.2  # 열팽창 계수 근사
-    beta = 0.78  # 염분 수축 계수 근사
-    
-    sigma_t = -alpha * temperature + beta * salinity
+    sigma_t = -_LINEAR_ALPHA * temperature + _LINEAR_BETA * salinity
     return sigma_t
 
 
+def _sigma_t_unesco(t: Any, s: Any) -> Any:
+    """
+    UNESCO 1983 (EOS-80) 상태방정식, 해수면 압력(p=0)에서의 sigma-t
+    스칼라/배열 모두 사용 가능 (Numba 커널에서도 그대로 호출)
+    """
+    # 순수한 물의 밀도 (SMOW)
+    rho_w = (999.842594 + t * (6.793952e-2 + t * (-9.095290e-3 + t * (1.001685e-4
+             + t * (-1.120083e-6 + t * 6.536332e-9)))))
+    a = 8.24493e-1 + t * (-4.0899e-3 + t * (7.6438e-5 + t * (-8.2467e-7 + t * 5.3875e-9)))
+    b = -5.72466e-3 + t * (1.0227e-4 - t * 1.6546e-6)
+    c = 4.8314e-4
+    return rho_w + s * (a + b * np.sqrt(s) + c * s) - 1000.0
+
+
+if _HAS_NUMBA:
+    _sigma_t_unesco_jit = numba.njit(cache=True, fastmath=True)(_sigma_t_unesco)
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _density_unesco_kernel(t: np.ndarray, s: np.ndarray, out: np.ndarray) -> None:
+        """평탄화된 T/S 배열을 한 번의 병렬 루프로 계산 (중간 배열 없음)"""
+        for i in numba.prange(t.shape[0]):
+            out[i] = _sigma_t_unesco_jit(t[i], s[i])
+
+
+def calculate_density_unesco(temperature: np.ndarray, salinity: np.ndarray) -> np.ndarray:
+    """
+    해수 밀도 계산 (sigma-t)
+    UNESCO 1983 (EOS-80) 전체 다항식, 해수면 압력 기준
+    
+    Numba가 설치되어 있으면 JIT 병렬 루프로, 없으면 NumPy로 계산
+    
+    Parameters:
+        temperature: 온도 (°C)
+        salinity: 염분 (PSU) - temperature와 브로드캐스팅 가능한 shape
+        
+    Returns:
+        밀도 anomaly (sigma-t, kg/m³)
+    """
+    t, s = np.broadcast_arrays(np.asarray(temperature, dtype=np.float64),
+                               np.asarray(salinity, dtype=np.float64))
+    if not _HAS_NUMBA:
+        return _sigma_t_unesco(t, s)
+    
+    out = np.empty(t.shape, dtype=np.float64)
+    _density_unesco_kernel(np.ascontiguousarray(t).ravel(),
+                           np.ascontiguousarray(s).ravel(), out.reshape(-1))
+    return out
+
+
+# 등밀도선 계산식
+_DENSITY_FORMULAS = {
+    'linear': calculate_density_simple,
+    'unesco': calculate_density_unesco,
+}
+
+
+def _density_function(formula: str) -> Any:
+    """formula 이름('linear' 또는 'unesco')에 해당하는 밀도 계산 함수 반환"""
+    if formula not in _DENSITY_FORMULAS:
+        raise ValueError(f"지원하지 않는 밀도 계산식입니다: {formula} (사용 가능: {list(_DENSITY_FORMULAS)})")
+    return _DENSITY_FORMULAS[formula]
+
+
 def plot_seasonal_climatology(
     data: xr.DataArray,
     variable_name: str = 'Variable',
@@ -600,6 +955,7 @@ def plot_seasonal_climatology(
     figsize: Tuple[float, float] = (16, 10),
     cmap: str = 'RdBu_r',
     projection: Optional[ccrs.Projection] = None,
+    max_cells: Optional[Tuple[int, int]] = (2000, 2000),
     save_path: Optional[str] = None
 ) -> Tuple[plt.Figure, List[plt.Axes]]:
     """
@@ -612,6 +968,7 @@ def plot_seasonal_climatology(
         figsize: 그래프 크기
         cmap: 컬러맵
         projection: 지도 투영법
+        max_cells: (경도, 위도) 최대 셀 수, 초과 시 블록 평균으로 축소 (None이면 원본 해상도)
         save_path: 저장 경로
         
     Returns:
@@ -622,29 +979,35 @@ def plot_seasonal_climatology(
         
     # 계절별 평균 계산
     seasonal_data = data.groupby('time.season').mean()
+    seasonal_data = _decimate(seasonal_data, 'longitude', 'latitude', max_cells)
     seasons = ['DJF', 'MAM', 'JJA', 'SON']
     
     fig, axes = plt.subplots(2, 2, figsize=figsize,
                             subplot_kw={'projection': projection})
     axes = axes.flatten()
     
-    # 전체 데이터 범위로 컬러바 범위 설정
-    vmin = seasonal_data.min().values
-    vmax = seasonal_data.max().values
+    # 계절 평균을 한 번만 계산하고, 컬러바 범위는 메모리의 결과에서 바로 구함
+    seasonal_data, = _compute(seasonal_data)
+    values = seasonal_data.values
+    # 네 계절 패널이 같은 Normalize를 공유해 공통 컬러바와 색 범위가 일치
+    norm = mcolors.Normalize(vmin=np.nanmin(values), vmax=np.nanmax(values))
+    
+    # 네 계절 축이 같은 해안선 geometry를 공유
+    extent = (float(seasonal_data.longitude.min()), float(seasonal_data.longitude.max()),
+              float(seasonal_data.latitude.min()), float(seasonal_data.latitude.max()))
     
     for i, season in enumerate(seasons):
         ax = axes[i]
         
         # 해안선 추가
-        ax.add_feature(cfeature.LAND, color='lightgray')
-        ax.add_feature(cfeature.COASTLINE, linewidth=0.5)
+        _add_land_and_coast(ax, extent)
         ax.gridlines(draw_labels=True, alpha=0.3)
         
         # 데이터 플롯
         season_data = seasonal_data.sel(season=season)
-        im = ax.pcolormesh(season_data.longitude, season_data.latitude,
-                          season_data, transform=ccrs.PlateCarree(),
-                          cmap=cmap, vmin=vmin, vmax=vmax, shading='auto')
+        im = _pcolor(ax, season_data.longitude, season_data.latitude,
+                     season_data, transform=ccrs.PlateCarree(),
+                     cmap=cmap, norm=norm)
         
         ax.set_title(f'{season}', fontsize=12, fontweight='bold')
         
@@ -662,16 +1025,59 @@ def plot_seasonal_climatology(
 
 
 # 유틸리티 함수들
+def _render_frames(
+    frames: np.ndarray,
+    indices: List[int],
+    times: np.ndarray,
+    lon: np.ndarray,
+    lat: np.ndarray,
+    vmin: float,
+    vmax: float,
+    cmap: str,
+    output_dir: str,
+    title_template: str,
+    figsize: Tuple[float, float]
+) -> List[str]:
+    """
+    연속된 프레임 묶음을 렌더링 (ProcessPoolExecutor 작업 단위)
+    
+    Figure/메쉬/컬러바는 묶음마다 한 번만 만들고 프레임마다 데이터와 제목만 교체.
+    pyplot을 거치지 않고 Agg 캔버스에 직접 그려 호출한 쪽의 백엔드 설정은 그대로 유지
+    """
+    import os
+    
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    im = _pcolor(ax, lon, lat, frames[0], cmap=cmap, vmin=vmin, vmax=vmax)
+    fig.colorbar(im, ax=ax)
+    
+    frame_paths = []
+    for k, (i, t) in enumerate(zip(indices, times)):
+        if k > 0:
+            _update_pcolor(im, frames[k])
+        ax.set_title(title_template.format(frame=i, time=t))
+        
+        frame_path = os.path.join(output_dir, f'frame_{i:04d}.png')
+        fig.savefig(frame_path, dpi=100)
+        
+        frame_paths.append(frame_path)
+        
+    return frame_paths
+
+
 def create_animation_frames(
     data: xr.DataArray,
     time_dim: str = 'time',
     output_dir: str = 'animation_frames',
     title_template: str = 'Frame {frame}',
     cmap: str = 'RdBu_r',
+    max_workers: Optional[int] = None,
     **kwargs
 ) -> List[str]:
     """
     애니메이션용 프레임 생성
+    프레임을 연속된 묶음으로 나눠 여러 프로세스에서 동시에 렌더링
     
     Parameters:
         data: 시계열 데이터
@@ -679,37 +1085,46 @@ def create_animation_frames(
         output_dir: 프레임 저장 디렉토리
         title_template: 제목 템플릿
         cmap: 컬러맵
+        max_workers: 렌더링 프로세스 수 (None이면 CPU 코어 수, 1이면 현재 프로세스에서 처리)
         **kwargs: 추가 플롯 옵션
         
     Returns:
         생성된 프레임 파일 경로 리스트
     """
     import os
+    from concurrent.futures import ProcessPoolExecutor
     os.makedirs(output_dir, exist_ok=True)
     
-    frame_paths = []
     times = data[time_dim].values
+    figsize = kwargs.get('figsize', (10, 8))
     
     # 전체 데이터 범위로 컬러바 범위 고정
     vmin = data.min().values
     vmax = data.max().values
     
-    for i, t in enumerate(times):
-        fig, ax = plt.subplots(figsize=kwargs.get('figsize', (10, 8)))
-        
-        frame_data = data.sel({time_dim: t})
-        im = ax.pcolormesh(frame_data.longitude, frame_data.latitude,
-                          frame_data, cmap=cmap, vmin=vmin, vmax=vmax,
-                          shading='auto')
-        
-        plt.colorbar(im, ax=ax)
-        ax.set_title(title_template.format(frame=i, time=t))
-        
-        frame_path = os.path.join(output_dir, f'frame_{i:04d}.png')
-        plt.savefig(frame_path, dpi=100)
-        plt.close()
-        
-        frame_paths.append(frame_path)
+    # 프레임 데이터는 한 번만 메모리에 올려 작업 묶음별로 나눠 전달
+    frames = data.transpose(time_dim, 'latitude', 'longitude').values
+    lon = data.longitude.values
+    lat = data.latitude.values
+    
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    n_jobs = max(1, min(max_workers, len(times)))
+    blocks = [b for b in np.array_split(np.arange(len(times)), n_jobs) if b.size]
+    
+    def job_args(block):
+        return (frames[block[0]:block[-1] + 1], block.tolist(), times[block[0]:block[-1] + 1],
+                lon, lat, vmin, vmax, cmap, output_dir, title_template, figsize)
+    
+    frame_paths = []
+    if n_jobs == 1:
+        for block in blocks:
+            frame_paths.extend(_render_frames(*job_args(block)))
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            futures = [executor.submit(_render_frames, *job_args(block)) for block in blocks]
+            for future in futures:
+                frame_paths.extend(future.result())
         
     print(f"{len(frame_paths)}개 프레임 생성 완료: {output_dir}")
     return frame_paths
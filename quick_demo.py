@@ -3,11 +3,32 @@
 간단한 데모 - 자동으로 링크 찾고 다운로드
 """
 
+import re
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import time
 
+# lxml(C 확장) 파서 우선, 없으면 내장 파서
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = 'lxml'
+except ImportError:
+    _HTML_PARSER = 'html.parser'
+
+# 링크(<a href>) 태그만 파싱
+_ONLY_LINKS = SoupStrainer('a', href=True)
+
+# 튜토리얼 링크 키워드 / Mercator Ocean 공유 링크 패턴
+_TUTORIAL_KEYWORDS = re.compile(r'training|arctic|baltic|africa', re.IGNORECASE)
+_MERCATOR_SHARE = re.compile(r'atlas\.mercator-ocean\.fr/s/')
+
+# 데모에서 받을 최대 크기 (처음 1MB)
+DEMO_BYTES = 1024 * 1024
+
 def auto_find_and_download():
     """완전 자동 다운로드 데모"""
     
@@ -20,9 +41,14 @@ def auto_find_and_download():
     
     session = requests.Session()
     session.headers.update({'User-Agent': 'Mozilla/5.0'})
+    # 호스트별 TCP/TLS 연결 재사용 (keep-alive) + 일시적 오류 재시도
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16,
+                          max_retries=Retry(total=3, backoff_factor=0.3))
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
     
     response = session.get(url, timeout=10)
-    soup = BeautifulSoup(response.text, 'html.parser')
+    soup = BeautifulSoup(response.text, _HTML_PARSER, parse_only=_ONLY_LINKS)
     
     # 2. 자동으로 튜토리얼 링크 찾기
     print("2️⃣ 튜토리얼 링크 자동 탐색 중...")
@@ -31,7 +57,7 @@ def auto_find_and_download():
     tutorial_links = []
     for link in soup.find_all('a', href=True):
         href = link.get('href', '')
-        if any(keyword in href.lower() for keyword in ['training', 'arctic', 'baltic', 'africa']):
+        if _TUTORIAL_KEYWORDS.search(href):
             if href.startswith('/'):
                 full_url = f"https://marine.copernicus.eu{href}"
                 tutorial_links.append(full_url)
@@ -41,23 +67,32 @@ def auto_find_and_download():
     # 3. 각 튜토리얼에서 Mercator Ocean 링크 찾기
     print("3️⃣ 다운로드 링크 자동 추출 중...")
     
-    download_links = []
-    for tutorial_url in tutorial_links[:3]:  # 처음 3개만 테스트
+    def fetch(tutorial_url):
         try:
-            resp = session.get(tutorial_url, timeout=5)
-            sub_soup = BeautifulSoup(resp.text, 'html.parser')
-            
-            # Mercator Ocean 링크 찾기
-            for link in sub_soup.find_all('a', href=True):
-                href = link.get('href', '')
-                if 'atlas.mercator-ocean.fr/s/' in href:
-                    # 자동으로 /download 추가
-                    download_url = href if href.endswith('/download') else href + '/download'
-                    download_links.append(download_url)
-                    print(f"   ✓ 발견: {href.split('/')[-1][:10]}...")
-                    break
-        except:
-            pass
+            return session.get(tutorial_url, timeout=5).text
+        except requests.RequestException:
+            return None
+    
+    # 튜토리얼 페이지는 동시에 요청하고, 파싱은 원래 순서대로 처리
+    download_links = []
+    targets = tutorial_links[:3]  # 처음 3개만 테스트
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        pages = list(executor.map(fetch, targets))
+    
+    for text in pages:
+        if text is None:
+            continue
+        sub_soup = BeautifulSoup(text, _HTML_PARSER, parse_only=_ONLY_LINKS)
+        
+        # Mercator Ocean 링크 찾기
+        for link in sub_soup.find_all('a', href=True):
+            href = link.get('href', '')
+            if _MERCATOR_SHARE.search(href):
+                # 자동으로 /download 추가
+                download_url = href if href.endswith('/download') else href + '/download'
+                download_links.append(download_url)
+                print(f"   ✓ 발견: {href.split('/')[-1][:10]}...")
+                break
     
     print(f"\n📊 결과:")
     print(f"   - 튜토리얼 페이지: {len(tutorial_links)}개")
@@ -75,31 +110,23 @@ def auto_find_and_download():
             print(f"URL: {url}")
             
             try:
-                # 파일 정보 확인
-                head = session.head(url, allow_redirects=True, timeout=10)
-                content_type = head.headers.get('content-type', '')
-                
-                if 'zip' in content_type.lower() or 'octet-stream' in content_type:
-                    print("✓ ZIP 파일 확인")
-                    
-                    # 작은 부분만 다운로드 (데모용)
-                    response = session.get(url, stream=True, timeout=10)
-                    
-                    filename = f"tutorial_{i}.zip"
-                    filepath = download_dir / filename
-                    
-                    # 처음 1MB만 다운로드 (데모)
-                    with open(filepath, 'wb') as f:
-                        downloaded = 0
-                        for chunk in response.iter_content(chunk_size=8192):
-                            if chunk:
-                                f.write(chunk)
-                                downloaded += len(chunk)
-                                if downloaded > 1024 * 1024:  # 1MB
-                                    break
+                # HEAD 없이 스트리밍 GET 한 번으로 파일 정보 확인 (본문은 필요할 때만 읽음)
+                with session.get(url, stream=True, timeout=10) as response:
+                    content_type = response.headers.get('content-type', '')
                     
-                    size_kb = filepath.stat().st_size / 1024
-                    print(f"✓ 다운로드 완료: {filename} ({size_kb:.1f}KB)")
+                    if 'zip' in content_type.lower() or 'octet-stream' in content_type:
+                        print("✓ ZIP 파일 확인")
+                        
+                        filename = f"tutorial_{i}.zip"
+                        filepath = download_dir / filename
+                        
+                        # 처음 1MB만 한 번에 읽어서 저장 (데모용), 나머지는 받지 않고 연결 종료
+                        response.raw.decode_content = True
+                        with open(filepath, 'wb') as f:
+                            f.write(response.raw.read(DEMO_BYTES))
+                        
+                        size_kb = filepath.stat().st_size / 1024
+                        print(f"✓ 다운로드 완료: {filename} ({size_kb:.1f}KB)")
                     
             except Exception as e:
                 print(f"✗ 실패: {str(e)[:50]}")
@@ -9,30 +9,90 @@ import re
 import json
 import time
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Tuple, Optional
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
 from tqdm import tqdm
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+
+# lxml(C 확장) 파서 우선, 없으면 내장 파서
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = 'lxml'
+except ImportError:
+    _HTML_PARSER = 'html.parser'
+
+# selectolax(lexbor, C 확장)가 있으면 CSS 선택자로 링크 추출, 없으면 BeautifulSoup
+try:
+    from selectolax.lexbor import LexborHTMLParser, SelectolaxError
+    _HAS_SELECTOLAX = True
+except ImportError:
+    _HAS_SELECTOLAX = False
+
+# 분할(Range) 병렬 다운로드 대상: 이 크기 이상인 대용량 파일 형식
+RANGED_MIN_BYTES = 8 * 1024 * 1024
+RANGED_EXTENSIONS = ('.nc', '.zip', '.tar', '.pdf')
+RANGED_CHUNKS = 8
+# 다운로드 워커 1개당 대기열에 쌓아둘 수 있는 파일 수
+DOWNLOAD_BACKLOG = 4
+COPY_BUFFER_BYTES = 1024 * 1024
+# Selenium 렌더링 대기 상한 (링크가 나타나면 즉시 반환)
+PAGE_LOAD_TIMEOUT = 10
+
+# 정적 HTML에 튜토리얼/리소스 링크나 카드가 하나라도 있으면 Selenium 렌더링 생략
+_CONTENT_LINK = re.compile(r'tutorial|notebook|\.(?:ipynb|nc|csv|json|py|zip|tar|pdf)', re.I)
+_CONTENT_CLASS = re.compile(r'tutorial|card|item|resource', re.I)
+_CONTENT_TAGS = SoupStrainer(['a', 'div', 'li'])
 
 
 class CopernicusScraper:
     """코페르니쿠스 튜토리얼 스크래퍼 클래스"""
     
-    def __init__(self, base_url: str = None, output_dir: str = "tutorials"):
+    # 다양한 패턴으로 튜토리얼 링크 찾기 (정규식은 한 번만 컴파일)
+    _TUTORIAL_PATTERNS = [
+        # Pattern 1: 직접 링크
+        ('a', {'href': re.compile(r'tutorial|notebook|\.ipynb', re.I)}),
+        # Pattern 2: 카드 형식
+        ('div', {'class': re.compile(r'tutorial|card|item', re.I)}),
+        # Pattern 3: 리스트 아이템
+        ('li', {'class': re.compile(r'tutorial|resource', re.I)}),
+    ]
+    
+    # 다운로드 가능한 파일 패턴
+    _RESOURCE_RE = re.compile('|'.join([
+        r'\.ipynb',  # Jupyter notebooks
+        r'\.nc',     # NetCDF files
+        r'\.csv',    # CSV files
+        r'\.json',   # JSON files
+        r'\.py',     # Python scripts
+        r'\.zip',    # Zip archives
+        r'\.tar',    # Tar archives
+        r'\.pdf',    # PDF documents
+    ]), re.I)
+    
+    # 위 패턴과 같은 조건의 CSS 선택자 (selectolax용, 패턴 순서 동일)
+    _TUTORIAL_SELECTORS = [
+        'a[href*="tutorial" i], a[href*="notebook" i], a[href*=".ipynb" i]',
+        'div[class*="tutorial" i], div[class*="card" i], div[class*="item" i]',
+        'li[class*="tutorial" i], li[class*="resource" i]',
+    ]
+    _RESOURCE_SELECTOR = ', '.join(
+        f'a[href*=".{ext}" i]' for ext in ('ipynb', 'nc', 'csv', 'json', 'py', 'zip', 'tar', 'pdf')
+    )
+    
+    def __init__(self, base_url: str = None, output_dir: str = "tutorials", max_workers: int = 8,
+                 page_workers: int = 32):
         """
         Parameters:
             base_url: 코페르니쿠스 튜토리얼 페이지 URL
             output_dir: 다운로드할 디렉토리 경로
+            max_workers: 동시에 진행할 파일 다운로드 수
+            page_workers: 동시에 가져올 튜토리얼 페이지 수
         """
         self.base_url = base_url or "https://marine.copernicus.eu/services/user-learning-services/tutorials"
         self.output_dir = Path(output_dir)
@@ -41,16 +101,35 @@ class CopernicusScraper:
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
+        # 연결 재사용 (분할 다운로드는 파일당 RANGED_CHUNKS개 연결 사용)
+        adapter = HTTPAdapter(pool_connections=32,
+                              pool_maxsize=max(32, page_workers + max_workers * RANGED_CHUNKS))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.max_workers = max_workers
+        self.page_workers = page_workers
+        # 다운로드 대기열 상한 - 넘치면 페이지 워커가 자리가 날 때까지 대기
+        self._download_slots = threading.BoundedSemaphore(max_workers * DOWNLOAD_BACKLOG)
         self.metadata = []
         self.driver = None
+        # WebDriver는 스레드 간 공유 불가 - 한 번에 한 페이지만 렌더링
+        self._driver_lock = threading.Lock()
         
     def setup_selenium(self):
         """Selenium WebDriver 설정"""
+        # Selenium은 렌더링이 필요할 때만 로드
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service
+        from webdriver_manager.chrome import ChromeDriverManager
+        
         chrome_options = Options()
         chrome_options.add_argument('--headless')
         chrome_options.add_argument('--no-sandbox')
         chrome_options.add_argument('--disable-dev-shm-usage')
         chrome_options.add_argument('--disable-gpu')
+        # DOMContentLoaded에서 driver.get 반환 (이미지 등 나머지 리소스는 기다리지 않음)
+        chrome_options.page_load_strategy = 'eager'
         
         service = Service(ChromeDriverManager().install())
         self.driver = webdriver.Chrome(service=service, options=chrome_options)
@@ -60,6 +139,13 @@ class CopernicusScraper:
         if self.driver:
             self.driver.quit()
             
+    @staticmethod
+    def _has_content_links(html: str) -> bool:
+        """정적 HTML에 추출 대상(튜토리얼/리소스 링크, 카드)이 있는지 확인"""
+        soup = BeautifulSoup(html, _HTML_PARSER, parse_only=_CONTENT_TAGS)
+        return (soup.find('a', href=_CONTENT_LINK) is not None
+                or soup.find(['div', 'li'], class_=_CONTENT_CLASS) is not None)
+        
     def get_page_content(self, url: str) -> str:
         """
         페이지 콘텐츠 가져오기 (JavaScript 렌더링 처리)
@@ -73,18 +159,31 @@ class CopernicusScraper:
         try:
             # 먼저 requests로 시도
             response = self.session.get(url, timeout=30)
-            if response.status_code == 200:
+            if response.status_code == 200 and self._has_content_links(response.text):
                 return response.text
-        except:
+        except requests.RequestException:
             pass
             
-        # JavaScript 렌더링이 필요한 경우 Selenium 사용
-        if not self.driver:
-            self.setup_selenium()
-            
-        self.driver.get(url)
-        time.sleep(3)  # 페이지 로딩 대기
-        return self.driver.page_source
+        # JavaScript 렌더링이 필요한 경우(링크가 없는 뼈대 HTML) Selenium 사용
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        
+        # 드라이버는 한 번만 띄워서 모든 페이지에 재사용
+        with self._driver_lock:
+            if not self.driver:
+                self.setup_selenium()
+                
+            self.driver.get(url)
+            # 고정 대기 대신 링크가 렌더링되는 즉시 반환
+            try:
+                WebDriverWait(self.driver, PAGE_LOAD_TIMEOUT).until(
+                    EC.presence_of_element_located((By.TAG_NAME, 'a'))
+                )
+            except TimeoutException:
+                pass  # 링크 없는 페이지 - 현재까지 렌더링된 내용 사용
+            return self.driver.page_source
         
     def extract_tutorial_links(self) -> List[Dict]:
         """
@@ -95,57 +194,78 @@ class CopernicusScraper:
         """
         print(f"페이지 분석 중: {self.base_url}")
         content = self.get_page_content(self.base_url)
-        soup = BeautifulSoup(content, 'html.parser')
         
         tutorials = []
+        seen_urls = set()
         tutorial_id = 1
         
-        # 다양한 패턴으로 튜토리얼 링크 찾기
-        patterns = [
-            # Pattern 1: 직접 링크
-            ('a', {'href': re.compile(r'tutorial|notebook|\.ipynb', re.I)}),
-            # Pattern 2: 카드 형식
-            ('div', {'class': re.compile(r'tutorial|card|item', re.I)}),
-            # Pattern 3: 리스트 아이템
-            ('li', {'class': re.compile(r'tutorial|resource', re.I)}),
-        ]
-        
-        for tag, attrs in patterns:
-            elements = soup.find_all(tag, attrs)
-            for elem in elements:
-                # 링크 추출
-                link = None
-                if tag == 'a':
-                    link = elem.get('href')
-                else:
-                    link_elem = elem.find('a')
-                    if link_elem:
-                        link = link_elem.get('href')
-                
-                if not link:
-                    continue
-                    
-                # 절대 URL로 변환
-                if not link.startswith('http'):
-                    link = f"https://marine.copernicus.eu{link}"
+        for link, text in self._tutorial_candidates(content):
+            if not link:
+                continue
                 
-                # 제목 추출
-                title = elem.get_text(strip=True)[:100] if elem.get_text() else f"Tutorial_{tutorial_id}"
-                title = self.sanitize_filename(title)
+            # 절대 URL로 변환
+            if not link.startswith('http'):
+                link = f"https://marine.copernicus.eu{link}"
+            
+            # 제목 추출
+            title = text[:100] if text else f"Tutorial_{tutorial_id}"
+            title = self.sanitize_filename(title)
+            
+            # 중복 체크
+            if link in seen_urls:
+                continue
+            seen_urls.add(link)
+            tutorials.append({
+                'id': tutorial_id,
+                'title': title,
+                'url': link,
+                'folder': f"{tutorial_id:02d}_{title}"
+            })
+            tutorial_id += 1
                 
-                # 중복 체크
-                if not any(t['url'] == link for t in tutorials):
-                    tutorials.append({
-                        'id': tutorial_id,
-                        'title': title,
-                        'url': link,
-                        'folder': f"{tutorial_id:02d}_{title}"
-                    })
-                    tutorial_id += 1
-                    
         print(f"발견된 튜토리얼: {len(tutorials)}개")
         return tutorials
         
+    def _tutorial_candidates(self, content: str) -> List[Tuple[Optional[str], str]]:
+        """
+        튜토리얼 후보 요소의 (링크, 텍스트) 목록 - 패턴 순서, 패턴 안에서는 문서 순서
+        
+        selectolax가 있으면 CSS 선택자로, 없거나 실패하면 BeautifulSoup으로 추출
+        """
+        if _HAS_SELECTOLAX:
+            try:
+                tree = LexborHTMLParser(content)
+                candidates = []
+                for (tag, _), selector in zip(self._TUTORIAL_PATTERNS, self._TUTORIAL_SELECTORS):
+                    for node in tree.css(selector):
+                        link_node = node if tag == 'a' else node.css_first('a')
+                        link = link_node.attributes.get('href') if link_node else None
+                        candidates.append((link, node.text(strip=True)))
+                return candidates
+            except SelectolaxError:
+                pass
+                
+        soup = BeautifulSoup(content, _HTML_PARSER)
+        candidates = []
+        for tag, attrs in self._TUTORIAL_PATTERNS:
+            for elem in soup.find_all(tag, attrs):
+                link_elem = elem if tag == 'a' else elem.find('a')
+                link = link_elem.get('href') if link_elem else None
+                candidates.append((link, elem.get_text(strip=True)))
+        return candidates
+        
+    def _resource_hrefs(self, content: str) -> List[str]:
+        """다운로드 가능한 파일 링크(href) 목록 - selectolax 우선, 실패 시 BeautifulSoup"""
+        if _HAS_SELECTOLAX:
+            try:
+                tree = LexborHTMLParser(content)
+                return [node.attributes.get('href') for node in tree.css(self._RESOURCE_SELECTOR)]
+            except SelectolaxError:
+                pass
+                
+        soup = BeautifulSoup(content, _HTML_PARSER)
+        return [link.get('href') for link in soup.find_all('a', href=self._RESOURCE_RE)]
+        
     def sanitize_filename(self, filename: str) -> str:
         """
         파일명으로 사용할 수 없는 문자 제거
@@ -178,26 +298,10 @@ class CopernicusScraper:
             리소스 정보 리스트
         """
         resources = []
+        seen_urls = set()
         content = self.get_page_content(tutorial_url)
-        soup = BeautifulSoup(content, 'html.parser')
-        
-        # 다운로드 가능한 파일 패턴
-        file_patterns = [
-            r'\.ipynb',  # Jupyter notebooks
-            r'\.nc',     # NetCDF files
-            r'\.csv',    # CSV files
-            r'\.json',   # JSON files
-            r'\.py',     # Python scripts
-            r'\.zip',    # Zip archives
-            r'\.tar',    # Tar archives
-            r'\.pdf',    # PDF documents
-        ]
-        
-        pattern = '|'.join(file_patterns)
-        links = soup.find_all('a', href=re.compile(pattern, re.I))
-        
-        for link in links:
-            href = link.get('href')
+        
+        for href in self._resource_hrefs(content):
             if not href:
                 continue
                 
@@ -208,6 +312,11 @@ class CopernicusScraper:
                 else:
                     href = f"{tutorial_url}/{href}"
                     
+            # 같은 파일을 가리키는 중복 링크 제거
+            if href in seen_urls:
+                continue
+            seen_urls.add(href)
+            
             # 파일명 추출
             filename = href.split('/')[-1].split('?')[0]
             if not filename:
@@ -221,10 +330,121 @@ class CopernicusScraper:
             
         return resources
         
+    def _probe_range_size(self, url: str) -> Optional[int]:
+        """
+        서버가 Range 요청을 지원하면 파일 크기를, 아니면 None 반환
+        
+        HEAD의 Accept-Ranges/Content-Length를 먼저 보고, 없으면 'Range: bytes=0-0' GET의
+        206 응답(Content-Range)으로 확인
+        """
+        head = self.session.head(url, allow_redirects=True, timeout=30)
+        if head.ok and 'bytes' in head.headers.get('accept-ranges', '').lower():
+            size = head.headers.get('content-length')
+            if size and size.isdigit():
+                return int(size)
+                
+        with self.session.get(url, headers={'Range': 'bytes=0-0'}, stream=True, timeout=30) as response:
+            content_range = response.headers.get('content-range', '')
+            if response.status_code == 206 and '/' in content_range:
+                total = content_range.rsplit('/', 1)[1]
+                if total.isdigit():
+                    return int(total)
+        return None
+        
+    def _download_ranged(self, url: str, filepath: Path, chunks: int = RANGED_CHUNKS) -> bool:
+        """
+        대용량 파일을 바이트 구간으로 나눠 여러 연결로 동시에 다운로드
+        
+        Parameters:
+            url: 다운로드 URL
+            filepath: 저장할 파일 경로
+            chunks: 동시 연결(구간) 수
+            
+        Returns:
+            분할 다운로드를 수행했으면 True, 대상이 아니면(작은 파일, Range 미지원) False
+            (구간 다운로드 중 오류는 예외로 전달되어 download_file의 재시도로 처리)
+        """
+        size = self._probe_range_size(url)
+        if size is None or size < RANGED_MIN_BYTES:
+            return False
+            
+        # 받는 중에는 .part에 기록하고, 모든 구간이 끝난 뒤에만 최종 경로로 이동
+        # (중단 시 0으로 채워진 파일이 완료된 파일로 남지 않도록)
+        part_path, validator_path = self._part_paths(filepath)
+        # 스트리밍 이어받기 정보는 이 .part와 맞지 않으므로 삭제
+        validator_path.unlink(missing_ok=True)
+        
+        # 전체 크기로 미리 할당한 파일에 각 스레드가 자기 구간 위치부터 기록
+        with open(part_path, 'wb') as f:
+            f.truncate(size)
+            
+        step = -(-size // chunks)
+        ranges = [(start, min(start + step, size) - 1) for start in range(0, size, step)]
+        lock = threading.Lock()
+        
+        with tqdm(total=size, unit='B', unit_scale=True, desc=filepath.name) as pbar:
+            def fetch(byte_range):
+                start, end = byte_range
+                headers = {'Range': f'bytes={start}-{end}'}
+                with self.session.get(url, headers=headers, stream=True, timeout=60) as response:
+                    if response.status_code != 206:
+                        raise IOError(f"Range 요청 실패 (HTTP {response.status_code})")
+                    with open(part_path, 'r+b') as f:
+                        f.seek(start)
+                        for chunk in response.iter_content(chunk_size=COPY_BUFFER_BYTES):
+                            f.write(chunk)
+                            with lock:
+                                pbar.update(len(chunk))
+                        if f.tell() != end + 1:
+                            raise IOError(f"구간 크기 불일치: {start}-{end}")
+                            
+            try:
+                with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+                    list(executor.map(fetch, ranges))
+            except Exception:
+                part_path.unlink(missing_ok=True)
+                raise
+                
+        part_path.replace(filepath)
+        return True
+        
+    @staticmethod
+    def _part_paths(filepath: Path) -> Tuple[Path, Path]:
+        """받는 중인 파일('<파일명>.part')과 이어받기 검증값 파일('<파일명>.part.json') 경로"""
+        return (filepath.with_name(filepath.name + '.part'),
+                filepath.with_name(filepath.name + '.part.json'))
+        
+    @staticmethod
+    def _load_validator(validator_path: Path) -> Optional[str]:
+        """이어받기용 검증값 (ETag 우선, 없으면 Last-Modified) 읽기"""
+        try:
+            with open(validator_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return data.get('etag') or data.get('last_modified')
+        
+    @staticmethod
+    def _save_validator(validator_path: Path, response: requests.Response) -> None:
+        """응답의 ETag/Last-Modified를 .part 옆에 저장 (없으면 이어받기 불가이므로 삭제)"""
+        etag = response.headers.get('etag')
+        # 약한 ETag(W/)는 If-Range에 사용할 수 없음
+        if etag and etag.startswith('W/'):
+            etag = None
+        last_modified = response.headers.get('last-modified')
+        if not (etag or last_modified):
+            validator_path.unlink(missing_ok=True)
+            return
+        with open(validator_path, 'w', encoding='utf-8') as f:
+            json.dump({'etag': etag, 'last_modified': last_modified}, f)
+        
     def download_file(self, url: str, filepath: Path, retry: int = 3) -> bool:
         """
         파일 다운로드
         
+        받는 중인 데이터는 '<파일명>.part'에 저장하고, 재시도 시 이미 받은 부분은
+        'Range: bytes=N-'로 이어받음 (If-Range로 서버 파일이 바뀌었으면 처음부터 다시 받음)
+        
         Parameters:
             url: 다운로드 URL
             filepath: 저장할 파일 경로
@@ -233,25 +453,42 @@ class CopernicusScraper:
         Returns:
             성공 여부
         """
+        part_path, validator_path = self._part_paths(filepath)
+        ranged = filepath.suffix.lower() in RANGED_EXTENSIONS
         for attempt in range(retry):
             try:
-                response = self.session.get(url, stream=True, timeout=60)
-                response.raise_for_status()
-                
-                # 파일 크기 확인
-                total_size = int(response.headers.get('content-length', 0))
+                # 대용량 파일 형식은 Range 분할 다운로드 우선 (대상이 아니면 일반 다운로드)
+                if ranged and self._download_ranged(url, filepath):
+                    return True
+                    
+                # 이전 시도에서 받은 부분이 있고 검증값(ETag/Last-Modified)이 있으면 이어받기
+                existing = part_path.stat().st_size if part_path.exists() else 0
+                validator = self._load_validator(validator_path) if existing else None
+                headers = {'Range': f'bytes={existing}-', 'If-Range': validator} if validator else {}
                 
-                # 다운로드
-                with open(filepath, 'wb') as f:
-                    if total_size == 0:
-                        f.write(response.content)
+                with self.session.get(url, headers=headers, stream=True, timeout=60) as response:
+                    response.raise_for_status()
+                    
+                    if response.status_code == 206:
+                        mode = 'ab'
                     else:
-                        with tqdm(total=total_size, unit='B', unit_scale=True, desc=filepath.name) as pbar:
-                            for chunk in response.iter_content(chunk_size=8192):
-                                if chunk:
-                                    f.write(chunk)
-                                    pbar.update(len(chunk))
-                                    
+                        # 서버가 Range를 무시했거나(200) 파일이 바뀜 - 처음부터 다시 받기
+                        mode, existing = 'wb', 0
+                        self._save_validator(validator_path, response)
+                        
+                    # 파일 크기 확인
+                    remaining = int(response.headers.get('content-length', 0))
+                    
+                    # 다운로드
+                    with open(part_path, mode) as f, \
+                         tqdm(total=existing + remaining if remaining else None, initial=existing,
+                              unit='B', unit_scale=True, desc=filepath.name) as pbar:
+                        for chunk in response.iter_content(chunk_size=COPY_BUFFER_BYTES):
+                            f.write(chunk)
+                            pbar.update(len(chunk))
+                            
+                part_path.replace(filepath)
+                validator_path.unlink(missing_ok=True)
                 return True
                 
             except Exception as e:
@@ -272,6 +509,23 @@ class CopernicusScraper:
         Returns:
             처리 결과
         """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as downloads:
+            result, pending = self.queue_tutorial(tutorial, downloads)
+        return self.collect_tutorial(result, pending)
+        
+    def queue_tutorial(self, tutorial: Dict, downloads: ThreadPoolExecutor) -> Tuple[Dict, List]:
+        """
+        튜토리얼 페이지에서 리소스를 찾아 다운로드 풀에 넣고 바로 반환 (파이프라인 1단계)
+        
+        대기 중인 다운로드가 max_workers * DOWNLOAD_BACKLOG 개를 넘으면 자리가 날 때까지 대기
+        
+        Parameters:
+            tutorial: 튜토리얼 정보
+            downloads: 다운로드 스레드 풀
+            
+        Returns:
+            (처리 결과, [(리소스, 파일 경로, Future), ...])
+        """
         print(f"\n처리 중: {tutorial['title']}")
         
         # 튜토리얼 폴더 생성
@@ -290,25 +544,43 @@ class CopernicusScraper:
             'failed': 0
         }
         
-        # 리소스 다운로드
+        # 이미 존재하는 파일(같은 페이지의 중복 링크 포함) 스킵
+        pending = []
+        queued = set()
         for resource in resources:
             filepath = tutorial_dir / resource['filename']
-            
-            # 이미 존재하는 파일 스킵
-            if filepath.exists():
+            if filepath.exists() or filepath in queued:
                 print(f"  스킵 (이미 존재): {resource['filename']}")
                 result['success'] += 1
                 continue
-                
-            # 다운로드
-            if self.download_file(resource['url'], filepath):
+            queued.add(filepath)
+            
+            self._download_slots.acquire()
+            future = downloads.submit(self.download_file, resource['url'], filepath)
+            future.add_done_callback(lambda _: self._download_slots.release())
+            pending.append((resource, filepath, future))
+            
+        return result, pending
+        
+    def collect_tutorial(self, result: Dict, pending: List) -> Dict:
+        """
+        queue_tutorial로 넣은 다운로드가 끝나길 기다려 결과 정리 (결과는 발견 순서대로 기록)
+        
+        Parameters:
+            result: queue_tutorial의 처리 결과
+            pending: queue_tutorial의 다운로드 목록
+            
+        Returns:
+            처리 결과
+        """
+        for resource, filepath, future in pending:
+            if future.result():
                 result['success'] += 1
                 resource['downloaded'] = True
                 resource['path'] = str(filepath)
             else:
                 result['failed'] += 1
                 resource['downloaded'] = False
-                
             result['resources'].append(resource)
             
         return result
@@ -339,10 +611,19 @@ class CopernicusScraper:
                 print("튜토리얼을 찾을 수 없습니다.")
                 return
                 
-            # 각 튜토리얼 처리
-            for tutorial in tqdm(tutorials, desc="전체 진행"):
-                result = self.process_tutorial(tutorial)
-                self.metadata.append(result)
+            # 페이지 수집과 다운로드를 별도 풀에서 파이프라인으로 처리
+            # (페이지 워커가 리소스를 계속 넣는 동안 다운로드 워커가 비지 않음)
+            queued = {}
+            with ThreadPoolExecutor(max_workers=self.max_workers) as downloads:
+                with ThreadPoolExecutor(max_workers=self.page_workers) as pages:
+                    futures = {pages.submit(self.queue_tutorial, tutorial, downloads): tutorial['id']
+                               for tutorial in tutorials}
+                    for future in tqdm(as_completed(futures), total=len(futures), desc="페이지 수집"):
+                        queued[futures[future]] = future.result()
+                        
+                # 모든 다운로드가 끝난 뒤 메타데이터는 튜토리얼 순서대로 저장
+                for tutorial in tqdm(tutorials, desc="다운로드"):
+                    self.metadata.append(self.collect_tutorial(*queued[tutorial['id']]))
                 
             # 메타데이터 저장
             self.save_metadata()
@@ -377,11 +658,24 @@ def main():
         help='출력 디렉토리',
         default='tutorials'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help='동시 다운로드 수',
+        default=8
+    )
+    parser.add_argument(
+        '--page-workers',
+        type=int,
+        help='동시에 가져올 튜토리얼 페이지 수',
+        default=32
+    )
     
     args = parser.parse_args()
     
     # 스크래퍼 실행
-    scraper = CopernicusScraper(base_url=args.url, output_dir=args.output)
+    scraper = CopernicusScraper(base_url=args.url, output_dir=args.output,
+                                max_workers=args.workers, page_workers=args.page_workers)
     scraper.run()
 
 
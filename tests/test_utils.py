@@ -11,6 +11,7 @@ from unittest.mock import patch, MagicMock
 import numpy as np
 import pandas as pd
 import xarray as xr
+from scipy import stats
 from datetime import datetime, timedelta
 
 # 상위 디렉토리의 모듈 import
@@ -59,6 +60,35 @@ class TestCopernicusUtils(unittest.TestCase):
             'valid_max': 35.0
         }
         
+    def test_load_dataset(self):
+        """데이터셋 로딩 함수 테스트 (파일 청크 크기 사용)"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'sst.nc')
+            self.ds[['sst']].to_netcdf(
+                path, encoding={'sst': {'chunksizes': (30, 10, 10)}}
+            )
+
+            ds = cu.load_dataset(path)
+            xr.testing.assert_allclose(ds['sst'].compute(), self.ds['sst'])
+            if cu._HAS_DASK:
+                self.assertEqual(ds['sst'].data.chunksize, (30, 10, 10))
+            ds.close()
+
+            # float32 변환
+            ds = cu.load_dataset(path, dtype='float32')
+            self.assertEqual(ds['sst'].dtype, np.float32)
+            ds.close()
+
+            # 여러 파일 결합
+            path1 = os.path.join(tmp_dir, 'sst_1.nc')
+            path2 = os.path.join(tmp_dir, 'sst_2.nc')
+            self.ds[['sst']].isel(time=slice(0, 100)).to_netcdf(path1)
+            self.ds[['sst']].isel(time=slice(100, None)).to_netcdf(path2)
+            if cu._HAS_DASK:
+                ds = cu.load_dataset([path1, path2])
+                self.assertEqual(ds.sizes['time'], len(self.time))
+                ds.close()
+
     def test_subset_region(self):
         """지역 추출 함수 테스트"""
         lon_range = (122, 128)
@@ -74,6 +104,12 @@ class TestCopernicusUtils(unittest.TestCase):
         
         # 데이터 크기 확인
         self.assertLess(len(subset.longitude), len(self.ds.longitude))
+        
+        # 축약된 차원 이름 (lon/lat) 자동 인식
+        renamed = self.ds.rename({'longitude': 'lon', 'latitude': 'lat'})
+        subset_short = cu.subset_region(renamed, lon_range, lat_range)
+        self.assertEqual(subset_short.sizes['lon'], subset.sizes['longitude'])
+        self.assertEqual(subset_short.sizes['lat'], subset.sizes['latitude'])
         self.assertLess(len(subset.latitude), len(self.ds.latitude))
         
     def test_subset_time(self):
@@ -90,6 +126,23 @@ class TestCopernicusUtils(unittest.TestCase):
         # 데이터 크기 확인
         self.assertLess(len(subset.time), len(self.ds.time))
         
+    def test_subset(self):
+        """지역/시간 동시 추출 함수 테스트"""
+        fused = cu.subset(self.ds, (122, 128), (32, 38), '2020-06-01', '2020-08-31')
+        expected = self.ds.sel(
+            longitude=slice(122, 128),
+            latitude=slice(32, 38),
+            time=slice('2020-06-01', '2020-08-31')
+        )
+        xr.testing.assert_identical(fused, expected)
+
+        # 위도가 감소하는 좌표도 sel과 동일하게 처리
+        ds_desc = self.ds.isel(latitude=slice(None, None, -1))
+        xr.testing.assert_identical(
+            cu.subset(ds_desc, lat_range=(38, 32)),
+            ds_desc.sel(latitude=slice(38, 32))
+        )
+
     def test_calculate_spatial_mean(self):
         """공간 평균 계산 함수 테스트"""
         # 위도 가중치 적용
@@ -105,6 +158,11 @@ class TestCopernicusUtils(unittest.TestCase):
         # 값이 합리적인 범위인지 확인
         self.assertTrue(mean_weighted.min() > 0)
         self.assertTrue(mean_weighted.max() < 30)
+
+        # xarray weighted 평균과 동일한지 확인
+        weights = np.cos(np.deg2rad(self.ds.latitude))
+        expected = self.ds['sst'].weighted(weights).mean(dim=['latitude', 'longitude'])
+        xr.testing.assert_allclose(mean_weighted, expected)
         
     def test_create_timeseries(self):
         """시계열 생성 함수 테스트"""
@@ -123,6 +181,17 @@ class TestCopernicusUtils(unittest.TestCase):
         self.assertEqual(len(ts_mean), len(self.time))
         self.assertEqual(len(ts_point), len(self.time))
         
+        # 최근접 지점 값과 일치하는지 확인
+        expected = self.ds['sst'].sel(longitude=125.2, latitude=35.1, method='nearest')
+        ts_near = cu.create_timeseries(self.ds, 'sst', lon_point=125.2, lat_point=35.1)
+        np.testing.assert_array_equal(ts_near.values, expected.values)
+        
+        # 여러 지점은 지점별 열을 가진 DataFrame
+        ts_multi = cu.create_timeseries(self.ds, 'sst',
+                                       lon_point=[125, 128], lat_point=[35, 38])
+        self.assertIsInstance(ts_multi, pd.DataFrame)
+        self.assertEqual(ts_multi.shape, (len(self.time), 2))
+        
     def test_calculate_anomaly(self):
         """이상치 계산 함수 테스트"""
         anomaly = cu.calculate_anomaly(self.ds, 'sst')
@@ -133,6 +202,13 @@ class TestCopernicusUtils(unittest.TestCase):
         
         # 이상치의 평균이 대략 0에 가까운지 확인
         self.assertAlmostEqual(float(anomaly.mean()), 0, delta=0.1)
+
+        # 백분율 이상치 = 이상치 / 월별 기후값 * 100
+        percentage = cu.calculate_anomaly(self.ds, 'sst', method='percentage')
+        climatology = self.ds['sst'].groupby('time.month').mean('time')
+        expected = (anomaly.groupby('time.month') / climatology) * 100
+        self.assertEqual(percentage.shape, self.ds['sst'].shape)
+        np.testing.assert_allclose(percentage.values, expected.values)
         
     def test_apply_moving_average(self):
         """이동평균 함수 테스트"""
@@ -148,6 +224,13 @@ class TestCopernicusUtils(unittest.TestCase):
         # 스무딩 효과 확인 (분산이 줄어들어야 함)
         self.assertLess(ts_smooth.std(), ts.std())
         
+        # pandas rolling 결과와 일치 (짝수 윈도우 중앙 정렬, 결측 포함)
+        ts.iloc[[5, 6, 40]] = np.nan
+        for center in (True, False):
+            expected = ts.rolling(window=30, center=center, min_periods=10).mean()
+            result = cu.apply_moving_average(ts, window=30, center=center, min_periods=10)
+            pd.testing.assert_series_equal(result, expected)
+        
     def test_calculate_trend(self):
         """트렌드 계산 함수 테스트"""
         # 트렌드가 있는 시계열 생성
@@ -167,6 +250,36 @@ class TestCopernicusUtils(unittest.TestCase):
         # 트렌드가 양수인지 확인 (상승 트렌드)
         self.assertGreater(trend['slope'], 0)
         
+        # scipy linregress / np.polyfit 결과와 일치
+        x = np.arange(100)
+        expected = stats.linregress(x, ts.values)
+        self.assertAlmostEqual(trend['slope'], expected.slope)
+        self.assertAlmostEqual(trend['intercept'], expected.intercept)
+        self.assertAlmostEqual(trend['p_value'], expected.pvalue)
+        self.assertAlmostEqual(trend['std_error'], expected.stderr)
+        
+        poly = cu.calculate_trend(ts, method='polynomial')
+        np.testing.assert_allclose(poly['coefficients'], np.polyfit(x, ts.values, 2), rtol=1e-8)
+
+    def test_calculate_trend_sen(self):
+        """Sen's slope 트렌드 테스트"""
+        y = np.arange(60) * 0.1 + np.random.randn(60) * 0.5
+        ts = pd.Series(y, index=pd.date_range('2020-01-01', periods=60, freq='D'))
+
+        trend = cu.calculate_trend(ts, method='sen')
+
+        # 이중 루프 결과와 동일한지 확인
+        expected = np.median([
+            (y[j] - y[i]) / (j - i) for i in range(60) for j in range(i + 1, 60)
+        ])
+        self.assertAlmostEqual(trend['slope'], expected)
+
+        # 행 단위 계산 경로도 동일한 결과
+        np.testing.assert_allclose(
+            np.sort(cu._pairwise_slopes(y, max_pairs=0)),
+            np.sort(cu._pairwise_slopes(y))
+        )
+
     def test_calculate_correlation(self):
         """상관관계 계산 함수 테스트"""
         # 두 시계열 생성 (서로 상관관계가 있도록)
@@ -183,6 +296,31 @@ class TestCopernicusUtils(unittest.TestCase):
         self.assertGreater(corr, 0.7)
         self.assertLess(pval, 0.05)  # 유의미한 상관관계
         
+        # 결측이 있어도 scipy pearsonr과 같은 결과
+        ts2[[3, 50]] = np.nan
+        corr, pval = cu.calculate_correlation(ts1, ts2, lag=2)
+        shifted = ts2.shift(2)
+        valid = ts1.notna() & shifted.notna()
+        expected = stats.pearsonr(ts1[valid], shifted[valid])
+        self.assertAlmostEqual(corr, expected[0])
+        self.assertAlmostEqual(pval, expected[1])
+        
+    def test_apply_filter(self):
+        """필터링 함수 테스트"""
+        t = np.arange(1000)
+        slow = np.sin(2 * np.pi * t / 200)
+        data = slow + 0.5 * np.sin(2 * np.pi * t / 4)
+        data[[10, 500]] = np.nan
+        ts = pd.Series(data, index=pd.date_range('2020-01-01', periods=1000, freq='D'))
+
+        # 고차 필터도 안정적으로 고주파 성분 제거
+        filtered = cu.apply_filter(ts, filter_type='lowpass', cutoff_freq=0.05, order=8)
+
+        self.assertTrue(np.isnan(filtered.iloc[[10, 500]]).all())
+        valid = ~np.isnan(data)
+        valid[:50] = valid[-50:] = False
+        self.assertLess(np.abs(filtered.values[valid] - slow[valid]).max(), 0.1)
+
     def test_detect_extremes(self):
         """극값 탐지 함수 테스트"""
         # 극값이 포함된 시계열 생성
@@ -203,6 +341,46 @@ class TestCopernicusUtils(unittest.TestCase):
         for col in expected_columns:
             self.assertIn(col, extremes.columns)
             
+    def test_detect_extremes_grid(self):
+        """격자 극값 탐지 함수 테스트 (격자점별 1D 결과와 일치)"""
+        data = self.ds['sst'].isel(latitude=slice(0, 3), longitude=slice(0, 4))
+        result = cu.detect_extremes_grid(data, threshold_value=90, duration=3)
+        
+        self.assertEqual(dict(result.sizes), {'latitude': 3, 'longitude': 4})
+        for i in range(3):
+            for j in range(4):
+                events = cu.detect_extremes(data[:, i, j], threshold_value=90, duration=3)
+                self.assertEqual(int(result['n_events'][i, j]), len(events))
+                self.assertEqual(int(result['total_duration'][i, j]), events['duration'].sum())
+                self.assertAlmostEqual(float(result['sum_excess'][i, j]), events['sum_excess'].sum())
+        
+    def test_merge_datasets(self):
+        """데이터셋 병합 함수 테스트"""
+        parts = [
+            self.ds.isel(time=slice(0, 150)),
+            self.ds.isel(time=slice(100, 250)),
+            self.ds.isel(time=slice(250, None))
+        ]
+
+        merged = cu.merge_datasets(parts, dim='time')
+
+        # 중복 시간이 제거되고 정렬되었는지 확인
+        xr.testing.assert_identical(merged, self.ds)
+
+    def test_merge_datasets_spatial(self):
+        """공간으로 나뉜 데이터셋 병합 테스트 (값 손실 없음)"""
+        ds = self.ds.isel(time=slice(0, 10))
+        half = ds.sizes['longitude'] // 2
+        parts = [
+            ds.isel(longitude=slice(0, half)),
+            ds.isel(longitude=slice(half, None))
+        ]
+
+        merged = cu.merge_datasets(parts, dim='longitude')
+
+        self.assertEqual(int(merged['sst'].isnull().sum()), 0)
+        xr.testing.assert_allclose(merged, ds)
+
     def test_quality_check(self):
         """데이터 품질 검사 함수 테스트"""
         qc = cu.quality_check(self.ds, 'sst', valid_range=(-2, 35), min_coverage=0.8)
@@ -216,6 +394,26 @@ class TestCopernicusUtils(unittest.TestCase):
         self.assertTrue(qc['quality_pass'])
         self.assertGreaterEqual(qc['coverage'], 0.99)
         
+        # 통계값이 NumPy nan 함수 결과와 일치하는지 확인
+        ds = self.ds.copy(deep=True)
+        ds['sst'][0, :5, :5] = np.nan
+        qc = cu.quality_check(ds, 'sst', valid_range=(20, 25))
+        values = ds['sst'].values
+        self.assertEqual(qc['missing_count'], 25)
+        self.assertAlmostEqual(qc['mean'], np.nanmean(values))
+        self.assertAlmostEqual(qc['std'], np.nanstd(values))
+        self.assertEqual(qc['min'], np.nanmin(values))
+        self.assertEqual(qc['out_of_range_count'],
+                         int(np.sum((values < 20) | (values > 25))))
+        
+        # 연속 결측 구간 (끝에 걸친 구간 포함)
+        ds['sst'][10:20] = np.nan
+        ds['sst'][-8:] = np.nan
+        qc = cu.quality_check(ds, 'sst', max_gap=5)
+        n_time = ds.sizes['time']
+        self.assertEqual(qc['long_gaps'], [(10, 20, 10), (n_time - 8, n_time, 8)])
+        self.assertEqual(qc['max_gap_length'], 10)
+        
     def test_export_to_csv(self):
         """CSV 내보내기 함수 테스트"""
         with tempfile.NamedTemporaryFile(suffix='.csv', delete=False) as tmp:
@@ -238,6 +436,20 @@ class TestCopernicusUtils(unittest.TestCase):
             if os.path.exists(tmp_path):
                 os.remove(tmp_path)
                 
+    def test_export_to_csv_redirect(self):
+        """행 수 초과 시 형식 전환 테스트 (Zarr/Parquet 미설치 시 gzip CSV)"""
+        ts = cu.create_timeseries(self.ds, 'sst', spatial_mean=True)
+        
+        with tempfile.TemporaryDirectory() as tmp_dir, \
+             patch.object(cu, '_HAS_ZARR', False), patch.object(cu, '_HAS_PARQUET', False):
+            grid = self.ds['sst'].isel(time=slice(0, 5))
+            for data, nrows in ((ts, len(ts)), (grid, grid.size)):
+                with self.assertWarns(cu.ExportFormatWarning):
+                    path = cu.export_to_csv(data, os.path.join(tmp_dir, 'out.csv'), max_csv_rows=10)
+                    
+                self.assertTrue(path.endswith('out.csv.gz'))
+                self.assertEqual(len(pd.read_csv(path)), nrows)
+                
     def test_list_variables(self):
         """변수 목록 함수 테스트"""
         var_info = cu.list_variables(self.ds)